@@ -0,0 +1,159 @@
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from datas import converter_data_para_ordinal
+
+# Análises de ocupação e receita (taxa de ocupação, ADR e RevPAR) calculadas com NumPy
+# sobre uma cópia colunar das reservas. Este módulo não depende da interface: recebe o
+# gerenciador (ou os quartos e estadias) e trabalha apenas com arrays.
+
+# Reservas com estes status não ocupam o quarto
+STATUS_SEM_OCUPACAO = ("Cancelada",)
+AGRUPAMENTOS = ("dia", "mes")
+_EPOCA = date(1970, 1, 1).toordinal()
+
+
+class ReservasColunares:
+    """Cópia das reservas em arrays NumPy (uma posição por reserva), para análises em lote
+    
+    Colunas: quarto, check_in e check_out (ordinais do dia), status (código em
+    status_nomes), tipo (código em tipos) e preco da diária. O preço é o do quarto no
+    momento da cópia, já que a reserva não guarda o valor cobrado.
+    """
+    
+    def __init__(self, quartos: Iterable[Any], estadias: Iterable[Tuple[int, Optional[int], Optional[int], str]]):
+        quartos = list(quartos)
+        self.tipos: List[str] = sorted({quarto.tipo for quarto in quartos})
+        codigos_tipos = {tipo: codigo for codigo, tipo in enumerate(self.tipos)}
+        # Inventário: tipo de cada quarto cadastrado
+        self.tipos_quartos = np.array([codigos_tipos[q.tipo] for q in quartos], dtype=np.int16)
+        quartos_por_numero = {q.numero: (codigos_tipos[q.tipo], q.preco) for q in quartos}
+        
+        self.status_nomes: List[str] = []
+        codigos_status: Dict[str, int] = {}
+        colunas: Tuple[List[Any], ...] = ([], [], [], [], [], [])
+        quarto_col, check_in_col, check_out_col, status_col, tipo_col, preco_col = colunas
+        for quarto_numero, inicio, fim, status in estadias:
+            # Reservas sem datas válidas ou de quartos excluídos ficam fora da análise
+            dados_quarto = quartos_por_numero.get(quarto_numero)
+            if dados_quarto is None or inicio is None or fim is None or fim <= inicio:
+                continue
+            codigo = codigos_status.get(status)
+            if codigo is None:
+                codigo = codigos_status[status] = len(self.status_nomes)
+                self.status_nomes.append(status)
+            quarto_col.append(quarto_numero)
+            check_in_col.append(inicio)
+            check_out_col.append(fim)
+            status_col.append(codigo)
+            tipo_col.append(dados_quarto[0])
+            preco_col.append(dados_quarto[1])
+        
+        self.quarto = np.array(quarto_col, dtype=np.int32)
+        self.check_in = np.array(check_in_col, dtype=np.int32)
+        self.check_out = np.array(check_out_col, dtype=np.int32)
+        self.status = np.array(status_col, dtype=np.int8)
+        self.tipo = np.array(tipo_col, dtype=np.int16)
+        self.preco = np.array(preco_col, dtype=np.float64)
+    
+    @classmethod
+    def do_gerenciador(cls, gerenciador: Any) -> 'ReservasColunares':
+        """Monta a cópia a partir de um GerenciadorDeReservas (sem materializar as reservas encerradas)"""
+        return cls(gerenciador.listar_quartos(), gerenciador.percorrer_estadias())
+    
+    def __len__(self) -> int:
+        return len(self.quarto)
+    
+    def ocupantes(self) -> np.ndarray:
+        """Máscara das reservas que ocupam o quarto (todas exceto as canceladas)"""
+        sem_ocupacao = [c for c, nome in enumerate(self.status_nomes) if nome in STATUS_SEM_OCUPACAO]
+        return ~np.isin(self.status, sem_ocupacao)
+
+
+def _converter_dia(data: Union[str, date, int]) -> int:
+    if isinstance(data, date):
+        return data.toordinal()
+    if isinstance(data, int):
+        return data
+    dia = converter_data_para_ordinal(data)
+    if dia is None:
+        raise ValueError(f"Data inválida: {data}")
+    return dia
+
+
+def _indicadores(disponiveis: np.ndarray, vendidos: np.ndarray, receita: np.ndarray) -> Dict[str, np.ndarray]:
+    # Divisões por zero (período sem quartos ou sem vendas) resultam em 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ocupacao = np.where(disponiveis > 0, vendidos / disponiveis, 0.0)
+        adr = np.where(vendidos > 0, receita / vendidos, 0.0)
+        revpar = np.where(disponiveis > 0, receita / disponiveis, 0.0)
+    return {
+        "quartos_disponiveis": disponiveis,
+        "quartos_vendidos": vendidos,
+        "receita": receita,
+        "ocupacao": ocupacao,
+        "adr": adr,
+        "revpar": revpar
+    }
+
+
+def calcular_metricas(colunas: ReservasColunares, inicio: Union[str, date, int], fim: Union[str, date, int],
+                      agrupar: str = "dia") -> Dict[str, Any]:
+    """Calcula ocupação, ADR e RevPAR das noites de inicio (inclusive) até fim (exclusive)
+    
+    Retorna os rótulos dos períodos ("periodos", DD-MM-YYYY ou MM-YYYY), os indicadores
+    do hotel ("total") e os de cada tipo de quarto ("por_tipo"), um array por indicador
+    com uma posição por período.
+    """
+    if agrupar not in AGRUPAMENTOS:
+        raise ValueError(f"Agrupamento inválido: {agrupar}")
+    dia_inicial, dia_final = _converter_dia(inicio), _converter_dia(fim)
+    if dia_final <= dia_inicial:
+        raise ValueError("A data final deve ser posterior à data inicial")
+    total_dias = dia_final - dia_inicial
+    total_tipos = len(colunas.tipos)
+    
+    # Reservas ocupantes que têm ao menos uma noite no período, recortadas nos limites
+    selecao = colunas.ocupantes() & (colunas.check_in < dia_final) & (colunas.check_out > dia_inicial)
+    entradas = np.maximum(colunas.check_in[selecao], dia_inicial) - dia_inicial
+    saidas = np.minimum(colunas.check_out[selecao], dia_final) - dia_inicial
+    tipos = colunas.tipo[selecao].astype(np.int64)
+    precos = colunas.preco[selecao]
+    
+    # Cada estadia soma +1 (e +preço) no dia de entrada e -1 no dia de saída; a soma
+    # acumulada dá os quartos vendidos e a receita de cada dia, sem expandir as noites
+    largura = total_dias + 1
+    tamanho = total_tipos * largura
+    posicoes_entrada = tipos * largura + entradas
+    posicoes_saida = tipos * largura + saidas
+    vendidos = (np.bincount(posicoes_entrada, minlength=tamanho)
+                - np.bincount(posicoes_saida, minlength=tamanho))
+    receita = (np.bincount(posicoes_entrada, weights=precos, minlength=tamanho)
+               - np.bincount(posicoes_saida, weights=precos, minlength=tamanho))
+    vendidos = np.cumsum(vendidos.reshape(total_tipos, largura), axis=1)[:, :total_dias]
+    receita = np.cumsum(receita.reshape(total_tipos, largura), axis=1)[:, :total_dias]
+    quartos_por_tipo = np.bincount(colunas.tipos_quartos, minlength=total_tipos)
+    disponiveis = np.repeat(quartos_por_tipo[:, None], total_dias, axis=1)
+    
+    dias = np.arange(dia_inicial - _EPOCA, dia_final - _EPOCA).astype("datetime64[D]")
+    if agrupar == "mes":
+        # Os dias de um mês são contíguos: soma cada bloco a partir do primeiro dia do mês
+        meses = dias.astype("datetime64[M]")
+        inicios_meses = np.flatnonzero(np.r_[True, meses[1:] != meses[:-1]])
+        vendidos = np.add.reduceat(vendidos, inicios_meses, axis=1)
+        receita = np.add.reduceat(receita, inicios_meses, axis=1)
+        disponiveis = np.add.reduceat(disponiveis, inicios_meses, axis=1)
+        periodos = [f"{m.month:02d}-{m.year}" for m in meses[inicios_meses].tolist()]
+    else:
+        periodos = [d.strftime("%d-%m-%Y") for d in dias.tolist()]
+    
+    return {
+        "periodos": periodos,
+        "total": _indicadores(disponiveis.sum(axis=0), vendidos.sum(axis=0), receita.sum(axis=0)),
+        "por_tipo": {
+            tipo: _indicadores(disponiveis[codigo], vendidos[codigo], receita[codigo])
+            for codigo, tipo in enumerate(colunas.tipos)
+        }
+    }
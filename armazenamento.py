@@ -0,0 +1,481 @@
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import List, Dict, Optional, Any, Iterator, Tuple
+
+from metricas import METRICAS
+
+# Camada de armazenamento do GerenciadorDeReservas.
+# Os armazenamentos trabalham apenas com os dicionários de to_dict/from_dict,
+# e cada alteração chega como um registro (operação, tipo, dados):
+#   ("salvar", "cliente" | "quarto" | "reserva", <dicionário da entidade>)
+#   ("remover", "cliente" | "quarto", <id do cliente ou número do quarto>)
+# A remoção de um cliente ou quarto remove também as suas reservas.
+
+logger = logging.getLogger("hotel.armazenamento")
+
+
+class LeitorJSONIncremental:
+    """Percorre um arquivo {"secao": [itens], ...} item a item, sem carregar o documento inteiro"""
+    
+    TAMANHO_BLOCO = 64 * 1024
+    ESPACOS = re.compile(r"[ \t\r\n]*")
+    # Resto de texto que ainda pode fazer parte de um número ("12" + "3", "1" + "e5", "3" + ".5")
+    CONTINUACAO_NUMERO = re.compile(r"[0-9.eE+-]*\Z")
+    
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+        self._decodificador = json.JSONDecoder()
+        self._texto = ""
+        self._posicao = 0
+        self._fim_do_arquivo = False
+    
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        self._esperar("{")
+        if self._proximo_caractere() == "}":
+            return
+        while True:
+            secao = self._ler_valor()
+            self._esperar(":")
+            if self._proximo_caractere() == "[":
+                self._posicao += 1
+                if self._proximo_caractere() == "]":
+                    self._posicao += 1
+                else:
+                    while True:
+                        yield secao, self._ler_valor()
+                        if self._esperar(",", "]") == "]":
+                            break
+            else:
+                # Valores que não são listas não fazem parte dos dados do hotel
+                self._ler_valor()
+            if self._esperar(",", "}") == "}":
+                return
+    
+    def _ler_bloco(self) -> bool:
+        if self._fim_do_arquivo:
+            return False
+        bloco = self._arquivo.read(self.TAMANHO_BLOCO)
+        if not bloco:
+            self._fim_do_arquivo = True
+            return False
+        # Descartar o texto já consumido antes de acrescentar o novo bloco
+        self._texto = self._texto[self._posicao:] + bloco
+        self._posicao = 0
+        return True
+    
+    def _proximo_caractere(self) -> str:
+        while True:
+            self._posicao = self.ESPACOS.match(self._texto, self._posicao).end()
+            if self._posicao < len(self._texto):
+                return self._texto[self._posicao]
+            if not self._ler_bloco():
+                raise ValueError("Fim inesperado do arquivo de dados")
+    
+    def _esperar(self, *esperados: str) -> str:
+        caractere = self._proximo_caractere()
+        if caractere not in esperados:
+            raise ValueError(f"Caractere inesperado no arquivo de dados: {caractere!r}")
+        self._posicao += 1
+        return caractere
+    
+    def _ler_valor(self) -> Any:
+        self._proximo_caractere()
+        while True:
+            try:
+                valor, fim = self._decodificador.raw_decode(self._texto, self._posicao)
+            except json.JSONDecodeError:
+                # O valor pode estar dividido entre dois blocos
+                if not self._ler_bloco():
+                    raise
+                continue
+            # Um número no fim do texto pode continuar no próximo bloco
+            if self.CONTINUACAO_NUMERO.match(self._texto, fim) and self._ler_bloco():
+                continue
+            self._posicao = fim
+            return valor
+
+
+class Armazenamento:
+    """Interface comum dos armazenamentos de dados do hotel"""
+    
+    # Indica se o gerenciador deve gravar um snapshot completo (salvar_tudo)
+    precisa_compactar = False
+    
+    def carregar(self) -> Optional[Iterator[Tuple[str, Dict[str, Any]]]]:
+        """Percorre os dados gravados como pares (seção, item), ou retorna None se não existirem
+        
+        As seções são "clientes", "quartos" e "reservas", nessa ordem.
+        """
+        raise NotImplementedError
+    
+    def registros_pendentes(self) -> Iterator[Dict[str, Any]]:
+        """Registros gravados após os dados retornados por carregar(), a serem reaplicados"""
+        return iter(())
+    
+    def registrar(self, operacao: str, tipo: str, dados: Any) -> None:
+        raise NotImplementedError
+    
+    def registrar_lote(self, registros: List[Tuple[str, str, Any]]) -> None:
+        for operacao, tipo, dados in registros:
+            self.registrar(operacao, tipo, dados)
+    
+    def salvar_tudo(self, dados: Dict[str, List[Dict[str, Any]]]) -> None:
+        raise NotImplementedError
+    
+    def fechar(self) -> None:
+        pass
+
+
+class ArmazenamentoJSON(Armazenamento):
+    """Snapshot em arquivo JSON, com journal opcional de alterações (uma linha por registro)"""
+    
+    # Tamanho mínimo do journal (em bytes) antes de compactá-lo em um novo snapshot
+    TAMANHO_MINIMO_COMPACTACAO = 64 * 1024
+    
+    def __init__(self, arquivo_dados: str = "dados_hotel.json", usar_journal: bool = True):
+        self._arquivo_dados = arquivo_dados
+        # No modo journal cada alteração é acrescentada ao arquivo de journal, e o
+        # arquivo de dados completo só é regravado na compactação
+        self._usar_journal = usar_journal
+        self._arquivo_journal = arquivo_dados + ".journal"
+        self._tamanho_journal = 0
+        self._tamanho_snapshot = 0
+        self.precisa_compactar = False
+    
+    def carregar(self) -> Optional[Iterator[Tuple[str, Dict[str, Any]]]]:
+        if not os.path.exists(self._arquivo_dados):
+            return None
+        
+        self._tamanho_snapshot = os.path.getsize(self._arquivo_dados)
+        return self._ler_snapshot()
+    
+    def _ler_snapshot(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with open(self._arquivo_dados, "r") as arquivo:
+            yield from LeitorJSONIncremental(arquivo)
+    
+    def registros_pendentes(self) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(self._arquivo_journal):
+            return
+        
+        with open(self._arquivo_journal, "r") as arquivo:
+            for linha in arquivo:
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    # Registro incompleto (gravação interrompida): descartar o restante.
+                    # Novos registros não podem ser acrescentados após uma linha incompleta
+                    logger.warning("Registro incompleto no journal %s; ignorando o restante", self._arquivo_journal)
+                    self.precisa_compactar = True
+                    return
+                self._tamanho_journal += len(linha)
+                yield registro
+    
+    def registrar(self, operacao: str, tipo: str, dados: Any) -> None:
+        self.registrar_lote([(operacao, tipo, dados)])
+    
+    def registrar_lote(self, registros: List[Tuple[str, str, Any]]) -> None:
+        if not self._usar_journal:
+            self.precisa_compactar = True
+            return
+        
+        # Um registro compacto por linha, acrescentado ao final do journal
+        linhas = "".join(
+            json.dumps({"op": operacao, "tipo": tipo, "dados": dados}, separators=(",", ":")) + "\n"
+            for operacao, tipo, dados in registros
+        )
+        inicio = time.perf_counter()
+        try:
+            with open(self._arquivo_journal, "a") as arquivo:
+                arquivo.write(linhas)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            self._tamanho_journal += len(linhas)
+        except Exception as e:
+            logger.error("Erro ao gravar journal %s: %s", self._arquivo_journal, e)
+            self.precisa_compactar = True
+            return
+        METRICAS.registrar_gravacao("journal", time.perf_counter() - inicio, len(linhas.encode("utf-8")))
+        
+        # Compactar quando o journal ultrapassar o tamanho do snapshot, mantendo
+        # o custo amortizado de cada operação constante
+        if self._tamanho_journal > max(self._tamanho_snapshot, self.TAMANHO_MINIMO_COMPACTACAO):
+            self.precisa_compactar = True
+    
+    def salvar_tudo(self, dados: Dict[str, List[Dict[str, Any]]]) -> None:
+        inicio = time.perf_counter()
+        try:
+            # Gravar em arquivo temporário e substituir, para não corromper os dados
+            # caso a gravação seja interrompida
+            arquivo_temporario = self._arquivo_dados + ".tmp"
+            with open(arquivo_temporario, "w") as arquivo:
+                json.dump(dados, arquivo, indent=4)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            os.replace(arquivo_temporario, self._arquivo_dados)
+            self._tamanho_snapshot = os.path.getsize(self._arquivo_dados)
+            
+            # O snapshot já contém todas as operações do journal
+            if os.path.exists(self._arquivo_journal):
+                os.remove(self._arquivo_journal)
+            self._tamanho_journal = 0
+            self.precisa_compactar = False
+            METRICAS.registrar_gravacao("snapshot", time.perf_counter() - inicio, self._tamanho_snapshot)
+            logger.info("Dados salvos em %s (%d bytes)", self._arquivo_dados, self._tamanho_snapshot)
+        except Exception as e:
+            logger.error("Erro ao salvar dados em %s: %s", self._arquivo_dados, e)
+
+
+class ArmazenamentoSQLite(Armazenamento):
+    """Banco SQLite com uma tabela por entidade; cada registro é gravado como uma linha
+    
+    É apenas outro formato de gravação: como no JSON, o gerenciador carrega todos os dados
+    na memória e responde às consultas pelos seus próprios índices.
+    """
+    
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS clientes (
+            id TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            telefone TEXT NOT NULL,
+            email TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS quartos (
+            numero INTEGER NOT NULL UNIQUE,
+            tipo TEXT NOT NULL,
+            preco REAL NOT NULL,
+            disponivel INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS reservas (
+            id TEXT PRIMARY KEY,
+            cliente_id TEXT NOT NULL,
+            quarto_numero INTEGER NOT NULL,
+            check_in TEXT NOT NULL,
+            check_out TEXT NOT NULL,
+            status TEXT NOT NULL
+        );
+        -- Só para as exclusões em cascata; as consultas são respondidas pelos índices em memória
+        CREATE INDEX IF NOT EXISTS idx_reservas_quarto ON reservas (quarto_numero);
+        CREATE INDEX IF NOT EXISTS idx_reservas_cliente ON reservas (cliente_id);
+        -- Índices de consultas por período de versões anteriores, que não são mais usados
+        DROP INDEX IF EXISTS idx_reservas_quarto_datas;
+        DROP INDEX IF EXISTS idx_reservas_status;
+    """
+    
+    def __init__(self, arquivo_banco: str = "dados_hotel.db"):
+        # sqlite3 é importado só por quem usa o banco (o armazenamento padrão é o JSON)
+        import sqlite3
+        self._arquivo_banco = arquivo_banco
+        self.precisa_compactar = False
+        # A conexão pode ser usada pela thread de gravação em segundo plano
+        self._trava = threading.Lock()
+        self._conexao = sqlite3.connect(arquivo_banco, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(self.ESQUEMA)
+    
+    def carregar(self) -> Optional[Iterator[Tuple[str, Dict[str, Any]]]]:
+        # user_version marca que o banco já recebeu os dados iniciais
+        with self._trava:
+            if self._conexao.execute("PRAGMA user_version").fetchone()[0] == 0:
+                return None
+        return self._ler_tabelas()
+    
+    def _ler_tabelas(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        # As linhas são lidas do cursor aos poucos; a ordem de inserção é
+        # preservada pelo rowid, que o upsert mantém
+        with self._trava:
+            consulta = self._conexao.execute
+            for id, nome, telefone, email in consulta(
+                    "SELECT id, nome, telefone, email FROM clientes ORDER BY rowid"):
+                yield "clientes", {"nome": nome, "telefone": telefone, "email": email, "id": id}
+            for numero, tipo, preco, disponivel in consulta(
+                    "SELECT numero, tipo, preco, disponivel FROM quartos ORDER BY rowid"):
+                yield "quartos", {"numero": numero, "tipo": tipo, "preco": preco, "disponivel": bool(disponivel)}
+            for id, cliente_id, quarto_numero, check_in, check_out, status in consulta(
+                    "SELECT id, cliente_id, quarto_numero, check_in, check_out, status "
+                    "FROM reservas ORDER BY rowid"):
+                yield "reservas", {"cliente_id": cliente_id, "quarto_numero": quarto_numero,
+                                   "check_in": check_in, "check_out": check_out,
+                                   "status": status, "id": id}
+    
+    def registrar(self, operacao: str, tipo: str, dados: Any) -> None:
+        self.registrar_lote([(operacao, tipo, dados)])
+    
+    def registrar_lote(self, registros: List[Tuple[str, str, Any]]) -> None:
+        import sqlite3
+        inicio = time.perf_counter()
+        try:
+            # Todos os registros são gravados em uma única transação do banco
+            with self._trava, self._conexao:
+                for operacao, tipo, dados in registros:
+                    self._executar(operacao, tipo, dados)
+        except sqlite3.Error as e:
+            logger.error("Erro ao gravar no banco %s: %s", self._arquivo_banco, e)
+            # A transação foi desfeita: só um snapshot completo recupera as alterações perdidas
+            self.precisa_compactar = True
+            return
+        METRICAS.registrar_gravacao("sqlite", time.perf_counter() - inicio)
+    
+    def salvar_tudo(self, dados: Dict[str, List[Dict[str, Any]]]) -> None:
+        import sqlite3
+        inicio = time.perf_counter()
+        try:
+            with self._trava, self._conexao:
+                self._conexao.execute("DELETE FROM reservas")
+                self._conexao.execute("DELETE FROM quartos")
+                self._conexao.execute("DELETE FROM clientes")
+                for tipo, chave in (("cliente", "clientes"), ("quarto", "quartos"), ("reserva", "reservas")):
+                    for item in dados.get(chave, []):
+                        self._executar("salvar", tipo, item)
+                self._conexao.execute("PRAGMA user_version = 1")
+            self.precisa_compactar = False
+            METRICAS.registrar_gravacao("sqlite_completo", time.perf_counter() - inicio)
+            logger.info("Dados salvos em %s", self._arquivo_banco)
+        except sqlite3.Error as e:
+            logger.error("Erro ao salvar dados em %s: %s", self._arquivo_banco, e)
+    
+    def fechar(self) -> None:
+        with self._trava:
+            self._conexao.close()
+    
+    def _executar(self, operacao: str, tipo: str, dados: Any) -> None:
+        executar = self._conexao.execute
+        if operacao == "remover":
+            if tipo == "cliente":
+                executar("DELETE FROM reservas WHERE cliente_id = ?", (dados,))
+                executar("DELETE FROM clientes WHERE id = ?", (dados,))
+            elif tipo == "quarto":
+                executar("DELETE FROM reservas WHERE quarto_numero = ?", (dados,))
+                executar("DELETE FROM quartos WHERE numero = ?", (dados,))
+        elif tipo == "cliente":
+            executar(
+                "INSERT INTO clientes (id, nome, telefone, email) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET nome = excluded.nome, "
+                "telefone = excluded.telefone, email = excluded.email",
+                (dados["id"], dados["nome"], dados["telefone"], dados["email"])
+            )
+        elif tipo == "quarto":
+            executar(
+                "INSERT INTO quartos (numero, tipo, preco, disponivel) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (numero) DO UPDATE SET tipo = excluded.tipo, "
+                "preco = excluded.preco, disponivel = excluded.disponivel",
+                (dados["numero"], dados["tipo"], dados["preco"], int(dados["disponivel"]))
+            )
+        elif tipo == "reserva":
+            executar(
+                "INSERT INTO reservas (id, cliente_id, quarto_numero, check_in, check_out, status) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET check_in = excluded.check_in, "
+                "check_out = excluded.check_out, status = excluded.status",
+                (dados["id"], dados["cliente_id"], dados["quarto_numero"], dados["check_in"],
+                 dados["check_out"], dados["status"])
+            )
+
+
+def abrir_armazenamento(arquivo_dados: str, usar_journal: bool = True) -> Armazenamento:
+    """Armazenamento adequado ao arquivo: banco SQLite (.db, .sqlite) ou JSON com journal"""
+    if os.path.splitext(arquivo_dados)[1].lower() in (".db", ".sqlite", ".sqlite3"):
+        return ArmazenamentoSQLite(arquivo_dados)
+    return ArmazenamentoJSON(arquivo_dados, usar_journal)
+
+
+class ArmazenamentoEmSegundoPlano(Armazenamento):
+    """Repassa as gravações para outro armazenamento em uma thread separada (write-behind)"""
+    
+    # Tempo de espera (em segundos) para acumular alterações antes de gravá-las juntas
+    INTERVALO_AGRUPAMENTO = 0.2
+    
+    def __init__(self, armazenamento: Armazenamento):
+        self._armazenamento = armazenamento
+        # Fila de tarefas pendentes: ("registros", [registros]) ou ("snapshot", dados)
+        self._fila: List[Tuple[str, Any]] = []
+        self._snapshot_pendente = False
+        self._condicao = threading.Condition()
+        self._encerrando = False
+        self._ocupado = False
+        self._thread = threading.Thread(target=self._executar, name="gravacao-dados", daemon=True)
+        self._thread.start()
+        # Garantir que nada fique na fila quando o processo terminar
+        atexit.register(self.fechar)
+    
+    @property
+    def precisa_compactar(self) -> bool:
+        return self._armazenamento.precisa_compactar and not self._snapshot_pendente
+    
+    def carregar(self) -> Optional[Iterator[Tuple[str, Dict[str, Any]]]]:
+        return self._armazenamento.carregar()
+    
+    def registros_pendentes(self) -> Iterator[Dict[str, Any]]:
+        return self._armazenamento.registros_pendentes()
+    
+    def registrar(self, operacao: str, tipo: str, dados: Any) -> None:
+        self.registrar_lote([(operacao, tipo, dados)])
+    
+    def registrar_lote(self, registros: List[Tuple[str, str, Any]]) -> None:
+        with self._condicao:
+            self._verificar_aberto()
+            if self._fila and self._fila[-1][0] == "registros":
+                self._fila[-1][1].extend(registros)
+            else:
+                self._fila.append(("registros", list(registros)))
+            self._condicao.notify_all()
+    
+    def salvar_tudo(self, dados: Dict[str, List[Dict[str, Any]]]) -> None:
+        with self._condicao:
+            self._verificar_aberto()
+            # O snapshot já inclui todos os registros anteriores ainda na fila
+            self._fila = [("snapshot", dados)]
+            self._snapshot_pendente = True
+            self._condicao.notify_all()
+    
+    def _verificar_aberto(self) -> None:
+        # Depois de fechar() a thread de gravação já terminou: nada mais seria gravado
+        if self._encerrando:
+            raise RuntimeError("O armazenamento já foi fechado; a alteração não será gravada")
+    
+    def aguardar_gravacao(self) -> None:
+        """Bloqueia até que todas as alterações enfileiradas tenham sido gravadas"""
+        with self._condicao:
+            while self._fila or self._ocupado:
+                self._condicao.wait()
+    
+    def fechar(self) -> None:
+        with self._condicao:
+            if self._encerrando:
+                return
+            self._encerrando = True
+            self._condicao.notify_all()
+        self._thread.join()
+        self._armazenamento.fechar()
+        atexit.unregister(self.fechar)
+    
+    def _executar(self) -> None:
+        while True:
+            with self._condicao:
+                while not self._fila and not self._encerrando:
+                    self._condicao.wait()
+                if not self._fila:
+                    return
+                # Agrupar as alterações que chegarem em sequência rápida
+                limite = time.monotonic() + self.INTERVALO_AGRUPAMENTO
+                while not self._encerrando and time.monotonic() < limite:
+                    self._condicao.wait(limite - time.monotonic())
+                tarefas, self._fila = self._fila, []
+                self._ocupado = True
+            
+            for tarefa, conteudo in tarefas:
+                if tarefa == "snapshot":
+                    self._armazenamento.salvar_tudo(conteudo)
+                else:
+                    self._armazenamento.registrar_lote(conteudo)
+            
+            with self._condicao:
+                if not any(tarefa == "snapshot" for tarefa, _ in self._fila):
+                    self._snapshot_pendente = False
+                self._ocupado = False
+                self._condicao.notify_all()
@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+# Fachada asyncio sobre o GerenciadorDeReservas, para handlers async do Flet (e outros
+# serviços asyncio): cada chamada roda num executor, e o loop de eventos continua livre
+# para atender as outras sessões enquanto a operação espera trava, disco ou varreduras.
+
+
+class GerenciadorAssincrono:
+    """Versões async das operações do gerenciador, executadas em threads do `executor`
+    
+    Sem executor, é usado o executor padrão do loop. O gerenciador já controla o acesso
+    concorrente (trava de leitura/escrita), então várias chamadas podem estar em andamento.
+    """
+    
+    def __init__(self, gerenciador: Any, executor: Optional[Executor] = None):
+        self.gerenciador = gerenciador
+        self._executor = executor
+    
+    async def executar(self, funcao: Callable[..., Any], *args, **kwargs) -> Any:
+        """Executa qualquer função (bloqueante) no executor e devolve seu resultado"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(funcao, *args, **kwargs))
+    
+    # Clientes
+    async def adicionar_cliente(self, cliente: Any) -> None:
+        await self.executar(self.gerenciador.adicionar_cliente, cliente)
+    
+    async def atualizar_cliente(self, cliente_id: str, nome: str, telefone: str, email: str) -> bool:
+        return await self.executar(self.gerenciador.atualizar_cliente, cliente_id, nome, telefone, email)
+    
+    async def remover_cliente(self, cliente_id: str) -> bool:
+        return await self.executar(self.gerenciador.remover_cliente, cliente_id)
+    
+    async def listar_clientes(self) -> List[Any]:
+        return await self.executar(self.gerenciador.listar_clientes)
+    
+    # Quartos
+    async def adicionar_quarto(self, quarto: Any) -> None:
+        await self.executar(self.gerenciador.adicionar_quarto, quarto)
+    
+    async def atualizar_quarto(self, numero: int, tipo: str, preco: float, disponivel: bool) -> bool:
+        return await self.executar(self.gerenciador.atualizar_quarto, numero, tipo, preco, disponivel)
+    
+    async def remover_quarto(self, numero: int) -> bool:
+        return await self.executar(self.gerenciador.remover_quarto, numero)
+    
+    async def listar_quartos(self) -> List[Any]:
+        return await self.executar(self.gerenciador.listar_quartos)
+    
+    async def listar_quartos_disponiveis(self, check_in: str = None, check_out: str = None) -> List[Any]:
+        return await self.executar(self.gerenciador.listar_quartos_disponiveis, check_in, check_out)
+    
+    async def buscar_quartos(self, check_in: str, noites: int, **filtros) -> List[Any]:
+        return await self.executar(self.gerenciador.buscar_quartos, check_in, noites, **filtros)
+    
+    # Reservas
+    async def criar_reserva(self, cliente_id: str, quarto_numero: int, check_in: str, check_out: str) -> Optional[Any]:
+        return await self.executar(self.gerenciador.criar_reserva, cliente_id, quarto_numero, check_in, check_out)
+    
+    async def atualizar_reserva(self, reserva_id: str, check_in: str, check_out: str, status: str) -> bool:
+        return await self.executar(self.gerenciador.atualizar_reserva, reserva_id, check_in, check_out, status)
+    
+    async def cancelar_reserva(self, reserva_id: str) -> bool:
+        return await self.executar(self.gerenciador.cancelar_reserva, reserva_id)
+    
+    async def listar_reservas(self) -> List[Any]:
+        return await self.executar(self.gerenciador.listar_reservas)
+    
+    async def listar_reservas_por_cliente(self, cliente_id: str) -> List[Any]:
+        return await self.executar(self.gerenciador.listar_reservas_por_cliente, cliente_id)
+    
+    async def listar_reservas_por_quarto(self, quarto_numero: int) -> List[Any]:
+        return await self.executar(self.gerenciador.listar_reservas_por_quarto, quarto_numero)
+    
+    # Outros
+    async def painel(self) -> Dict[str, int]:
+        return await self.executar(self.gerenciador.painel)
+    
+    async def importar_arquivo(self, caminho: str, tipo: str) -> Any:
+        return await self.executar(self.gerenciador.importar_arquivo, caminho, tipo)
+    
+    async def fechar(self) -> None:
+        await self.executar(self.gerenciador.fechar)
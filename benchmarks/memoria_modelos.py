@@ -0,0 +1,77 @@
+"""Mede a memória ocupada por Cliente, Quarto e Reserva em grandes volumes
+
+Uso: python benchmarks/memoria_modelos.py [--reservas 100000] [--clientes 5000] [--quartos 200]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dominio import Cliente, Quarto, Reserva
+
+
+def medir(descricao: str, quantidade: int, criar) -> list:
+    gc.collect()
+    tracemalloc.start()
+    objetos = criar()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{descricao:<10} {quantidade:>9} registros  {memoria / 1024 / 1024:8.1f} MiB  "
+          f"{memoria / quantidade:7.0f} bytes/registro")
+    return objetos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reservas", type=int, default=100_000)
+    parser.add_argument("--clientes", type=int, default=5_000)
+    parser.add_argument("--quartos", type=int, default=200)
+    args = parser.parse_args()
+    
+    random.seed(0)
+    
+    # As strings de entrada são criadas antes da medição, como se viessem do arquivo
+    # de dados; mede-se apenas o que os objetos do modelo acrescentam
+    ids_clientes = [str(uuid.uuid4()) for _ in range(args.clientes)]
+    ids_reservas = [str(uuid.uuid4()) for _ in range(args.reservas)]
+    inicio = date(2022, 1, 1)
+    datas = [(inicio + timedelta(days=i)).strftime("%d-%m-%Y") for i in range(3 * 365 + 10)]
+    
+    clientes = medir("Cliente", args.clientes, lambda: [
+        Cliente(f"Cliente {i}", "(11) 99999-0000", f"cliente{i}@email.com", ids_clientes[i])
+        for i in range(args.clientes)
+    ])
+    quartos = medir("Quarto", args.quartos, lambda: [
+        Quarto(100 + i, random.choice(Quarto.TIPOS), 150.0 + i)
+        for i in range(args.quartos)
+    ])
+    
+    def criar_reservas() -> list:
+        reservas = []
+        for i in range(args.reservas):
+            dia = random.randrange(len(datas) - 8)
+            reservas.append(Reserva(
+                random.choice(ids_clientes),
+                quartos[i % len(quartos)].numero,
+                # Cópias das strings, como as geradas pela leitura do JSON
+                "".join(datas[dia]),
+                "".join(datas[dia + random.randint(1, 7)]),
+                random.choice(Reserva.STATUS),
+                "".join(ids_reservas[i])
+            ))
+        return reservas
+    
+    reservas = medir("Reserva", args.reservas, criar_reservas)
+    print(f"Reserva (objeto isolado): {sys.getsizeof(reservas[0])} bytes, "
+          f"tem __dict__: {hasattr(reservas[0], '__dict__')}")
+    del clientes, reservas
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Mede o tempo de importação dos módulos de uso sem interface e confere o limite
+
+Uso: python benchmarks/tempo_importacao.py [--repeticoes 7] [--limite-ms N] [--detalhes]
+
+Cada módulo é importado num processo novo (python -X importtime), com o bytecode já em
+cache, e o tempo considerado é a mediana das repetições. O script termina com código 1
+se algum módulo passar do seu limite (ou de --limite-ms, quando informado) ou carregar a
+interface (flet) ou o NumPy.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos usados por scripts, tarefas agendadas e pelo servidor HTTP, com o limite de
+# cada um em milissegundos (o servidor depende do asyncio, que sozinho leva dezenas de ms)
+LIMITES_MS = {
+    "dominio": 50.0,
+    "main": 50.0,
+    "servidor_api": 150.0,
+}
+# Dependências pesadas que esses módulos não podem carregar
+PROIBIDOS = ("flet", "numpy")
+
+
+def importar(modulo: str, prefixo_cache: str) -> Tuple[int, List[Tuple[int, str]], List[str]]:
+    """Importa o módulo num processo novo: (tempo total em µs, imports diretos, proibidos carregados)"""
+    # O bytecode vai para um diretório temporário, mesmo com PYTHONDONTWRITEBYTECODE definido
+    ambiente = dict(os.environ)
+    ambiente.pop("PYTHONDONTWRITEBYTECODE", None)
+    codigo = f"import sys, {modulo}; print(','.join(m for m in {PROIBIDOS!r} if m in sys.modules))"
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-X", f"pycache_prefix={prefixo_cache}", "-c", codigo],
+        cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True
+    )
+    
+    # Linhas "import time: <próprio> | <acumulado> | <módulo>", com o nível indicado pela
+    # indentação; os imports de um módulo aparecem antes da linha dele
+    total, diretos, pendentes = 0, [], []
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        _, acumulado, nome = linha.split("|")
+        nivel = (len(nome) - len(nome.lstrip()) - 1) // 2
+        if nivel == 1:
+            pendentes.append((int(acumulado), nome.strip()))
+        elif nivel == 0:
+            if nome.strip() == modulo:
+                total, diretos = int(acumulado), pendentes
+            pendentes = []
+    proibidos = [m for m in resultado.stdout.strip().split(",") if m]
+    return total, diretos, proibidos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=7)
+    parser.add_argument("--limite-ms", type=float, help="mesmo limite para todos os módulos")
+    parser.add_argument("--detalhes", action="store_true", help="mostra os imports diretos mais lentos")
+    args = parser.parse_args()
+    
+    aprovado = True
+    with tempfile.TemporaryDirectory() as prefixo_cache:
+        for modulo, limite_ms in LIMITES_MS.items():
+            if args.limite_ms is not None:
+                limite_ms = args.limite_ms
+            # A primeira importação compila o bytecode e não entra na medição
+            importar(modulo, prefixo_cache)
+            tempos: List[int] = []
+            diretos_por_nome: Dict[str, List[int]] = {}
+            for _ in range(args.repeticoes):
+                total, diretos, proibidos = importar(modulo, prefixo_cache)
+                tempos.append(total)
+                for acumulado, nome in diretos:
+                    diretos_por_nome.setdefault(nome, []).append(acumulado)
+            
+            mediana_ms = statistics.median(tempos) / 1000
+            situacao = "ok"
+            if proibidos:
+                situacao = f"carregou {', '.join(proibidos)}"
+            elif mediana_ms > limite_ms:
+                situacao = "acima do limite"
+            aprovado = aprovado and situacao == "ok"
+            print(f"{modulo:<14} {mediana_ms:7.1f} ms  (limite {limite_ms:.0f} ms)  {situacao}")
+            
+            if args.detalhes:
+                mais_lentos = sorted(((statistics.median(v), n) for n, v in diretos_por_nome.items()), reverse=True)
+                for acumulado, nome in mais_lentos[:5]:
+                    print(f"    {nome:<24} {acumulado / 1000:7.1f} ms")
+    
+    sys.exit(0 if aprovado else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+
+# Função auxiliar para interpretar datas (as mesmas datas se repetem em muitas reservas)
+def converter_data_para_ordinal(data: str) -> Optional[int]:
+    """Converte uma string DD-MM-YYYY para o número ordinal do dia (ou None se inválida)"""
+    # Valores que não são strings (listas, por exemplo) nem chegam ao cache
+    if not isinstance(data, str):
+        return None
+    return _converter_data(data)
+
+
+@lru_cache(maxsize=8192)
+def _converter_data(data: str) -> Optional[int]:
+    # Evita datetime.strptime, que é lento para ser chamado a cada consulta, mas aceita
+    # o mesmo formato: dia e mês com 1 ou 2 dígitos e ano com 4
+    partes = data.split("-")
+    if len(partes) != 3:
+        return None
+    dia, mes, ano = partes
+    digitos = dia + mes + ano
+    if not (digitos.isascii() and digitos.isdigit() and len(ano) == 4 and len(dia) <= 2 and len(mes) <= 2):
+        return None
+    try:
+        return date(int(ano), int(mes), int(dia)).toordinal()
+    except ValueError:
+        return None
@@ -0,0 +1,1443 @@
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from functools import wraps
+from datetime import date, datetime
+from itertools import islice
+from sys import intern
+from typing import List, Dict, Optional, Any, Callable, Iterator, Set, Tuple, Union
+
+from armazenamento import Armazenamento, ArmazenamentoEmSegundoPlano, abrir_armazenamento
+from datas import converter_data_para_ordinal
+from importacao import RelatorioImportacao, converter_booleano, ler_registros
+from metricas import medir
+from travas import TravaLeituraEscrita, escrita, leitura
+
+# Modelo de dados e GerenciadorDeReservas, sem dependência da interface: usado pela
+# aplicação Flet (interface.py), pelo servidor HTTP (servidor_api.py) e por scripts
+
+logger = logging.getLogger("hotel.gerenciador")
+
+
+def _novo_id() -> str:
+    # uuid (que importa o módulo platform) só é carregado quando um id novo é gerado
+    import uuid
+    return str(uuid.uuid4())
+
+
+# Classes do modelo de dados
+class Cliente:
+    __slots__ = ("_nome", "_telefone", "_email", "_id")
+    
+    def __init__(self, nome: str, telefone: str, email: str, id: str = None):
+        self._nome = nome
+        self._telefone = telefone
+        self._email = email
+        self._id = id if id else _novo_id()
+    
+    @property
+    def nome(self) -> str:
+        return self._nome
+    
+    @nome.setter
+    def nome(self, valor: str) -> None:
+        self._nome = valor
+    
+    @property
+    def telefone(self) -> str:
+        return self._telefone
+    
+    @telefone.setter
+    def telefone(self, valor: str) -> None:
+        self._telefone = valor
+    
+    @property
+    def email(self) -> str:
+        return self._email
+    
+    @email.setter
+    def email(self, valor: str) -> None:
+        self._email = valor
+    
+    @property
+    def id(self) -> str:
+        return self._id
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nome": self._nome,
+            "telefone": self._telefone,
+            "email": self._email,
+            "id": self._id
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Cliente':
+        return cls(
+            nome=data["nome"],
+            telefone=data["telefone"],
+            email=data["email"],
+            id=data["id"]
+        )
+
+
+class Quarto:
+    TIPOS = ["Single", "Double", "Suite"]
+    # Hóspedes acomodados por tipo de quarto
+    CAPACIDADES = {"Single": 1, "Double": 2, "Suite": 4}
+    __slots__ = ("_numero", "_tipo", "_preco", "_disponivel")
+    
+    def __init__(self, numero: int, tipo: str, preco: float, disponivel: bool = True):
+        self._numero = numero
+        self._tipo = tipo if tipo in self.TIPOS else "Single"
+        self._preco = preco
+        self._disponivel = disponivel
+    
+    @property
+    def numero(self) -> int:
+        return self._numero
+    
+    @property
+    def tipo(self) -> str:
+        return self._tipo
+    
+    @tipo.setter
+    def tipo(self, valor: str) -> None:
+        if valor in self.TIPOS:
+            self._tipo = valor
+    
+    @property
+    def capacidade(self) -> int:
+        return self.CAPACIDADES[self._tipo]
+    
+    @property
+    def preco(self) -> float:
+        return self._preco
+    
+    @preco.setter
+    def preco(self, valor: float) -> None:
+        if valor > 0:
+            self._preco = valor
+    
+    @property
+    def disponivel(self) -> bool:
+        return self._disponivel
+    
+    @disponivel.setter
+    def disponivel(self, valor: bool) -> None:
+        self._disponivel = valor
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "numero": self._numero,
+            "tipo": self._tipo,
+            "preco": self._preco,
+            "disponivel": self._disponivel
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Quarto':
+        return cls(
+            numero=data["numero"],
+            tipo=data["tipo"],
+            preco=data["preco"],
+            disponivel=data["disponivel"]
+        )
+
+
+class Reserva:
+    STATUS = ["Confirmada", "Pendente", "Cancelada", "Concluída"]
+    # Reservas encerradas não mudam mais e são carregadas sob demanda pelo gerenciador
+    STATUS_ENCERRADOS = ["Cancelada", "Concluída"]
+    STATUS_ATIVOS = ["Confirmada", "Pendente"]
+    CAMPOS = ("cliente_id", "quarto_numero", "check_in", "check_out", "status", "id")
+    __slots__ = ("_cliente_id", "_quarto_numero", "_check_in", "_check_out",
+                 "_dia_check_in", "_dia_check_out", "_status", "_id")
+    
+    def __init__(self, cliente_id: str, quarto_numero: int, 
+                 check_in: str, check_out: str, 
+                 status: str = "Pendente", id: str = None):
+        self._cliente_id = cliente_id
+        self._quarto_numero = quarto_numero
+        # Muitas reservas compartilham as mesmas datas; internar evita uma cópia por reserva
+        self._check_in = intern(check_in) if isinstance(check_in, str) else check_in
+        self._check_out = intern(check_out) if isinstance(check_out, str) else check_out
+        # Datas já interpretadas (ordinal do dia), evitando reconverter as strings a cada consulta
+        self._dia_check_in = converter_data_para_ordinal(check_in)
+        self._dia_check_out = converter_data_para_ordinal(check_out)
+        self._status = intern(status) if status in self.STATUS else "Pendente"
+        self._id = id if id else _novo_id()
+    
+    @property
+    def cliente_id(self) -> str:
+        return self._cliente_id
+    
+    @property
+    def quarto_numero(self) -> int:
+        return self._quarto_numero
+    
+    @property
+    def check_in(self) -> str:
+        return self._check_in
+    
+    @check_in.setter
+    def check_in(self, valor: str) -> None:
+        self._check_in = intern(valor) if isinstance(valor, str) else valor
+        self._dia_check_in = converter_data_para_ordinal(valor)
+    
+    @property
+    def check_out(self) -> str:
+        return self._check_out
+    
+    @check_out.setter
+    def check_out(self, valor: str) -> None:
+        self._check_out = intern(valor) if isinstance(valor, str) else valor
+        self._dia_check_out = converter_data_para_ordinal(valor)
+    
+    @property
+    def dia_check_in(self) -> Optional[int]:
+        return self._dia_check_in
+    
+    @property
+    def dia_check_out(self) -> Optional[int]:
+        return self._dia_check_out
+    
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @status.setter
+    def status(self, valor: str) -> None:
+        if valor in self.STATUS:
+            self._status = intern(valor)
+    
+    @property
+    def id(self) -> str:
+        return self._id
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cliente_id": self._cliente_id,
+            "quarto_numero": self._quarto_numero,
+            "check_in": self._check_in,
+            "check_out": self._check_out,
+            "status": self._status,
+            "id": self._id
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Reserva':
+        return cls(
+            cliente_id=data["cliente_id"],
+            quarto_numero=data["quarto_numero"],
+            check_in=data["check_in"],
+            check_out=data["check_out"],
+            status=data["status"],
+            id=data["id"]
+        )
+
+
+class IntervalosDoQuarto:
+    """Estadias ativas de um quarto, ordenadas pela data de check-in"""
+    
+    def __init__(self):
+        self._inicios: List[int] = []
+        self._fins: List[int] = []
+        self._ids: List[str] = []
+        # Maior check-out entre as estadias até cada posição (permite busca binária
+        # mesmo que existam estadias sobrepostas gravadas por edições antigas)
+        self._fins_maximos: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def adicionar(self, inicio: int, fim: int, reserva_id: str) -> None:
+        posicao = bisect_right(self._inicios, inicio)
+        self._inicios.insert(posicao, inicio)
+        self._fins.insert(posicao, fim)
+        self._ids.insert(posicao, reserva_id)
+        self._fins_maximos.insert(posicao, fim)
+        self._recalcular_fins_maximos(posicao)
+    
+    def remover(self, inicio: int, reserva_id: str) -> bool:
+        posicao = bisect_left(self._inicios, inicio)
+        while posicao < len(self._ids) and self._inicios[posicao] == inicio:
+            if self._ids[posicao] == reserva_id:
+                del self._inicios[posicao]
+                del self._fins[posicao]
+                del self._ids[posicao]
+                del self._fins_maximos[posicao]
+                self._recalcular_fins_maximos(posicao)
+                return True
+            posicao += 1
+        return False
+    
+    def carregar(self, intervalos: List[Tuple[int, int, str]]) -> None:
+        # Montagem em lote: uma ordenação em vez de uma inserção ordenada por estadia
+        intervalos.sort()
+        self._inicios = [inicio for inicio, _, _ in intervalos]
+        self._fins = [fim for _, fim, _ in intervalos]
+        self._ids = [reserva_id for _, _, reserva_id in intervalos]
+        self._fins_maximos = self._fins[:]
+        if self._fins:
+            self._recalcular_fins_maximos(0)
+    
+    def sobrepoe(self, inicio: int, fim: int) -> bool:
+        # Apenas estadias que começam antes do novo check-out podem sobrepor
+        posicao = bisect_left(self._inicios, fim)
+        return posicao > 0 and self._fins_maximos[posicao - 1] > inicio
+    
+    def estadias_no_periodo(self, inicio: int, fim: int) -> List[Tuple[int, int, str]]:
+        """Estadias (início, fim, id da reserva) com ao menos uma noite entre inicio e fim"""
+        estadias = []
+        posicao = bisect_left(self._inicios, fim) - 1
+        # Os fins máximos param a busca assim que nenhuma estadia anterior alcança o início
+        while posicao >= 0 and self._fins_maximos[posicao] > inicio:
+            if self._fins[posicao] > inicio:
+                estadias.append((self._inicios[posicao], self._fins[posicao], self._ids[posicao]))
+            posicao -= 1
+        estadias.reverse()
+        return estadias
+    
+    def _recalcular_fins_maximos(self, posicao: int) -> None:
+        maximo = self._fins_maximos[posicao - 1] if posicao > 0 else None
+        for i in range(posicao, len(self._fins)):
+            fim = self._fins[i]
+            maximo = fim if maximo is None or fim > maximo else maximo
+            self._fins_maximos[i] = maximo
+
+
+class CalendarioDeOcupacao:
+    """Noites ocupadas de cada quarto em bits, de dia_inicial até dia_inicial + horizonte"""
+    
+    HORIZONTE = 730  # dias (cerca de 2 anos)
+    
+    def __init__(self, dia_inicial: int, horizonte: int = HORIZONTE):
+        self.dia_inicial = dia_inicial
+        self.dia_final = dia_inicial + horizonte
+        # Por quarto: o bit i indica a noite dia_inicial + i ocupada
+        self._noites_por_quarto: Dict[int, int] = {}
+        # Por noite: o bit p indica o quarto da posição p ocupado (consulta todos os quartos de uma vez)
+        self._quartos_por_noite: List[int] = [0] * horizonte
+        self._posicoes: Dict[int, int] = {}
+        self._numeros: List[int] = []
+    
+    def cobre(self, inicio: int, fim: int) -> bool:
+        return self.dia_inicial <= inicio and fim <= self.dia_final
+    
+    def _noites(self, inicio: int, fim: int) -> Tuple[int, int]:
+        # Posições das noites do período dentro do horizonte
+        return max(inicio, self.dia_inicial) - self.dia_inicial, min(fim, self.dia_final) - self.dia_inicial
+    
+    def _mascara(self, inicio: int, fim: int) -> int:
+        primeira, ultima = self._noites(inicio, fim)
+        if ultima <= primeira:
+            return 0
+        return ((1 << (ultima - primeira)) - 1) << primeira
+    
+    def _bit_do_quarto(self, quarto_numero: int) -> int:
+        posicao = self._posicoes.get(quarto_numero)
+        if posicao is None:
+            posicao = self._posicoes[quarto_numero] = len(self._numeros)
+            self._numeros.append(quarto_numero)
+        return 1 << posicao
+    
+    def marcar(self, quarto_numero: int, inicio: int, fim: int) -> None:
+        mascara = self._mascara(inicio, fim)
+        if not mascara:
+            return
+        self._noites_por_quarto[quarto_numero] = self._noites_por_quarto.get(quarto_numero, 0) | mascara
+        bit = self._bit_do_quarto(quarto_numero)
+        primeira, ultima = self._noites(inicio, fim)
+        for noite in range(primeira, ultima):
+            self._quartos_por_noite[noite] |= bit
+    
+    def desmarcar(self, quarto_numero: int, inicio: int, fim: int) -> None:
+        mascara = self._mascara(inicio, fim)
+        if not mascara or quarto_numero not in self._noites_por_quarto:
+            return
+        self._noites_por_quarto[quarto_numero] &= ~mascara
+        bit = self._bit_do_quarto(quarto_numero)
+        primeira, ultima = self._noites(inicio, fim)
+        for noite in range(primeira, ultima):
+            self._quartos_por_noite[noite] &= ~bit
+    
+    def livre(self, quarto_numero: int, inicio: int, fim: int) -> bool:
+        return not self._noites_por_quarto.get(quarto_numero, 0) & self._mascara(inicio, fim)
+    
+    def inicios_livres(self, quarto_numero: int, primeiro: int, ultimo: int, noites: int) -> List[int]:
+        """Dias entre primeiro e ultimo (inclusive) em que começa uma estadia livre de `noites` noites"""
+        largura = ultimo - primeiro + noites
+        livres = ~(self._noites_por_quarto.get(quarto_numero, 0) >> (primeiro - self.dia_inicial))
+        livres &= (1 << largura) - 1
+        # Bit s de `sequencias` = `tamanho` noites livres a partir de s; o tamanho dobra a cada passo
+        sequencias, tamanho = livres, 1
+        while tamanho < noites:
+            passo = min(tamanho, noites - tamanho)
+            sequencias &= sequencias >> passo
+            tamanho += passo
+        sequencias &= (1 << (ultimo - primeiro + 1)) - 1
+        inicios = []
+        while sequencias:
+            bit = sequencias & -sequencias
+            inicios.append(primeiro + bit.bit_length() - 1)
+            sequencias ^= bit
+        return inicios
+    
+    def quartos_ocupados(self, inicio: int, fim: int) -> Set[int]:
+        """Números dos quartos com alguma noite ocupada no período"""
+        primeira, ultima = self._noites(inicio, fim)
+        ocupados = 0
+        for quartos in self._quartos_por_noite[primeira:ultima]:
+            ocupados |= quartos
+        numeros = set()
+        while ocupados:
+            bit = ocupados & -ocupados
+            numeros.add(self._numeros[bit.bit_length() - 1])
+            ocupados ^= bit
+        return numeros
+
+
+class OpcaoDeHospedagem:
+    """Resultado da busca de quartos: um quarto livre para o período encontrado"""
+    __slots__ = ("quarto", "check_in", "check_out", "noites", "total", "deslocamento")
+    
+    def __init__(self, quarto: Quarto, dia_check_in: int, noites: int, deslocamento: int):
+        self.quarto = quarto
+        self.check_in = formatar_data(datetime.fromordinal(dia_check_in))
+        self.check_out = formatar_data(datetime.fromordinal(dia_check_in + noites))
+        self.noites = noites
+        self.total = quarto.preco * noites
+        # Dias de diferença em relação ao check-in pedido (negativo = antes)
+        self.deslocamento = deslocamento
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "quarto": self.quarto.to_dict(),
+            "check_in": self.check_in,
+            "check_out": self.check_out,
+            "noites": self.noites,
+            "total": self.total,
+            "deslocamento": self.deslocamento
+        }
+    
+    def __repr__(self) -> str:
+        return f"OpcaoDeHospedagem(quarto {self.quarto.numero}: {self.check_in} a {self.check_out}, {self.total:.2f})"
+
+
+class AlteracaoDeDados:
+    """Aviso de alteração publicado pelo gerenciador (veja GerenciadorDeReservas.inscrever)
+    
+    entidade é "cliente", "quarto" ou "reserva"; chave é o id do cliente ou da reserva, ou o
+    número do quarto; tipo é "criado", "alterado" ou "removido". Nas reservas, quarto_numero
+    indica o quarto afetado (mesmo depois de a reserva ser removida).
+    """
+    __slots__ = ("entidade", "chave", "tipo", "quarto_numero")
+    
+    ENTIDADES = ("cliente", "quarto", "reserva")
+    TIPOS = ("criado", "alterado", "removido")
+    
+    def __init__(self, entidade: str, chave: Any, tipo: str, quarto_numero: Optional[int] = None):
+        self.entidade = entidade
+        self.chave = chave
+        self.tipo = tipo
+        self.quarto_numero = quarto_numero
+    
+    def __repr__(self) -> str:
+        return f"AlteracaoDeDados({self.entidade} {self.chave}: {self.tipo})"
+
+
+def _dias_por_proximidade(dia: int, primeiro: int, ultimo: int) -> Iterator[int]:
+    """Dias de primeiro a ultimo, do mais próximo de `dia` ao mais distante (em empate, o anterior)"""
+    for distancia in range(max(dia - primeiro, ultimo - dia) + 1):
+        for candidato in (dia - distancia, dia + distancia) if distancia else (dia,):
+            if primeiro <= candidato <= ultimo:
+                yield candidato
+
+
+def _alteracao(metodo: Callable) -> Callable:
+    """Como @escrita, mas recusa a alteração (antes de mudar qualquer coisa) depois de fechar()"""
+    @wraps(metodo)
+    def com_trava(self, *args, **kwargs):
+        with self._trava.escrita():
+            self._verificar_aberto()
+            return metodo(self, *args, **kwargs)
+    return com_trava
+
+
+class GerenciadorDeReservas:
+    def __init__(self, arquivo_dados: str = "dados_hotel.json", usar_journal: bool = True,
+                 armazenamento: Optional[Armazenamento] = None, gravacao_em_segundo_plano: bool = False):
+        # Dicionários indexados pela chave de cada entidade (mantêm a ordem de inserção)
+        self._clientes: Dict[str, Cliente] = {}
+        self._quartos: Dict[int, Quarto] = {}
+        # Reservas encerradas lidas do armazenamento ficam como tuplas (na ordem de
+        # Reserva.CAMPOS) até serem acessadas; veja _materializar_reserva. Elas continuam
+        # na memória: a carga não cria objetos nem índices para o histórico, mas a memória
+        # ainda cresce com ele (mantê-lo só no disco exigiria um índice de posições no arquivo)
+        self._reservas: Dict[str, Union[Reserva, tuple]] = {}
+        self._reservas_nao_carregadas = 0
+        # Índices secundários de reservas por cliente e por quarto
+        self._reservas_por_cliente: Dict[str, Dict[str, Union[Reserva, tuple]]] = {}
+        self._reservas_por_quarto: Dict[int, Dict[str, Union[Reserva, tuple]]] = {}
+        # Índice de estadias ativas por quarto, usado na verificação de disponibilidade
+        self._intervalos_por_quarto: Dict[int, IntervalosDoQuarto] = {}
+        self._intervalos_por_reserva: Dict[str, tuple] = {}
+        # Calendário de noites ocupadas a partir de hoje, montado na primeira consulta
+        # e depois mantido junto com o índice de estadias (veja _calendario_atual)
+        self._calendario: Optional[CalendarioDeOcupacao] = None
+        # Contadores da tela inicial, atualizados a cada alteração: reservas ativas,
+        # quartos marcados como indisponíveis e estadias que cobrem a noite de hoje por
+        # quarto (recontadas na virada do dia)
+        self._reservas_ativas: Set[str] = set()
+        self._quartos_indisponiveis: Set[int] = set()
+        self._estadias_hoje: Dict[int, int] = {}
+        self._dia_painel: Optional[int] = None
+        # Por padrão os dados ficam no arquivo JSON (com journal); um arquivo .db (ou
+        # .sqlite) guarda os mesmos dados em um banco SQLite (veja abrir_armazenamento)
+        self._armazenamento = armazenamento or abrir_armazenamento(arquivo_dados, usar_journal)
+        if gravacao_em_segundo_plano:
+            # As gravações passam a ser feitas por uma thread, sem bloquear quem chamou
+            self._armazenamento = ArmazenamentoEmSegundoPlano(self._armazenamento)
+        # Estado da transação em andamento (None fora de transacao()): registros ainda
+        # não gravados, o estado anterior de cada entidade alterada e, para cada tipo com
+        # remoções, a ordem anterior das chaves (entidades recolocadas iriam para o fim)
+        self._registros_pendentes: Optional[List[Tuple[str, str, Any]]] = None
+        self._estado_anterior: Optional[Dict[Tuple[str, Any], Optional[Dict[str, Any]]]] = None
+        self._ordem_anterior: Optional[Dict[str, List[Any]]] = None
+        # O gerenciador pode ser compartilhado por várias sessões (threads): consultas
+        # usam a trava de leitura e alterações a de escrita. Como as consultas também
+        # preenchem caches (reservas materializadas, calendário, ocupação de hoje),
+        # esse preenchimento tem uma trava própria
+        self._trava = TravaLeituraEscrita()
+        self._trava_caches = threading.Lock()
+        # Funções avisadas de cada alteração (veja inscrever); dentro de uma transação
+        # os avisos ficam guardados até a gravação e são descartados se ela for desfeita
+        self._inscritos: List[Callable[[AlteracaoDeDados], None]] = []
+        self._alteracoes_pendentes: Optional[List[AlteracaoDeDados]] = None
+        self._fechado = False
+        self._carregar_dados()
+    
+    @escrita
+    def fechar(self) -> None:
+        """Grava as alterações pendentes e libera o armazenamento"""
+        self._fechado = True
+        self._armazenamento.fechar()
+    
+    def _verificar_aberto(self) -> None:
+        if self._fechado:
+            raise RuntimeError("O gerenciador de reservas já foi fechado")
+    
+    @contextmanager
+    def transacao(self) -> Iterator['GerenciadorDeReservas']:
+        """Agrupa várias operações em uma única gravação, desfazendo todas em caso de erro
+        
+        A trava de escrita fica com a transação até o fim: outras sessões não veem o estado parcial.
+        """
+        with self._trava.escrita():
+            self._verificar_aberto()
+            # Transações aninhadas fazem parte da transação externa
+            if self._registros_pendentes is not None:
+                yield self
+                return
+            
+            self._registros_pendentes = []
+            self._estado_anterior = {}
+            self._ordem_anterior = {}
+            self._alteracoes_pendentes = []
+            try:
+                yield self
+            except BaseException:
+                estado_anterior, ordem_anterior = self._estado_anterior, self._ordem_anterior
+                self._registros_pendentes = None
+                self._estado_anterior = None
+                self._ordem_anterior = None
+                try:
+                    # Os avisos da restauração também ficam na lista descartada
+                    self._restaurar_estado(estado_anterior, ordem_anterior)
+                finally:
+                    self._alteracoes_pendentes = None
+                raise
+            
+            registros = self._registros_pendentes
+            alteracoes = self._alteracoes_pendentes
+            self._registros_pendentes = None
+            self._estado_anterior = None
+            self._ordem_anterior = None
+            self._alteracoes_pendentes = None
+            if registros:
+                self._armazenamento.registrar_lote(registros)
+                if self._armazenamento.precisa_compactar:
+                    self._salvar_dados()
+            self._publicar_alteracoes(alteracoes)
+    
+    def _anotar_estado(self, tipo: str, chave: Any, entidade: Any) -> None:
+        # Guarda apenas o estado da entidade antes da primeira alteração na transação
+        if self._estado_anterior is None or (tipo, chave) in self._estado_anterior:
+            return
+        self._estado_anterior[(tipo, chave)] = entidade.to_dict() if entidade else None
+    
+    def _anotar_ordem(self, tipo: str, entidades: Dict[Any, Any]) -> None:
+        # Copiada só na primeira remoção do tipo na transação (remoções em transações são raras)
+        if self._ordem_anterior is None or tipo in self._ordem_anterior:
+            return
+        self._ordem_anterior[tipo] = list(entidades)
+    
+    def _restaurar_estado(self, estado_anterior: Dict[Tuple[str, Any], Optional[Dict[str, Any]]],
+                          ordem_anterior: Dict[str, List[Any]]) -> None:
+        for (tipo, chave), dados in reversed(list(estado_anterior.items())):
+            if tipo == "cliente":
+                cliente = self._clientes.get(chave)
+                if dados is None:
+                    self._clientes.pop(chave, None)
+                elif cliente:
+                    cliente.nome = dados["nome"]
+                    cliente.telefone = dados["telefone"]
+                    cliente.email = dados["email"]
+                else:
+                    dados["id"] = self._uuid_cliente(dados["id"])
+                    self._clientes[chave] = Cliente.from_dict(dados)
+            elif tipo == "quarto":
+                quarto = self._quartos.get(chave)
+                if dados is None:
+                    self._quartos.pop(chave, None)
+                    self._quartos_indisponiveis.discard(chave)
+                elif quarto:
+                    quarto.tipo = dados["tipo"]
+                    quarto.preco = dados["preco"]
+                    quarto.disponivel = dados["disponivel"]
+                    self._marcar_disponibilidade_do_quarto(quarto)
+                else:
+                    self._quartos[chave] = Quarto.from_dict(dados)
+                    self._marcar_disponibilidade_do_quarto(self._quartos[chave])
+            elif tipo == "reserva":
+                reserva = self._materializar_reserva(chave)
+                if dados is None:
+                    if reserva:
+                        self._retirar_reserva(reserva)
+                elif reserva:
+                    self._alterar_reserva(reserva, dados["check_in"], dados["check_out"], dados["status"])
+                else:
+                    dados["cliente_id"] = self._uuid_cliente(dados["cliente_id"])
+                    self._inserir_reserva(Reserva.from_dict(dados))
+        
+        # Entidades removidas na transação voltaram para o fim: recolocar na ordem anterior
+        if "cliente" in ordem_anterior:
+            self._clientes = {c: self._clientes[c] for c in ordem_anterior["cliente"] if c in self._clientes}
+        if "quarto" in ordem_anterior:
+            self._quartos = {n: self._quartos[n] for n in ordem_anterior["quarto"] if n in self._quartos}
+        if "reserva" in ordem_anterior:
+            self._reservas = {r: self._reservas[r] for r in ordem_anterior["reserva"] if r in self._reservas}
+            # Os índices por cliente e por quarto seguem a ordem das reservas
+            self._reconstruir_indice()
+    
+    def inscrever(self, funcao: Callable[[AlteracaoDeDados], None]) -> None:
+        """Passa a chamar `funcao` a cada alteração de cliente, quarto ou reserva
+        
+        A função é chamada na thread de quem alterou, ainda com a trava de escrita:
+        deve apenas repassar o aviso (por exemplo, agendando a atualização da tela).
+        """
+        # A lista é trocada (e não alterada) para que a publicação possa percorrê-la sem trava
+        with self._trava_caches:
+            self._inscritos = self._inscritos + [funcao]
+    
+    def cancelar_inscricao(self, funcao: Callable[[AlteracaoDeDados], None]) -> None:
+        with self._trava_caches:
+            self._inscritos = [f for f in self._inscritos if f != funcao]
+    
+    def _avisar(self, entidade: str, chave: Any, tipo: str, quarto_numero: Optional[int] = None) -> None:
+        if not self._inscritos:
+            return
+        alteracao = AlteracaoDeDados(entidade, chave, tipo, quarto_numero)
+        if self._alteracoes_pendentes is not None:
+            self._alteracoes_pendentes.append(alteracao)
+        else:
+            self._publicar_alteracoes([alteracao])
+    
+    def _publicar_alteracoes(self, alteracoes: List[AlteracaoDeDados]) -> None:
+        for funcao in self._inscritos:
+            for alteracao in alteracoes:
+                try:
+                    funcao(alteracao)
+                except Exception:
+                    logger.exception("Erro ao avisar %r", alteracao)
+    
+    @medir()
+    @_alteracao
+    def adicionar_cliente(self, cliente: Cliente) -> None:
+        existente = self._clientes.get(cliente.id)
+        self._anotar_estado("cliente", cliente.id, existente)
+        self._clientes[cliente.id] = cliente
+        self._registrar_operacao("salvar", "cliente", cliente.to_dict())
+        self._avisar("cliente", cliente.id, "alterado" if existente else "criado")
+    
+    @leitura
+    def obter_cliente_por_id(self, cliente_id: str) -> Optional[Cliente]:
+        return self._clientes.get(cliente_id)
+    
+    def _uuid_cliente(self, cliente_id: str) -> str:
+        # A instância do UUID guardada no cliente é compartilhada pelas suas reservas
+        cliente = self._clientes.get(cliente_id)
+        return cliente.id if cliente else cliente_id
+    
+    @medir()
+    @_alteracao
+    def atualizar_cliente(self, cliente_id: str, nome: str, telefone: str, email: str) -> bool:
+        cliente = self.obter_cliente_por_id(cliente_id)
+        if cliente:
+            self._anotar_estado("cliente", cliente_id, cliente)
+            cliente.nome = nome
+            cliente.telefone = telefone
+            cliente.email = email
+            self._registrar_operacao("salvar", "cliente", cliente.to_dict())
+            self._avisar("cliente", cliente_id, "alterado")
+            return True
+        return False
+    
+    @medir()
+    @_alteracao
+    def remover_cliente(self, cliente_id: str) -> bool:
+        if self._excluir_cliente(cliente_id):
+            self._registrar_operacao("remover", "cliente", cliente_id)
+            return True
+        return False
+    
+    def _excluir_cliente(self, cliente_id: str) -> bool:
+        cliente = self.obter_cliente_por_id(cliente_id)
+        if cliente:
+            self._anotar_estado("cliente", cliente_id, cliente)
+            self._anotar_ordem("cliente", self._clientes)
+            del self._clientes[cliente_id]
+            # Remover também todas as reservas associadas a este cliente
+            for reserva in self.listar_reservas_por_cliente(cliente_id):
+                self._retirar_reserva(reserva)
+            self._avisar("cliente", cliente_id, "removido")
+            return True
+        return False
+    
+    @medir()
+    @_alteracao
+    def adicionar_quarto(self, quarto: Quarto) -> None:
+        existente = self._quartos.get(quarto.numero)
+        self._anotar_estado("quarto", quarto.numero, existente)
+        self._quartos[quarto.numero] = quarto
+        self._marcar_disponibilidade_do_quarto(quarto)
+        self._registrar_operacao("salvar", "quarto", quarto.to_dict())
+        self._avisar("quarto", quarto.numero, "alterado" if existente else "criado")
+    
+    @leitura
+    def obter_quarto_por_numero(self, numero: int) -> Optional[Quarto]:
+        return self._quartos.get(numero)
+    
+    def _marcar_disponibilidade_do_quarto(self, quarto: Quarto) -> None:
+        if quarto.disponivel:
+            self._quartos_indisponiveis.discard(quarto.numero)
+        else:
+            self._quartos_indisponiveis.add(quarto.numero)
+    
+    @medir()
+    @_alteracao
+    def atualizar_quarto(self, numero: int, tipo: str, preco: float, disponivel: bool) -> bool:
+        quarto = self.obter_quarto_por_numero(numero)
+        if quarto:
+            self._anotar_estado("quarto", numero, quarto)
+            quarto.tipo = tipo
+            quarto.preco = preco
+            quarto.disponivel = disponivel
+            self._marcar_disponibilidade_do_quarto(quarto)
+            self._registrar_operacao("salvar", "quarto", quarto.to_dict())
+            self._avisar("quarto", numero, "alterado")
+            return True
+        return False
+    
+    @medir()
+    @_alteracao
+    def remover_quarto(self, numero: int) -> bool:
+        if self._excluir_quarto(numero):
+            self._registrar_operacao("remover", "quarto", numero)
+            return True
+        return False
+    
+    def _excluir_quarto(self, numero: int) -> bool:
+        quarto = self.obter_quarto_por_numero(numero)
+        if quarto:
+            self._anotar_estado("quarto", numero, quarto)
+            self._anotar_ordem("quarto", self._quartos)
+            del self._quartos[numero]
+            self._quartos_indisponiveis.discard(numero)
+            # Remover também todas as reservas associadas a este quarto
+            for reserva in self.listar_reservas_por_quarto(numero):
+                self._retirar_reserva(reserva)
+            self._intervalos_por_quarto.pop(numero, None)
+            self._avisar("quarto", numero, "removido")
+            return True
+        return False
+    
+    @medir()
+    @_alteracao
+    def criar_reserva(self, cliente_id: str, quarto_numero: int, 
+                      check_in: str, check_out: str) -> Optional[Reserva]:
+        cliente = self.obter_cliente_por_id(cliente_id)
+        quarto = self.obter_quarto_por_numero(quarto_numero)
+        
+        if not cliente or not quarto:
+            return None
+        
+        # Verificar se o quarto está disponível nas datas solicitadas
+        if not self._verificar_disponibilidade(quarto_numero, check_in, check_out):
+            return None
+        
+        reserva = Reserva(self._uuid_cliente(cliente_id), quarto_numero, check_in, check_out)
+        self._inserir_reserva(reserva)
+        
+        # Não marcamos o quarto como indisponível permanentemente
+        # Apenas verificamos a disponibilidade para o período específico
+        
+        self._registrar_operacao("salvar", "reserva", reserva.to_dict())
+        return reserva
+    
+    def _verificar_disponibilidade(self, quarto_numero: int, check_in: str, check_out: str) -> bool:
+        # Converter strings para ordinais de dia
+        inicio = converter_data_para_ordinal(check_in)
+        fim = converter_data_para_ordinal(check_out)
+        if inicio is None or fim is None:
+            return False
+        
+        # Verificar se check_out é posterior a check_in
+        if fim <= inicio:
+            return False
+        
+        # Dentro do horizonte do calendário basta testar os bits das noites
+        calendario = self._calendario_atual()
+        if calendario.cobre(inicio, fim):
+            return calendario.livre(quarto_numero, inicio, fim)
+        
+        # Verificar se há sobreposição com outras reservas ativas (não canceladas)
+        intervalos = self._intervalos_por_quarto.get(quarto_numero)
+        if intervalos is None:
+            return True
+        return not intervalos.sobrepoe(inicio, fim)
+    
+    def _indexar_reserva(self, reserva: Reserva) -> None:
+        if reserva.status in Reserva.STATUS_ATIVOS:
+            self._reservas_ativas.add(reserva.id)
+        if reserva.status == "Cancelada":
+            return
+        inicio = reserva.dia_check_in
+        fim = reserva.dia_check_out
+        if inicio is None or fim is None:
+            # Se houver erro no formato da data, ignorar esta reserva
+            return
+        intervalos = self._intervalos_por_quarto.get(reserva.quarto_numero)
+        if intervalos is None:
+            intervalos = self._intervalos_por_quarto[reserva.quarto_numero] = IntervalosDoQuarto()
+        intervalos.adicionar(inicio, fim, reserva.id)
+        self._intervalos_por_reserva[reserva.id] = (reserva.quarto_numero, inicio, fim)
+        if self._calendario is not None:
+            self._calendario.marcar(reserva.quarto_numero, inicio, fim)
+        if self._dia_painel is not None and inicio <= self._dia_painel < fim:
+            self._estadias_hoje[reserva.quarto_numero] = self._estadias_hoje.get(reserva.quarto_numero, 0) + 1
+    
+    def _desindexar_reserva(self, reserva_id: str) -> None:
+        self._reservas_ativas.discard(reserva_id)
+        intervalo = self._intervalos_por_reserva.pop(reserva_id, None)
+        if intervalo is None:
+            return
+        quarto_numero, inicio, fim = intervalo
+        if self._dia_painel is not None and inicio <= self._dia_painel < fim:
+            self._estadias_hoje[quarto_numero] -= 1
+            if not self._estadias_hoje[quarto_numero]:
+                del self._estadias_hoje[quarto_numero]
+        intervalos = self._intervalos_por_quarto.get(quarto_numero)
+        if intervalos is not None:
+            intervalos.remover(inicio, reserva_id)
+        if self._calendario is not None:
+            # Estadias sobrepostas (de edições antigas) continuam ocupando as mesmas noites
+            self._calendario.desmarcar(quarto_numero, inicio, fim)
+            if intervalos is not None:
+                for outro_inicio, outro_fim, _ in intervalos.estadias_no_periodo(inicio, fim):
+                    self._calendario.marcar(quarto_numero, outro_inicio, outro_fim)
+    
+    def _calendario_atual(self) -> CalendarioDeOcupacao:
+        # O horizonte começa hoje; na virada do dia o calendário é montado de novo
+        hoje = date.today().toordinal()
+        calendario = self._calendario
+        if calendario is not None and calendario.dia_inicial == hoje:
+            return calendario
+        with self._trava_caches:
+            if self._calendario is None or self._calendario.dia_inicial != hoje:
+                calendario = CalendarioDeOcupacao(hoje)
+                for quarto_numero, intervalos in self._intervalos_por_quarto.items():
+                    for inicio, fim, _ in intervalos.estadias_no_periodo(calendario.dia_inicial, calendario.dia_final):
+                        calendario.marcar(quarto_numero, inicio, fim)
+                self._calendario = calendario
+            return self._calendario
+    
+    def _atualizar_ocupacao_hoje(self) -> None:
+        # Na virada do dia (ou depois de reconstruir o índice) reconta as estadias de hoje
+        hoje = date.today().toordinal()
+        if self._dia_painel == hoje:
+            return
+        with self._trava_caches:
+            if self._dia_painel == hoje:
+                return
+            # O dicionário novo só substitui o anterior depois de pronto
+            estadias_hoje = {}
+            for quarto_numero, intervalos in self._intervalos_por_quarto.items():
+                quantidade = len(intervalos.estadias_no_periodo(hoje, hoje + 1))
+                if quantidade:
+                    estadias_hoje[quarto_numero] = quantidade
+            self._estadias_hoje = estadias_hoje
+            self._dia_painel = hoje
+    
+    @medir()
+    @leitura
+    def painel(self) -> Dict[str, int]:
+        """Contadores da tela inicial, lidos sem percorrer quartos ou reservas"""
+        self._atualizar_ocupacao_hoje()
+        quartos_ocupados = len(self._estadias_hoje)
+        # Quartos marcados como indisponíveis (fora de serviço) não contam como livres
+        indisponiveis_livres = sum(1 for n in self._quartos_indisponiveis if n not in self._estadias_hoje)
+        return {
+            "quartos": len(self._quartos),
+            "quartos_ocupados": quartos_ocupados,
+            "quartos_livres": len(self._quartos) - quartos_ocupados - indisponiveis_livres,
+            "reservas_ativas": len(self._reservas_ativas)
+        }
+    
+    @leitura
+    def quarto_ocupado_hoje(self, quarto_numero: int) -> bool:
+        self._atualizar_ocupacao_hoje()
+        return quarto_numero in self._estadias_hoje
+    
+    def _alterar_reserva(self, reserva: Reserva, check_in: str, check_out: str, status: str) -> None:
+        self._anotar_estado("reserva", reserva.id, reserva)
+        self._desindexar_reserva(reserva.id)
+        reserva.check_in = check_in
+        reserva.check_out = check_out
+        reserva.status = status
+        self._indexar_reserva(reserva)
+        self._avisar("reserva", reserva.id, "alterado", reserva.quarto_numero)
+    
+    def _inserir_reserva(self, reserva: Reserva) -> None:
+        self._anotar_estado("reserva", reserva.id, self._materializar_reserva(reserva.id))
+        self._reservas[reserva.id] = reserva
+        self._reservas_por_cliente.setdefault(reserva.cliente_id, {})[reserva.id] = reserva
+        self._reservas_por_quarto.setdefault(reserva.quarto_numero, {})[reserva.id] = reserva
+        self._indexar_reserva(reserva)
+        self._avisar("reserva", reserva.id, "criado", reserva.quarto_numero)
+    
+    def _retirar_reserva(self, reserva: Reserva) -> None:
+        self._anotar_estado("reserva", reserva.id, reserva)
+        self._anotar_ordem("reserva", self._reservas)
+        self._desindexar_reserva(reserva.id)
+        del self._reservas[reserva.id]
+        for indice, chave in ((self._reservas_por_cliente, reserva.cliente_id),
+                              (self._reservas_por_quarto, reserva.quarto_numero)):
+            reservas = indice.get(chave)
+            if reservas is not None:
+                reservas.pop(reserva.id, None)
+                if not reservas:
+                    del indice[chave]
+        self._avisar("reserva", reserva.id, "removido", reserva.quarto_numero)
+    
+    def _reconstruir_indice(self) -> None:
+        self._reservas_por_cliente = {}
+        self._reservas_por_quarto = {}
+        self._intervalos_por_reserva = {}
+        self._calendario = None
+        self._reservas_ativas = set()
+        self._dia_painel = None
+        intervalos_por_quarto: Dict[int, List[Tuple[int, int, str]]] = {}
+        for reserva_id, reserva in self._reservas.items():
+            if isinstance(reserva, Reserva):
+                cliente_id, quarto_numero, status = reserva.cliente_id, reserva.quarto_numero, reserva.status
+                inicio, fim = reserva.dia_check_in, reserva.dia_check_out
+                if status in Reserva.STATUS_ATIVOS:
+                    self._reservas_ativas.add(reserva_id)
+            else:
+                cliente_id, quarto_numero, check_in, check_out, status, _ = reserva
+                inicio, fim = None, None
+                if status != "Cancelada":
+                    inicio = converter_data_para_ordinal(check_in)
+                    fim = converter_data_para_ordinal(check_out)
+            self._reservas_por_cliente.setdefault(cliente_id, {})[reserva_id] = reserva
+            self._reservas_por_quarto.setdefault(quarto_numero, {})[reserva_id] = reserva
+            
+            # Estadias não canceladas e com datas válidas entram no índice de disponibilidade
+            if status != "Cancelada" and inicio is not None and fim is not None:
+                intervalos_por_quarto.setdefault(quarto_numero, []).append((inicio, fim, reserva_id))
+                self._intervalos_por_reserva[reserva_id] = (quarto_numero, inicio, fim)
+        
+        self._intervalos_por_quarto = {}
+        for quarto_numero, intervalos in intervalos_por_quarto.items():
+            self._intervalos_por_quarto[quarto_numero] = IntervalosDoQuarto()
+            self._intervalos_por_quarto[quarto_numero].carregar(intervalos)
+    
+    def _materializar_reserva(self, reserva_id: str) -> Optional[Reserva]:
+        # Cria o objeto Reserva de uma reserva encerrada na primeira vez que ela é acessada
+        reserva = self._reservas.get(reserva_id)
+        if reserva is None or isinstance(reserva, Reserva):
+            return reserva
+        with self._trava_caches:
+            # Outra consulta pode ter materializado a mesma reserva enquanto esta esperava
+            reserva = self._reservas[reserva_id]
+            if isinstance(reserva, Reserva):
+                return reserva
+            reserva = Reserva(*reserva)
+            self._reservas[reserva_id] = reserva
+            self._reservas_por_cliente[reserva.cliente_id][reserva_id] = reserva
+            self._reservas_por_quarto[reserva.quarto_numero][reserva_id] = reserva
+            self._reservas_nao_carregadas -= 1
+            return reserva
+    
+    def _materializar_reservas(self, reservas: Dict[str, Union[Reserva, tuple]]) -> List[Reserva]:
+        if self._reservas_nao_carregadas:
+            for reserva_id in [i for i, r in reservas.items() if not isinstance(r, Reserva)]:
+                self._materializar_reserva(reserva_id)
+        return list(reservas.values())
+    
+    @leitura
+    def obter_reserva_por_id(self, reserva_id: str) -> Optional[Reserva]:
+        return self._materializar_reserva(reserva_id)
+    
+    @medir()
+    @_alteracao
+    def atualizar_reserva(self, reserva_id: str, check_in: str, check_out: str, status: str) -> bool:
+        """Altera datas e status; recusa datas inválidas e períodos com noites de outra reserva"""
+        reserva = self.obter_reserva_por_id(reserva_id)
+        if not reserva or status not in Reserva.STATUS:
+            return False
+        inicio = converter_data_para_ordinal(check_in)
+        fim = converter_data_para_ordinal(check_out)
+        if inicio is None or fim is None or fim <= inicio:
+            return False
+        
+        # Estadias mudadas de data (ou reativadas) não podem ocupar noites de outra reserva;
+        # o calendário não serve aqui, porque também tem as noites da própria reserva
+        novas_noites = (inicio, fim) != (reserva.dia_check_in, reserva.dia_check_out) or reserva.status == "Cancelada"
+        if status != "Cancelada" and novas_noites:
+            intervalos = self._intervalos_por_quarto.get(reserva.quarto_numero)
+            estadias = intervalos.estadias_no_periodo(inicio, fim) if intervalos is not None else []
+            if any(outra_id != reserva_id for _, _, outra_id in estadias):
+                return False
+        
+        self._alterar_reserva(reserva, check_in, check_out, status)
+        self._registrar_operacao("salvar", "reserva", reserva.to_dict())
+        return True
+    
+    @medir()
+    @_alteracao
+    def cancelar_reserva(self, reserva_id: str) -> bool:
+        try:
+            reserva = self.obter_reserva_por_id(reserva_id)
+            if not reserva:
+                logger.warning("Reserva não encontrada id=%s", reserva_id[:8])
+                return False
+                
+            # Check if the reservation is already canceled or completed
+            if reserva.status in ["Cancelada", "Concluída"]:
+                logger.info("Reserva já está %s id=%s", reserva.status, reserva_id[:8])
+                return False
+                
+            logger.debug("Alterando status de %r para 'Cancelada' id=%s", reserva.status, reserva_id[:8])
+            self._alterar_reserva(reserva, reserva.check_in, reserva.check_out, "Cancelada")
+            self._registrar_operacao("salvar", "reserva", reserva.to_dict())
+            logger.info("Reserva cancelada id=%s", reserva_id[:8])
+            return True
+        except Exception:
+            logger.exception("Erro ao cancelar reserva id=%s", reserva_id[:8])
+            return False
+    
+    @medir()
+    @_alteracao
+    def importar_arquivo(self, caminho: str, tipo: str) -> RelatorioImportacao:
+        """Importa clientes, quartos ou reservas de um arquivo CSV/JSONL, gravando uma única vez"""
+        relatorio = RelatorioImportacao(tipo)
+        importadores = {
+            "clientes": self._importar_clientes,
+            "quartos": self._importar_quartos,
+            "reservas": self._importar_reservas,
+        }
+        if tipo not in importadores:
+            raise ValueError(f"Tipo de importação desconhecido: {tipo}")
+        
+        with self.transacao():
+            importadores[tipo](ler_registros(caminho), relatorio)
+        return relatorio
+    
+    def _importar_clientes(self, registros: Iterator[Tuple[int, Dict[str, Any]]], relatorio: RelatorioImportacao) -> None:
+        for linha, dados in registros:
+            if not dados:
+                relatorio.rejeitar(linha, "Registro inválido")
+                continue
+            try:
+                cliente = Cliente(dados["nome"], dados["telefone"], dados["email"], dados.get("id") or None)
+            except KeyError as e:
+                relatorio.rejeitar(linha, f"Campo obrigatório ausente: {e}")
+                continue
+            if not cliente.nome:
+                relatorio.rejeitar(linha, "Nome vazio")
+            elif cliente.id in self._clientes:
+                relatorio.rejeitar(linha, f"Cliente já existe: {cliente.id}")
+            else:
+                self.adicionar_cliente(cliente)
+                relatorio.importados += 1
+    
+    def _importar_quartos(self, registros: Iterator[Tuple[int, Dict[str, Any]]], relatorio: RelatorioImportacao) -> None:
+        for linha, dados in registros:
+            if not dados:
+                relatorio.rejeitar(linha, "Registro inválido")
+                continue
+            try:
+                quarto = Quarto(
+                    int(dados["numero"]),
+                    dados["tipo"],
+                    float(dados["preco"]),
+                    converter_booleano(dados.get("disponivel", True))
+                )
+            except KeyError as e:
+                relatorio.rejeitar(linha, f"Campo obrigatório ausente: {e}")
+                continue
+            except (TypeError, ValueError):
+                relatorio.rejeitar(linha, "Número ou preço inválido")
+                continue
+            if quarto.numero in self._quartos:
+                relatorio.rejeitar(linha, f"Quarto já existe: {quarto.numero}")
+            else:
+                self.adicionar_quarto(quarto)
+                relatorio.importados += 1
+    
+    def _importar_reservas(self, registros: Iterator[Tuple[int, Dict[str, Any]]], relatorio: RelatorioImportacao) -> None:
+        # As linhas são conferidas na ordem do arquivo: em uma sobreposição vale a primeira,
+        # como se cada linha tivesse sido cadastrada pela tela. As reservas aceitas de cada
+        # quarto ficam em um índice próprio até a inserção
+        do_arquivo: Dict[int, IntervalosDoQuarto] = {}
+        ids_no_arquivo = set()
+        aceitas: List[Reserva] = []
+        for linha, dados in registros:
+            if not dados:
+                relatorio.rejeitar(linha, "Registro inválido")
+                continue
+            try:
+                cliente_id, quarto_numero = dados["cliente_id"], dados["quarto_numero"]
+                check_in, check_out = dados["check_in"], dados["check_out"]
+            except KeyError as e:
+                relatorio.rejeitar(linha, f"Campo obrigatório ausente: {e}")
+                continue
+            try:
+                quarto_numero = int(quarto_numero)
+            except (TypeError, ValueError):
+                relatorio.rejeitar(linha, "Número do quarto inválido")
+                continue
+            if not isinstance(check_in, str) or not isinstance(check_out, str):
+                relatorio.rejeitar(linha, "Data inválida (use DD-MM-YYYY)")
+                continue
+            reserva_id = dados.get("id") or None
+            if reserva_id is not None and not isinstance(reserva_id, str):
+                relatorio.rejeitar(linha, "Id da reserva inválido")
+                continue
+            cliente = self._clientes.get(cliente_id) if isinstance(cliente_id, str) else None
+            reserva = Reserva(cliente.id if cliente else cliente_id, quarto_numero, check_in, check_out,
+                              dados.get("status") or "Pendente", reserva_id)
+            inicio, fim = reserva.dia_check_in, reserva.dia_check_out
+            ocupa = reserva.status != "Cancelada"
+            cadastradas = self._intervalos_por_quarto.get(quarto_numero)
+            do_quarto = do_arquivo.get(quarto_numero)
+            
+            if reserva.id in self._reservas or reserva.id in ids_no_arquivo:
+                relatorio.rejeitar(linha, f"Reserva já existe: {reserva.id}")
+            elif cliente is None:
+                relatorio.rejeitar(linha, f"Cliente não encontrado: {reserva.cliente_id}")
+            elif quarto_numero not in self._quartos:
+                relatorio.rejeitar(linha, f"Quarto não encontrado: {quarto_numero}")
+            elif inicio is None or fim is None:
+                relatorio.rejeitar(linha, "Data inválida (use DD-MM-YYYY)")
+            elif fim <= inicio:
+                relatorio.rejeitar(linha, "Check-out deve ser posterior ao check-in")
+            elif ocupa and cadastradas is not None and cadastradas.sobrepoe(inicio, fim):
+                relatorio.rejeitar(linha, "Quarto indisponível no período")
+            elif ocupa and do_quarto is not None and do_quarto.sobrepoe(inicio, fim):
+                relatorio.rejeitar(linha, "Sobreposição com outra reserva do arquivo")
+            else:
+                if ocupa:
+                    do_arquivo.setdefault(quarto_numero, IntervalosDoQuarto()).adicionar(inicio, fim, reserva.id)
+                ids_no_arquivo.add(reserva.id)
+                aceitas.append(reserva)
+        
+        for reserva in aceitas:
+            self._inserir_reserva(reserva)
+            self._registrar_operacao("salvar", "reserva", reserva.to_dict())
+        relatorio.importados += len(aceitas)
+    
+    @leitura
+    def listar_clientes(self) -> List[Cliente]:
+        return list(self._clientes.values())
+    
+    @leitura
+    def pagina_de_clientes(self, deslocamento: int, quantidade: int) -> List[Cliente]:
+        return list(islice(self._clientes.values(), deslocamento, deslocamento + quantidade))
+    
+    @leitura
+    def listar_quartos(self) -> List[Quarto]:
+        return list(self._quartos.values())
+    
+    @leitura
+    def pagina_de_quartos(self, deslocamento: int, quantidade: int) -> List[Quarto]:
+        return list(islice(self._quartos.values(), deslocamento, deslocamento + quantidade))
+    
+    @medir()
+    @leitura
+    def listar_quartos_disponiveis(self, check_in: str = None, check_out: str = None) -> List[Quarto]:
+        # Se não foram fornecidas datas, retornar todos os quartos marcados como disponíveis
+        if not check_in or not check_out:
+            return [q for q in self._quartos.values() if q.disponivel]
+        
+        # Com o período inteiro no calendário, um OR das noites dá todos os quartos ocupados
+        inicio = converter_data_para_ordinal(check_in)
+        fim = converter_data_para_ordinal(check_out)
+        calendario = self._calendario_atual()
+        if inicio is not None and fim is not None and fim > inicio and calendario.cobre(inicio, fim):
+            ocupados = calendario.quartos_ocupados(inicio, fim)
+            return [q for q in self._quartos.values() if q.numero not in ocupados]
+        
+        # Se foram fornecidas datas, verificar disponibilidade para o período
+        quartos_disponiveis = []
+        for quarto in self._quartos.values():
+            if self._verificar_disponibilidade(quarto.numero, check_in, check_out):
+                quartos_disponiveis.append(quarto)
+        
+        return quartos_disponiveis
+    
+    @medir()
+    @leitura
+    def buscar_quartos(self, check_in: str, noites: int, flexibilidade: int = 0, tipo: Optional[str] = None,
+                       preco_minimo: Optional[float] = None, preco_maximo: Optional[float] = None,
+                       capacidade_minima: Optional[int] = None, limite: Optional[int] = None) -> List[OpcaoDeHospedagem]:
+        """Busca quartos livres por `noites` noites com check-in até `flexibilidade` dias antes ou depois
+        
+        Retorna uma opção por quarto (a data mais próxima da pedida), da mais barata para a mais cara.
+        A flexibilidade é limitada ao horizonte do calendário de ocupação.
+        """
+        dia = converter_data_para_ordinal(check_in)
+        if dia is None or noites < 1 or flexibilidade < 0:
+            return []
+        flexibilidade = min(flexibilidade, CalendarioDeOcupacao.HORIZONTE)
+        candidatos = [
+            q for q in self._quartos.values()
+            if q.disponivel
+            and (tipo is None or q.tipo == tipo)
+            and (preco_minimo is None or q.preco >= preco_minimo)
+            and (preco_maximo is None or q.preco <= preco_maximo)
+            and (capacidade_minima is None or q.capacidade >= capacidade_minima)
+        ]
+        
+        # Check-ins flexíveis não podem cair antes de hoje (o calendário também começa hoje)
+        calendario = self._calendario_atual()
+        primeiro, ultimo = max(dia - flexibilidade, calendario.dia_inicial), dia + flexibilidade
+        if primeiro > ultimo:
+            return []
+        usar_calendario = calendario.cobre(primeiro, ultimo + noites)
+        opcoes = []
+        for quarto in candidatos:
+            if usar_calendario:
+                inicios = calendario.inicios_livres(quarto.numero, primeiro, ultimo, noites)
+                inicio = min(inicios, key=lambda d: (abs(d - dia), d)) if inicios else None
+            else:
+                # Datas mais próximas da pedida primeiro: com o quarto livre na data pedida,
+                # só ela é verificada
+                intervalos = self._intervalos_por_quarto.get(quarto.numero)
+                inicio = next((d for d in _dias_por_proximidade(dia, primeiro, ultimo)
+                               if intervalos is None or not intervalos.sobrepoe(d, d + noites)), None)
+            if inicio is not None:
+                opcoes.append(OpcaoDeHospedagem(quarto, inicio, noites, inicio - dia))
+        
+        opcoes.sort(key=lambda o: (o.total, abs(o.deslocamento), o.deslocamento, o.quarto.numero))
+        return opcoes[:limite] if limite is not None else opcoes
+    
+    @medir()
+    @leitura
+    def listar_reservas(self) -> List[Reserva]:
+        return self._materializar_reservas(self._reservas)
+    
+    @medir()
+    @leitura
+    def pagina_de_reservas(self, deslocamento: int, quantidade: int) -> List[Reserva]:
+        """Reservas de uma página da lista (na ordem de listar_reservas), materializando só as da página"""
+        ids = list(islice(self._reservas, deslocamento, deslocamento + quantidade))
+        return [self._materializar_reserva(reserva_id) for reserva_id in ids]
+    
+    @medir()
+    @leitura
+    def listar_reservas_por_cliente(self, cliente_id: str) -> List[Reserva]:
+        return self._materializar_reservas(self._reservas_por_cliente.get(cliente_id, {}))
+    
+    @medir()
+    @leitura
+    def listar_reservas_por_quarto(self, quarto_numero: int) -> List[Reserva]:
+        return self._materializar_reservas(self._reservas_por_quarto.get(quarto_numero, {}))
+    
+    @leitura
+    def estadias_do_quarto(self, quarto_numero: int, inicio: int, fim: int) -> List[Tuple[int, int, str]]:
+        """Estadias ativas (início, fim, id da reserva) do quarto com noites entre os dias ordinais inicio e fim"""
+        intervalos = self._intervalos_por_quarto.get(quarto_numero)
+        return intervalos.estadias_no_periodo(inicio, fim) if intervalos is not None else []
+    
+    def percorrer_estadias(self) -> Iterator[Tuple[int, Optional[int], Optional[int], str]]:
+        """Percorre (quarto, dia de check-in, dia de check-out, status) de todas as reservas
+        
+        As reservas encerradas não são materializadas; usado pelas análises em lote (analise.py)
+        """
+        # Percorre uma cópia da lista, para não segurar a trava enquanto quem chamou consome os itens
+        with self._trava.leitura():
+            reservas = list(self._reservas.values())
+        for reserva in reservas:
+            if isinstance(reserva, Reserva):
+                yield reserva.quarto_numero, reserva.dia_check_in, reserva.dia_check_out, reserva.status
+            else:
+                _, quarto_numero, check_in, check_out, status, _ = reserva
+                yield (quarto_numero, converter_data_para_ordinal(check_in),
+                       converter_data_para_ordinal(check_out), status)
+    
+    def _registrar_operacao(self, operacao: str, tipo: str, dados: Any) -> None:
+        # Dentro de uma transação a gravação fica para o final
+        if self._registros_pendentes is not None:
+            self._registros_pendentes.append((operacao, tipo, dados))
+            return
+        self._armazenamento.registrar(operacao, tipo, dados)
+        if self._armazenamento.precisa_compactar:
+            self._salvar_dados()
+    
+    def _aplicar_registro(self, registro: Dict[str, Any]) -> None:
+        operacao, tipo, dados = registro["op"], registro["tipo"], registro["dados"]
+        if operacao == "remover":
+            if tipo == "cliente":
+                self._excluir_cliente(dados)
+            elif tipo == "quarto":
+                self._excluir_quarto(dados)
+        elif tipo == "cliente":
+            cliente = Cliente.from_dict(dados)
+            self._clientes[cliente.id] = cliente
+        elif tipo == "quarto":
+            quarto = Quarto.from_dict(dados)
+            self._quartos[quarto.numero] = quarto
+            self._marcar_disponibilidade_do_quarto(quarto)
+        elif tipo == "reserva":
+            reserva = self.obter_reserva_por_id(dados["id"])
+            if reserva:
+                self._alterar_reserva(reserva, dados["check_in"], dados["check_out"], dados["status"])
+            else:
+                dados["cliente_id"] = self._uuid_cliente(dados["cliente_id"])
+                self._inserir_reserva(Reserva.from_dict(dados))
+    
+    @medir()
+    def _salvar_dados(self) -> None:
+        dados = {
+            "clientes": [c.to_dict() for c in self._clientes.values()],
+            "quartos": [q.to_dict() for q in self._quartos.values()],
+            "reservas": [
+                r.to_dict() if isinstance(r, Reserva) else dict(zip(Reserva.CAMPOS, r))
+                for r in self._reservas.values()
+            ]
+        }
+        self._armazenamento.salvar_tudo(dados)
+    
+    @medir()
+    def _carregar_dados(self) -> None:
+        itens = self._armazenamento.carregar()
+        if itens is None:
+            # Criar alguns dados iniciais
+            self._criar_dados_iniciais()
+            return
+        
+        # Os itens chegam um a um, sem carregar o arquivo inteiro na memória. Eles vão para
+        # dicionários locais, que só substituem os do gerenciador depois da leitura completa
+        clientes: Dict[str, Cliente] = {}
+        quartos: Dict[int, Quarto] = {}
+        reservas: Dict[str, Union[Reserva, tuple]] = {}
+        reservas_nao_carregadas = 0
+        # Instância única de cada UUID de cliente, compartilhada pelas suas reservas
+        uuids: Dict[str, str] = {}
+        try:
+            for secao, dados in itens:
+                if secao == "reservas":
+                    dados["cliente_id"] = uuids.setdefault(dados["cliente_id"], dados["cliente_id"])
+                    if dados["status"] in Reserva.STATUS_ENCERRADOS:
+                        reservas[dados["id"]] = (
+                            dados["cliente_id"], dados["quarto_numero"], intern(dados["check_in"]),
+                            intern(dados["check_out"]), intern(dados["status"]), dados["id"]
+                        )
+                        reservas_nao_carregadas += 1
+                    else:
+                        reserva = Reserva.from_dict(dados)
+                        reservas[reserva.id] = reserva
+                elif secao == "clientes":
+                    cliente = Cliente.from_dict(dados)
+                    uuids.setdefault(cliente.id, cliente.id)
+                    clientes[cliente.id] = cliente
+                elif secao == "quartos":
+                    quarto = Quarto.from_dict(dados)
+                    quartos[quarto.numero] = quarto
+        except Exception as e:
+            # Um item inválido interrompe a carga: o gerenciador não é criado com dados
+            # parciais, e o arquivo (e o journal) não é substituído pelos dados iniciais
+            logger.error("Erro ao carregar dados; o arquivo não foi alterado: %s", e)
+            self._armazenamento.fechar()
+            raise
+        
+        self._clientes = clientes
+        self._quartos = quartos
+        self._quartos_indisponiveis = {q.numero for q in quartos.values() if not q.disponivel}
+        self._reservas = reservas
+        self._reservas_nao_carregadas = reservas_nao_carregadas
+        self._reconstruir_indice()
+        
+        # Reaplicar as alterações gravadas depois do snapshot (journal)
+        for registro in self._armazenamento.registros_pendentes():
+            try:
+                self._aplicar_registro(registro)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error("Erro ao aplicar registro do journal: %s", e)
+        if self._armazenamento.precisa_compactar:
+            self._salvar_dados()
+    
+    def _criar_dados_iniciais(self) -> None:
+        # Criar alguns quartos iniciais
+        quartos = [
+            Quarto(101, "Single", 150.0),
+            Quarto(102, "Single", 150.0),
+            Quarto(201, "Double", 250.0),
+            Quarto(202, "Double", 250.0),
+            Quarto(301, "Suite", 400.0),
+        ]
+        self._quartos = {q.numero: q for q in quartos}
+        
+        # Salvar os dados iniciais
+        self._salvar_dados()
+
+
+# Gerenciador único do processo (veja obter_gerenciador_compartilhado)
+_gerenciador_compartilhado: Optional[GerenciadorDeReservas] = None
+_trava_gerenciador_compartilhado = threading.Lock()
+
+
+def obter_gerenciador_compartilhado(**opcoes) -> GerenciadorDeReservas:
+    """Gerenciador do processo, criado e carregado na primeira chamada (com as `opcoes` dadas)
+    
+    No modo web o Flet chama main() uma vez por sessão do navegador; todas as sessões usam
+    o mesmo gerenciador, em vez de cada uma carregar sua cópia dos dados. As gravações são
+    feitas em segundo plano e concluídas ao encerrar o processo.
+    """
+    global _gerenciador_compartilhado
+    with _trava_gerenciador_compartilhado:
+        if _gerenciador_compartilhado is None:
+            opcoes.setdefault("gravacao_em_segundo_plano", True)
+            _gerenciador_compartilhado = GerenciadorDeReservas(**opcoes)
+        return _gerenciador_compartilhado
+
+
+# Função auxiliar para formatar data
+def formatar_data(data: datetime) -> str:
+    """Converte um objeto datetime para string no formato DD-MM-YYYY"""
+    return data.strftime("%d-%m-%Y")
@@ -0,0 +1,52 @@
+import json
+import os
+from typing import List, Dict, Any, Iterator, Tuple
+
+# Leitura dos arquivos de importação em lote (CSV com cabeçalho ou JSONL, um objeto
+# por linha). As colunas seguem os campos de to_dict de cada entidade.
+
+VALORES_VERDADEIROS = {"1", "true", "sim", "s", "yes", "y"}
+
+
+class RelatorioImportacao:
+    """Resultado de uma importação: quantidade importada e linhas rejeitadas com o motivo"""
+    
+    def __init__(self, tipo: str):
+        self.tipo = tipo
+        self.importados = 0
+        self.rejeitados: List[Tuple[int, str]] = []
+    
+    def rejeitar(self, linha: int, motivo: str) -> None:
+        self.rejeitados.append((linha, motivo))
+    
+    def __repr__(self) -> str:
+        return f"RelatorioImportacao({self.tipo}: {self.importados} importados, {len(self.rejeitados)} rejeitados)"
+
+
+def ler_registros(caminho: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Percorre o arquivo linha a linha, retornando (número da linha, registro)"""
+    extensao = os.path.splitext(caminho)[1].lower()
+    with open(caminho, "r", newline="", encoding="utf-8") as arquivo:
+        if extensao == ".csv":
+            # Importado aqui: a importação de arquivos é rara e o csv não pesa no início do programa
+            import csv
+            leitor = csv.DictReader(arquivo)
+            for registro in leitor:
+                yield leitor.line_num, registro
+        elif extensao in (".jsonl", ".ndjson"):
+            for numero_linha, linha in enumerate(arquivo, start=1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    registro = None
+                yield numero_linha, registro if isinstance(registro, dict) else {}
+        else:
+            raise ValueError(f"Formato de arquivo não suportado para importação: {caminho}")
+
+
+def converter_booleano(valor: Any) -> bool:
+    if isinstance(valor, bool):
+        return valor
+    return str(valor).strip().lower() in VALORES_VERDADEIROS
@@ -0,0 +1,1478 @@
+import flet as ft
+import logging
+from datetime import date, datetime, timedelta
+import threading
+from typing import List, Dict, Optional, Any, Callable
+
+from assincrono import GerenciadorAssincrono
+from dominio import AlteracaoDeDados, Cliente, Quarto, Reserva, formatar_data, obter_gerenciador_compartilhado
+
+# Interface Flet do sistema. Carregada por main.py somente quando o aplicativo é aberto,
+# para que scripts que usam apenas o domínio (dominio.py) não importem o Flet
+
+logger_ui = logging.getLogger("hotel.ui")
+
+
+class ListaPaginada:
+    """ListView que monta apenas as páginas já exibidas, carregando a próxima ao rolar até o fim
+    
+    Os cards ficam associados à chave de cada item, para que uma alteração troque,
+    inclua ou retire apenas o card afetado em vez de remontar a lista.
+    """
+    
+    TAMANHO_PAGINA = 50
+    # Distância do fim da lista (em pixels) a partir da qual a próxima página é carregada
+    MARGEM_ROLAGEM = 300
+    
+    def __init__(self, buscar_pagina: Callable[[int, int], List[Any]], chave: Callable[[Any], Any],
+                 criar_card: Callable[[Any], Optional[ft.Control]], tamanho_pagina: int = TAMANHO_PAGINA,
+                 trava: Optional[threading.RLock] = None):
+        self.lista = ft.ListView(expand=True, spacing=10, padding=20, on_scroll=self._ao_rolar)
+        self._buscar_pagina = buscar_pagina
+        self._chave = chave
+        self._criar_card = criar_card
+        self._tamanho_pagina = tamanho_pagina
+        # Card de cada item já carregado (None quando o item não é exibido)
+        self._cards: Dict[Any, Optional[ft.Control]] = {}
+        self._carregados = 0
+        self._esgotada = False
+        # Rolagem, navegação e avisos de alteração rodam em threads diferentes do Flet:
+        # toda alteração da lista passa por esta trava (compartilhada pelas listas da sessão)
+        self.trava = trava or threading.RLock()
+    
+    def reiniciar(self) -> None:
+        """Descarta os cards e monta somente a primeira página"""
+        with self.trava:
+            self.lista.controls.clear()
+            self._cards = {}
+            self._carregados = 0
+            self._esgotada = False
+            self.carregar_mais()
+    
+    def carregar_mais(self) -> bool:
+        with self.trava:
+            if self._esgotada:
+                return False
+            itens = self._buscar_pagina(self._carregados, self._tamanho_pagina)
+            self._carregados += len(itens)
+            self._esgotada = len(itens) < self._tamanho_pagina
+            for item in itens:
+                card = self._criar_card(item)
+                self._cards[self._chave(item)] = card
+                if card is not None:
+                    self.lista.controls.append(card)
+            return bool(itens)
+    
+    def inserir_item(self, item: Any) -> None:
+        with self.trava:
+            # Um item que já tem card (aviso repetido) é apenas atualizado
+            if self._chave(item) in self._cards:
+                self.atualizar_item(item)
+                return
+            # Itens novos ficam no fim da lista; se ela ainda não chegou ao fim, aparecem ao rolar
+            if not self._esgotada:
+                return
+            card = self._criar_card(item)
+            self._cards[self._chave(item)] = card
+            self._carregados += 1
+            if card is not None:
+                self.lista.controls.append(card)
+    
+    def atualizar_item(self, item: Any) -> None:
+        with self.trava:
+            chave = self._chave(item)
+            card = self._cards.get(chave)
+            if card is None:
+                return
+            novo_card = self._criar_card(item)
+            self._cards[chave] = novo_card
+            posicao = self.lista.controls.index(card)
+            if novo_card is None:
+                del self.lista.controls[posicao]
+            else:
+                self.lista.controls[posicao] = novo_card
+    
+    def remover_item(self, chave: Any) -> None:
+        with self.trava:
+            if chave not in self._cards:
+                return
+            card = self._cards.pop(chave)
+            # O item saiu das páginas já lidas: a próxima página começa uma posição antes
+            self._carregados -= 1
+            if card is not None:
+                self.lista.controls.remove(card)
+    
+    def _ao_rolar(self, e) -> None:
+        # Perto do fim: monta e envia apenas os cards da próxima página
+        # (versões mais novas do Flet informam a distância restante em extent_after)
+        restante = getattr(e, "extent_after", None)
+        if restante is None:
+            restante = e.max_scroll_extent - e.pixels
+        with self.trava:
+            if restante <= self.MARGEM_ROLAGEM and self.carregar_mais():
+                self.lista.update()
+
+
+# Dimensões do mapa de reservas (quartos nas linhas, dias nas colunas). O mapa mostra
+# uma janela de DIAS_NO_MAPA dias e as setas carregam a janela vizinha; não há rolagem
+# horizontal, já que a lista de quartos rola na vertical carregando as linhas aos poucos
+DIAS_NO_MAPA = 14
+LARGURA_DIA_MAPA = 44
+ALTURA_LINHA_MAPA = 36
+LARGURA_ROTULO_MAPA = 130
+
+
+# Interface gráfica com Flet
+def montar_interface(page: ft.Page):
+    # Configurações da página
+    page.title = "Refúgio dos Sonhos - Sistema de Gerenciamento"
+    page.theme_mode = ft.ThemeMode.LIGHT
+    page.window_width = 1000
+    page.window_height = 800
+    page.padding = 20
+    
+    # Gerenciador de reservas do processo, compartilhado com as outras sessões (no modo web)
+    gerenciador = obter_gerenciador_compartilhado()
+    # Handlers async usam a fachada: a operação roda num executor e o loop de eventos
+    # continua atendendo as outras sessões enquanto ela espera
+    gerenciador_assincrono = GerenciadorAssincrono(gerenciador)
+    
+    # Variáveis de estado
+    tela_atual = ft.Ref[str]()
+    tela_atual.current = "inicial"
+    
+    cliente_selecionado = ft.Ref[Cliente]()
+    
+    # Elementos da interface
+    # Clientes e reservas podem ser milhares: as listas montam uma página por vez
+    # e, depois de uma alteração, trocam apenas o card da entidade alterada. Uma única
+    # trava da sessão protege todas as listas (e a aplicação dos avisos, que altera várias)
+    trava_listas = threading.RLock()
+    paginas_quartos = ListaPaginada(gerenciador.pagina_de_quartos, lambda q: q.numero, lambda q: criar_card_quarto(q),
+                                    trava=trava_listas)
+    paginas_clientes = ListaPaginada(gerenciador.pagina_de_clientes, lambda c: c.id, lambda c: criar_card_cliente(c),
+                                     trava=trava_listas)
+    paginas_reservas = ListaPaginada(gerenciador.pagina_de_reservas, lambda r: r.id, lambda r: criar_card_reserva(r),
+                                     trava=trava_listas)
+    lista_quartos = paginas_quartos.lista
+    lista_clientes = paginas_clientes.lista
+    lista_reservas = paginas_reservas.lista
+    
+    # Mapa de reservas: só os dias da janela atual e as linhas de quartos já exibidas
+    # são montados; cada linha desenha apenas os blocos das estadias da janela
+    inicio_mapa = ft.Ref[int]()
+    inicio_mapa.current = date.today().toordinal()
+    paginas_mapa = ListaPaginada(gerenciador.pagina_de_quartos, lambda q: q.numero,
+                                 lambda q: criar_linha_mapa(q), tamanho_pagina=30, trava=trava_listas)
+    lista_mapa = paginas_mapa.lista
+    lista_mapa.spacing = 2
+    cabecalho_mapa = ft.Row(spacing=0)
+    texto_periodo_mapa = ft.Text(size=16, weight=ft.FontWeight.BOLD)
+    
+    # Contadores da tela inicial (atualizados também pelos avisos de alteração)
+    texto_quartos_disponiveis = ft.Text(size=24, weight=ft.FontWeight.BOLD)
+    texto_reservas_ativas = ft.Text(size=24, weight=ft.FontWeight.BOLD)
+    
+    cores_status = {
+        "Confirmada": ft.Colors.GREEN,
+        "Pendente": ft.Colors.ORANGE,
+        "Cancelada": ft.Colors.RED,
+        "Concluída": ft.Colors.BLUE
+    }
+    
+    # Campos de formulário
+    campo_nome = ft.TextField(label="Nome", width=300)
+    campo_telefone = ft.TextField(label="Telefone", width=300)
+    campo_email = ft.TextField(label="E-mail", width=300)
+    
+    dropdown_clientes = ft.Dropdown(label="Cliente", width=300)
+    dropdown_quartos = ft.Dropdown(label="Quarto", width=300)
+    
+    # Datas para os calendários
+    data_check_in = ft.Ref[datetime]()
+    data_check_in.current = datetime.now()
+    
+    data_check_out = ft.Ref[datetime]()
+    data_check_out.current = datetime.now() + timedelta(days=1)
+    
+    # Texto para exibir as datas selecionadas
+    texto_check_in = ft.Text(f"Check-in: {formatar_data(data_check_in.current)}")
+    texto_check_out = ft.Text(f"Check-out: {formatar_data(data_check_out.current)}")
+    
+    # Conteúdo principal
+    conteudo_principal = ft.Container(expand=True)
+    
+    # Funções auxiliares
+    def mostrar_snackbar(mensagem):
+        page.snack_bar = ft.SnackBar(
+            content=ft.Text(mensagem),
+            action="OK"
+        )
+        page.snack_bar.open = True
+        page.update()
+    
+    # Funções para atualizar listas
+    def criar_card_quarto(quarto):
+        # Disponibilidade de hoje (mantida pelo gerenciador a cada alteração)
+        disponivel = not gerenciador.quarto_ocupado_hoje(quarto.numero)
+        
+        # Definir cores e ícones com base na disponibilidade
+        cor_fundo = ft.Colors.GREEN_50 if disponivel else ft.Colors.RED_50
+        cor_borda = ft.Colors.GREEN if disponivel else ft.Colors.RED
+        icone = ft.Icons.CHECK_CIRCLE if disponivel else ft.Icons.DO_NOT_DISTURB
+        status_texto = "Disponível" if disponivel else "Ocupado"
+        
+        # Criar um card para o quarto com visual melhorado
+        card_quarto = ft.Container(
+            content=ft.Row([
+                # Ícone e informações do quarto
+                ft.Row([
+                    ft.Icon(
+                        name=ft.Icons.KING_BED,
+                        size=30,
+                        color=ft.Colors.BLUE_700
+                    ),
+                    ft.Column([
+                        ft.Text(
+                            f"Quarto {quarto.numero} - {quarto.tipo}",
+                            size=18,
+                            weight=ft.FontWeight.BOLD
+                        ),
+                        ft.Text(
+                            f"R$ {quarto.preco:.2f} / diária",
+                            size=14,
+                            color=ft.Colors.GREY_700
+                        )
+                    ], spacing=5)
+                ], spacing=15),
+                
+                # Indicador de status
+                ft.Container(
+                    content=ft.Row([
+                        ft.Icon(name=icone, color=cor_borda),
+                        ft.Text(status_texto, weight=ft.FontWeight.BOLD)
+                    ], spacing=5),
+                    padding=ft.padding.all(8),
+                    border_radius=ft.border_radius.all(15),
+                    bgcolor=cor_fundo
+                )
+            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            padding=ft.padding.all(15),
+            border_radius=ft.border_radius.all(10),
+            border=ft.border.all(1, cor_borda),
+            margin=ft.margin.only(bottom=5),
+            ink=True,  # Efeito de clique
+            on_click=lambda e, q=quarto: mostrar_opcoes_quarto(q) if disponivel else None
+        )
+        
+        return card_quarto
+    
+    def atualizar_lista_quartos():
+        paginas_quartos.reiniciar()
+        page.update()
+    
+    def mostrar_opcoes_quarto(quarto):
+        def fechar_dialogo(e):
+            dialogo.open = False
+            page.update()
+        
+        def fazer_reserva(e):
+            fechar_dialogo(e)
+            navegar_para("nova_reserva")
+        
+        # Criar o diálogo com opções para o quarto
+        dialogo = ft.AlertDialog(
+            title=ft.Text(f"Quarto {quarto.numero} - {quarto.tipo}"),
+            content=ft.Column([
+                ft.Text(f"Preço: R$ {quarto.preco:.2f} / diária"),
+                ft.Text("O que você deseja fazer com este quarto?")
+            ], tight=True, spacing=10),
+            actions=[
+                ft.ElevatedButton(
+                    "Fazer Reserva",
+                    icon=ft.Icons.BOOKMARK_ADD,
+                    on_click=fazer_reserva
+                ),
+                ft.TextButton("Fechar", on_click=fechar_dialogo)
+            ],
+            actions_alignment=ft.MainAxisAlignment.END
+        )
+        
+        page.dialog = dialogo
+        dialogo.open = True
+        page.update()
+    
+    def criar_card_cliente(cliente):
+        return ft.Card(
+            content=ft.Container(
+                content=ft.Column([
+                    ft.ListTile(
+                        leading=ft.Icon(ft.Icons.PERSON),
+                        title=ft.Text(cliente.nome),
+                        subtitle=ft.Column([
+                            ft.Text(f"Telefone: {cliente.telefone}"),
+                            ft.Text(f"E-mail: {cliente.email}")
+                        ])
+                    ),
+                    ft.Row([
+                        ft.TextButton("Editar", on_click=lambda e, c=cliente: editar_cliente(c)),
+                        ft.TextButton("Excluir", on_click=lambda e, c=cliente: excluir_cliente(c))
+                    ], alignment=ft.MainAxisAlignment.END)
+                ]),
+                padding=10
+            )
+        )
+    
+    def atualizar_lista_clientes():
+        paginas_clientes.reiniciar()
+        page.update()
+    
+    def criar_card_reserva(reserva):
+        cliente = gerenciador.obter_cliente_por_id(reserva.cliente_id)
+        quarto = gerenciador.obter_quarto_por_numero(reserva.quarto_numero)
+        
+        if not cliente or not quarto:
+            return None
+        
+        cor_status = cores_status.get(reserva.status, ft.Colors.GREY)
+        
+        # Add a visual indicator for canceled reservations
+        opacity = 1.0
+        if reserva.status == "Cancelada":
+            opacity = 0.6  # Make canceled reservations appear faded
+        
+        # Determinar se os botões de ação devem estar habilitados
+        # (desabilitar para reservas já canceladas ou concluídas)
+        botoes_habilitados = reserva.status not in ["Cancelada", "Concluída"]
+        
+        card_reserva = ft.Container(
+            content=ft.Column([
+                ft.ListTile(
+                    leading=ft.Icon(
+                        ft.Icons.BOOKMARK,
+                        color=cor_status,
+                        size=30
+                    ),
+                    title=ft.Text(
+                        f"Reserva de {cliente.nome}",
+                        size=18,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    subtitle=ft.Column([
+                        ft.Text(f"Quarto: {quarto.numero} - {quarto.tipo}"),
+                        ft.Text(f"Check-in: {reserva.check_in} | Check-out: {reserva.check_out}"),
+                        ft.Container(
+                            content=ft.Text(
+                                reserva.status,
+                                color=ft.Colors.WHITE,
+                                weight=ft.FontWeight.BOLD
+                            ),
+                            padding=ft.padding.symmetric(horizontal=10, vertical=5),
+                            border_radius=ft.border_radius.all(15),
+                            bgcolor=cor_status,
+                            margin=ft.margin.only(top=5)
+                        )
+                    ])
+                ),
+                ft.Row([
+                    ft.ElevatedButton(
+                        "Editar",
+                        icon=ft.Icons.EDIT,
+                        on_click=lambda e, r=reserva: editar_reserva(r),
+                        disabled=not botoes_habilitados
+                    ),
+                    ft.ElevatedButton(
+                        "Cancelar Reserva",
+                        icon=ft.Icons.CANCEL,
+                        on_click=lambda e, r=reserva: cancelar_reserva(r),
+                        style=ft.ButtonStyle(
+                            bgcolor=ft.Colors.RED if botoes_habilitados else ft.Colors.GREY,
+                            color=ft.Colors.WHITE
+                        ),
+                        disabled=not botoes_habilitados
+                    )
+                ], alignment=ft.MainAxisAlignment.END, spacing=10)
+            ]),
+            padding=15,
+            border_radius=10,
+            border=ft.border.all(1, cor_status),
+            margin=ft.margin.only(bottom=10),
+            opacity=opacity  # Add this line
+        )
+        
+        return card_reserva
+    
+    def atualizar_lista_reservas():
+        paginas_reservas.reiniciar()
+        logger_ui.debug("Lista de reservas atualizada com %d itens", len(lista_reservas.controls))
+        page.update()
+    
+    def criar_linha_mapa(quarto):
+        primeiro_dia = inicio_mapa.current
+        ultimo_dia = primeiro_dia + DIAS_NO_MAPA
+        
+        # Fundo da linha e um bloco por estadia, posicionado pelas noites dentro da janela
+        blocos = [
+            ft.Container(
+                width=DIAS_NO_MAPA * LARGURA_DIA_MAPA,
+                height=ALTURA_LINHA_MAPA,
+                bgcolor=ft.Colors.GREY_100,
+                border_radius=4
+            )
+        ]
+        for inicio, fim, reserva_id in gerenciador.estadias_do_quarto(quarto.numero, primeiro_dia, ultimo_dia):
+            reserva = gerenciador.obter_reserva_por_id(reserva_id)
+            cliente = gerenciador.obter_cliente_por_id(reserva.cliente_id)
+            nome = cliente.nome if cliente else ""
+            coluna_inicial = max(inicio, primeiro_dia) - primeiro_dia
+            coluna_final = min(fim, ultimo_dia) - primeiro_dia
+            blocos.append(
+                ft.Container(
+                    content=ft.Text(nome, size=12, color=ft.Colors.WHITE, no_wrap=True),
+                    left=coluna_inicial * LARGURA_DIA_MAPA + 1,
+                    top=4,
+                    width=(coluna_final - coluna_inicial) * LARGURA_DIA_MAPA - 2,
+                    height=ALTURA_LINHA_MAPA - 8,
+                    padding=ft.padding.symmetric(horizontal=6, vertical=4),
+                    border_radius=6,
+                    bgcolor=cores_status.get(reserva.status, ft.Colors.GREY),
+                    tooltip=f"{nome}\n{reserva.check_in} a {reserva.check_out} ({reserva.status})",
+                    # Como nos cards, reservas concluídas não podem ser editadas
+                    on_click=(lambda e, r=reserva: editar_reserva(r)) if reserva.status in Reserva.STATUS_ATIVOS else None
+                )
+            )
+        
+        return ft.Row([
+            ft.Container(
+                content=ft.Text(f"{quarto.numero} - {quarto.tipo}", weight=ft.FontWeight.BOLD),
+                width=LARGURA_ROTULO_MAPA
+            ),
+            ft.Stack(blocos, width=DIAS_NO_MAPA * LARGURA_DIA_MAPA, height=ALTURA_LINHA_MAPA)
+        ], spacing=0)
+    
+    def atualizar_mapa():
+        primeiro_dia = inicio_mapa.current
+        dias = [datetime.fromordinal(dia) for dia in range(primeiro_dia, primeiro_dia + DIAS_NO_MAPA)]
+        texto_periodo_mapa.value = f"{formatar_data(dias[0])} a {formatar_data(dias[-1])}"
+        cabecalho_mapa.controls = [ft.Container(width=LARGURA_ROTULO_MAPA)] + [
+            ft.Container(
+                content=ft.Text(dia.strftime("%d/%m"), size=11, color=ft.Colors.GREY_700),
+                width=LARGURA_DIA_MAPA,
+                alignment=ft.alignment.center
+            )
+            for dia in dias
+        ]
+        paginas_mapa.reiniciar()
+        page.update()
+    
+    def mover_mapa(dias):
+        # Navega para a janela anterior ou seguinte (ou volta para hoje com dias=None)
+        if dias is None:
+            inicio_mapa.current = date.today().toordinal()
+        else:
+            inicio_mapa.current += dias
+        atualizar_mapa()
+    
+    def atualizar_dropdown_clientes():
+        selecionado = dropdown_clientes.value
+        dropdown_clientes.options.clear()
+        
+        for cliente in gerenciador.listar_clientes():
+            dropdown_clientes.options.append(
+                ft.dropdown.Option(key=cliente.id, text=cliente.nome)
+            )
+        
+        # Mantém o cliente já escolhido, se ele continua na lista
+        if any(opcao.key == selecionado for opcao in dropdown_clientes.options):
+            dropdown_clientes.value = selecionado
+        elif dropdown_clientes.options:
+            dropdown_clientes.value = dropdown_clientes.options[0].key
+        
+        page.update()
+    
+    def atualizar_dropdown_quartos():
+        selecionado = dropdown_quartos.value
+        dropdown_quartos.options.clear()
+        
+        # Usar as datas selecionadas para verificar disponibilidade
+        check_in = formatar_data(data_check_in.current)
+        check_out = formatar_data(data_check_out.current)
+        
+        # Obter quartos disponíveis para o período selecionado
+        quartos_disponiveis = gerenciador.listar_quartos_disponiveis(check_in, check_out)
+        
+        for quarto in quartos_disponiveis:
+            dropdown_quartos.options.append(
+                ft.dropdown.Option(
+                    key=str(quarto.numero),
+                    text=f"Quarto {quarto.numero} - {quarto.tipo} - R$ {quarto.preco:.2f}"
+                )
+            )
+        
+        # Mantém o quarto já escolhido, se ele continua livre no período
+        if any(opcao.key == selecionado for opcao in dropdown_quartos.options):
+            dropdown_quartos.value = selecionado
+        elif dropdown_quartos.options:
+            dropdown_quartos.value = dropdown_quartos.options[0].key
+        else:
+            dropdown_quartos.value = None
+        
+        page.update()
+    
+    def atualizar_estatisticas():
+        painel = gerenciador.painel()
+        texto_quartos_disponiveis.value = f"{painel['quartos_livres']}/{painel['quartos']}"
+        texto_reservas_ativas.value = f"{painel['reservas_ativas']}"
+    
+    # Avisos de alteração: qualquer sessão que altere os dados (inclusive esta) faz o
+    # gerenciador avisar todas as sessões abertas. O aviso chega na thread de quem alterou
+    # e só entra na fila; a fila é aplicada em ordem numa thread da sessão, trocando
+    # apenas os cards afetados
+    alteracoes_recebidas: List[AlteracaoDeDados] = []
+    trava_alteracoes = threading.Lock()
+    
+    def receber_alteracao(alteracao):
+        with trava_alteracoes:
+            alteracoes_recebidas.append(alteracao)
+            # Com a fila já cheia, a aplicação já agendada também leva este aviso
+            if len(alteracoes_recebidas) > 1:
+                return
+        page.run_thread(aplicar_alteracoes)
+    
+    def aplicar_alteracao_na_lista(paginas, chave, item, tipo):
+        # O item pode ter sido removido depois do aviso: nesse caso sai da lista
+        if item is None:
+            paginas.remover_item(chave)
+        elif tipo == "criado":
+            paginas.inserir_item(item)
+        else:
+            paginas.atualizar_item(item)
+    
+    def aplicar_alteracoes():
+        # Com a trava das listas, rolagem e navegação não alteram as listas no meio do lote
+        with trava_listas:
+            with trava_alteracoes:
+                alteracoes = alteracoes_recebidas[:]
+                alteracoes_recebidas.clear()
+            if not alteracoes:
+                return
+            
+            quartos_afetados = set()
+            clientes_alterados = quartos_alterados = False
+            for alteracao in alteracoes:
+                # Um aviso com erro não impede a aplicação dos demais
+                try:
+                    if alteracao.entidade == "cliente":
+                        cliente = gerenciador.obter_cliente_por_id(alteracao.chave)
+                        aplicar_alteracao_na_lista(paginas_clientes, alteracao.chave, cliente, alteracao.tipo)
+                        if cliente is not None and alteracao.tipo == "alterado":
+                            # Os cards de reserva mostram o nome do cliente
+                            for reserva in gerenciador.listar_reservas_por_cliente(cliente.id):
+                                paginas_reservas.atualizar_item(reserva)
+                        clientes_alterados = True
+                    elif alteracao.entidade == "quarto":
+                        quarto = gerenciador.obter_quarto_por_numero(alteracao.chave)
+                        aplicar_alteracao_na_lista(paginas_quartos, alteracao.chave, quarto, alteracao.tipo)
+                        aplicar_alteracao_na_lista(paginas_mapa, alteracao.chave, quarto, alteracao.tipo)
+                        quartos_alterados = True
+                    elif alteracao.entidade == "reserva":
+                        reserva = gerenciador.obter_reserva_por_id(alteracao.chave)
+                        aplicar_alteracao_na_lista(paginas_reservas, alteracao.chave, reserva, alteracao.tipo)
+                        quartos_afetados.add(alteracao.quarto_numero)
+                        quartos_alterados = True
+                except Exception:
+                    logger_ui.exception("Erro ao aplicar %r", alteracao)
+            
+            # Ocupação de hoje (card do quarto) e blocos do mapa dos quartos com reservas alteradas
+            for numero in quartos_afetados:
+                quarto = gerenciador.obter_quarto_por_numero(numero)
+                if quarto is not None:
+                    paginas_quartos.atualizar_item(quarto)
+                    paginas_mapa.atualizar_item(quarto)
+            
+            # No formulário de reserva, as opções seguem os clientes e os quartos livres no período
+            if tela_atual.current == "nova_reserva":
+                if clientes_alterados:
+                    atualizar_dropdown_clientes()
+                if quartos_alterados:
+                    atualizar_dropdown_quartos()
+            atualizar_estatisticas()
+            page.update()
+    
+    # Funções para manipular quartos
+    def mostrar_dialogo_novo_quarto(e):
+        # Campos do formulário
+        campo_numero = ft.TextField(label="Número do Quarto", keyboard_type=ft.KeyboardType.NUMBER)
+        dropdown_tipo = ft.Dropdown(
+            label="Tipo de Quarto",
+            options=[
+                ft.dropdown.Option("Single"),
+                ft.dropdown.Option("Double"),
+                ft.dropdown.Option("Suite")
+            ],
+            value="Single"
+        )
+        campo_preco = ft.TextField(label="Preço por Diária", keyboard_type=ft.KeyboardType.NUMBER)
+        
+        def fechar_dialogo(e):
+            dialogo.open = False
+            page.update()
+        
+        def salvar_quarto(e):
+            try:
+                numero = int(campo_numero.value)
+                tipo = dropdown_tipo.value
+                preco = float(campo_preco.value)
+                
+                # Verificar se já existe um quarto com este número
+                if gerenciador.obter_quarto_por_numero(numero):
+                    mostrar_snackbar("Já existe um quarto com este número!")
+                    return
+                
+                quarto = Quarto(numero, tipo, preco)
+                gerenciador.adicionar_quarto(quarto)
+                
+                mostrar_snackbar("Quarto adicionado com sucesso!")
+                fechar_dialogo(e)
+            except ValueError:
+                mostrar_snackbar("Por favor, preencha todos os campos corretamente!")
+        
+        # Criar o diálogo
+        dialogo = ft.AlertDialog(
+            title=ft.Text("Adicionar Novo Quarto"),
+            content=ft.Column([
+                campo_numero,
+                dropdown_tipo,
+                campo_preco
+            ], tight=True, spacing=20, width=400),
+            actions=[
+                ft.TextButton("Cancelar", on_click=fechar_dialogo),
+                ft.TextButton("Salvar", on_click=salvar_quarto)
+            ],
+            actions_alignment=ft.MainAxisAlignment.END
+        )
+        
+        page.dialog = dialogo
+        dialogo.open = True
+        page.update()
+    
+    def mostrar_dialogo_editar_quarto(quarto):
+        # Campos do formulário
+        campo_numero = ft.TextField(label="Número do Quarto", value=str(quarto.numero), disabled=True)
+        dropdown_tipo = ft.Dropdown(
+            label="Tipo de Quarto",
+            options=[
+                ft.dropdown.Option("Single"),
+                ft.dropdown.Option("Double"),
+                ft.dropdown.Option("Suite")
+            ],
+            value=quarto.tipo
+        )
+        campo_preco = ft.TextField(label="Preço por Diária", value=str(quarto.preco))
+        switch_disponivel = ft.Switch(label="Disponível", value=quarto.disponivel)
+        
+        def fechar_dialogo(e):
+            dialogo.open = False
+            page.update()
+        
+        def salvar_quarto(e):
+            try:
+                tipo = dropdown_tipo.value
+                preco = float(campo_preco.value)
+                disponivel = switch_disponivel.value
+                
+                gerenciador.atualizar_quarto(quarto.numero, tipo, preco, disponivel)
+                
+                mostrar_snackbar("Quarto atualizado com sucesso!")
+                fechar_dialogo(e)
+            except ValueError:
+                mostrar_snackbar("Por favor, preencha todos os campos corretamente!")
+        
+        # Criar o diálogo
+        dialogo = ft.AlertDialog(
+            title=ft.Text(f"Editar Quarto {quarto.numero}"),
+            content=ft.Column([
+                campo_numero,
+                dropdown_tipo,
+                campo_preco,
+                switch_disponivel
+            ], tight=True, spacing=20, width=400),
+            actions=[
+                ft.TextButton("Cancelar", on_click=fechar_dialogo),
+                ft.TextButton("Salvar", on_click=salvar_quarto)
+            ],
+            actions_alignment=ft.MainAxisAlignment.END
+        )
+        
+        page.dialog = dialogo
+        dialogo.open = True
+        page.update()
+    
+    def excluir_quarto(quarto):
+        def confirmar_exclusao(e):
+            gerenciador.remover_quarto(quarto.numero)
+            mostrar_snackbar("Quarto excluído com sucesso!")
+            fechar_dialogo(e)
+        
+        def fechar_dialogo(e):
+            dialogo.open = False
+            page.update()
+        
+        # Criar o diálogo de confirmação
+        dialogo = ft.AlertDialog(
+            title=ft.Text("Confirmar Exclusão"),
+            content=ft.Text(f"Tem certeza que deseja excluir o Quarto {quarto.numero}?"),
+            actions=[
+                ft.TextButton("Cancelar", on_click=fechar_dialogo),
+                ft.TextButton("Excluir", on_click=confirmar_exclusao)
+            ],
+            actions_alignment=ft.MainAxisAlignment.END
+        )
+        
+        page.dialog = dialogo
+        dialogo.open = True
+        page.update()
+    
+    # Funções para manipular clientes
+    def salvar_cliente(e):
+        nome = campo_nome.value
+        telefone = campo_telefone.value
+        email = campo_email.value
+        
+        if not nome or not telefone or not email:
+            mostrar_snackbar("Por favor, preencha todos os campos!")
+            return
+        
+        if cliente_selecionado.current:
+            # Atualizar cliente existente
+            gerenciador.atualizar_cliente(
+                cliente_selecionado.current.id,
+                nome,
+                telefone,
+                email
+            )
+            mostrar_snackbar("Cliente atualizado com sucesso!")
+        else:
+            # Criar novo cliente
+            cliente = Cliente(nome, telefone, email)
+            gerenciador.adicionar_cliente(cliente)
+            mostrar_snackbar("Cliente adicionado com sucesso!")
+        
+        cliente_selecionado.current = None
+        navegar_para("clientes")
+    
+    def editar_cliente(cliente):
+        cliente_selecionado.current =  cliente
+        campo_nome.value = cliente.nome
+        campo_telefone.value = cliente.telefone
+        campo_email.value = cliente.email
+        
+        navegar_para("novo_cliente")
+    
+    def excluir_cliente(cliente):
+        def confirmar_exclusao(e):
+            gerenciador.remover_cliente(cliente.id)
+            mostrar_snackbar("Cliente excluído com sucesso!")
+            fechar_dialogo(e)
+        
+        def fechar_dialogo(e):
+            dialogo.open = False
+            page.update()
+        
+        # Criar o diálogo de confirmação
+        dialogo = ft.AlertDialog(
+            title=ft.Text("Confirmar Exclusão"),
+            content=ft.Text(f"Tem certeza que deseja excluir o cliente {cliente.nome}?"),
+            actions=[
+                ft.TextButton("Cancelar", on_click=fechar_dialogo),
+                ft.TextButton("Excluir", on_click=confirmar_exclusao)
+            ],
+            actions_alignment=ft.MainAxisAlignment.END
+        )
+        
+        page.dialog = dialogo
+        dialogo.open = True
+        page.update()
+    
+    # Funções para manipular reservas
+    def selecionar_data_check_in(e):
+        def handle_date_picker_change(e):
+            data_check_in.current = e.control.value
+            texto_check_in.value = f"Check-in: {formatar_data(data_check_in.current)}"
+            # Atualizar a lista de quartos disponíveis quando a data mudar
+            atualizar_dropdown_quartos()
+            page.update()
+        
+        # Abrir o DatePicker
+        page.open(
+            ft.DatePicker(
+                first_date=datetime.now(),
+                last_date=datetime(year=datetime.now().year + 5, month=12, day=31),
+                current_date=data_check_in.current,
+                on_change=handle_date_picker_change,
+            )
+        )
+    
+    def selecionar_data_check_out(e):
+        def handle_date_picker_change(e):
+            data_check_out.current = e.control.value
+            texto_check_out.value = f"Check-out: {formatar_data(data_check_out.current)}"
+            # Atualizar a lista de quartos disponíveis quando a data mudar
+            atualizar_dropdown_quartos()
+            page.update()
+        
+        # Abrir o DatePicker
+        page.open(
+            ft.DatePicker(
+                first_date=datetime.now(),
+                last_date=datetime(year=datetime.now().year + 5, month=12, day=31),
+                current_date=data_check_out.current,
+                on_change=handle_date_picker_change,
+            )
+        )
+    
+    async def salvar_reserva(e):
+        cliente_id = dropdown_clientes.value
+        quarto_numero = int(dropdown_quartos.value) if dropdown_quartos.value else None
+        
+        if not cliente_id or not quarto_numero or not data_check_in.current or not data_check_out.current:
+            mostrar_snackbar("Por favor, preencha todos os campos e selecione as datas!")
+            return
+        
+        # Converter datas para string no formato DD-MM-YYYY
+        check_in = formatar_data(data_check_in.current)
+        check_out = formatar_data(data_check_out.current)
+        
+        # Verificar se check-out é posterior a check-in
+        if data_check_out.current <= data_check_in.current:
+            mostrar_snackbar("A data de check-out deve ser posterior à data de check-in!")
+            return
+        
+        reserva = await gerenciador_assincrono.criar_reserva(cliente_id, quarto_numero, check_in, check_out)
+        
+        if reserva:
+            mostrar_snackbar("Reserva criada com sucesso!")
+            navegar_para("reservas")
+        else:
+            mostrar_snackbar("Não foi possível criar a reserva. Verifique a disponibilidade do quarto nas datas selecionadas.")
+    
+    def editar_reserva(reserva):
+        cliente = gerenciador.obter_cliente_por_id(reserva.cliente_id)
+        quarto = gerenciador.obter_quarto_por_numero(reserva.quarto_numero)
+        
+        # Usar as datas já interpretadas da reserva
+        if reserva.dia_check_in is not None and reserva.dia_check_out is not None:
+            data_check_in_atual = datetime.fromordinal(reserva.dia_check_in)
+            data_check_out_atual = datetime.fromordinal(reserva.dia_check_out)
+        else:
+            # Se houver erro no formato, usar datas atuais
+            data_check_in_atual = datetime.now()
+            data_check_out_atual = datetime.now() + timedelta(days=1)
+        
+        # Referências para as novas datas
+        nova_data_check_in = ft.Ref[datetime]()
+        nova_data_check_in.current = data_check_in_atual
+        
+        nova_data_check_out = ft.Ref[datetime]()
+        nova_data_check_out.current = data_check_out_atual
+        
+        # Textos para exibir as datas
+        texto_check_in_edit = ft.Text(f"Check-in: {formatar_data(data_check_in_atual)}")
+        texto_check_out_edit = ft.Text(f"Check-out: {formatar_data(data_check_out_atual)}")
+        
+        # Campos do formulário
+        campo_cliente = ft.TextField(label="Cliente", value=cliente.nome, disabled=True)
+        campo_quarto = ft.TextField(label="Quarto", value=f"{quarto.numero} - {quarto.tipo}", disabled=True)
+        
+        def selecionar_data_check_in_edit(e):
+            def handle_date_picker_change(e):
+                nova_data_check_in.current = e.control.value
+                texto_check_in_edit.value = f"Check-in: {formatar_data(nova_data_check_in.current)}"
+                page.update()
+            
+            # Abrir o DatePicker
+            page.open(
+                ft.DatePicker(
+                    first_date=datetime.now(),
+                    last_date=datetime(year=datetime.now().year + 5, month=12, day=31),
+                    current_date=nova_data_check_in.current,
+                    on_change=handle_date_picker_change,
+                )
+            )
+        
+        def selecionar_data_check_out_edit(e):
+            def handle_date_picker_change(e):
+                nova_data_check_out.current = e.control.value
+                texto_check_out_edit.value = f"Check-out: {formatar_data(nova_data_check_out.current)}"
+                page.update()
+            
+            # Abrir o DatePicker
+            page.open(
+                ft.DatePicker(
+                    first_date=datetime.now(),
+                    last_date=datetime(year=datetime.now().year + 5, month=12, day=31),
+                    current_date=nova_data_check_out.current,
+                    on_change=handle_date_picker_change,
+                )
+            )
+        
+        dropdown_status = ft.Dropdown(
+            label="Status",
+            options=[
+                ft.dropdown.Option(status) for status in Reserva.STATUS
+            ],
+            value=reserva.status
+        )
+        
+        def fechar_dialogo(e):
+            dialogo.open = False
+            page.update()
+        
+        async def salvar_reserva_edit(e):
+            check_in = formatar_data(nova_data_check_in.current)
+            check_out = formatar_data(nova_data_check_out.current)
+            status = dropdown_status.value
+            
+            # Verificar se check-out é posterior a check-in
+            if nova_data_check_out.current <= nova_data_check_in.current:
+                mostrar_snackbar("A data de check-out deve ser posterior à data de check-in!")
+                return
+            
+            if not await gerenciador_assincrono.atualizar_reserva(reserva.id, check_in, check_out, status):
+                mostrar_snackbar("Não foi possível atualizar a reserva. Verifique a disponibilidade do quarto nas datas selecionadas.")
+                return
+            
+            mostrar_snackbar("Reserva atualizada com sucesso!")
+            fechar_dialogo(e)
+        
+        # Criar o diálogo
+        dialogo = ft.AlertDialog(
+            title=ft.Text("Editar Reserva"),
+            content=ft.Column([
+                campo_cliente,
+                campo_quarto,
+                ft.Row([
+                    ft.Column([
+                        ft.Text("Check-in:"),
+                        texto_check_in_edit,
+                        ft.ElevatedButton(
+                            "Selecionar Data",
+                            icon=ft.Icons.CALENDAR_MONTH,
+                            on_click=selecionar_data_check_in_edit
+                        )
+                    ]),
+                    ft.Column([
+                        ft.Text("Check-out:"),
+                        texto_check_out_edit,
+                        ft.ElevatedButton(
+                            "Selecionar Data",
+                            icon=ft.Icons.CALENDAR_MONTH,
+                            on_click=selecionar_data_check_out_edit
+                        )
+                    ])
+                ]),
+                dropdown_status
+            ], tight=True, spacing=20, width=400),
+            actions=[
+                ft.TextButton("Cancelar", on_click=fechar_dialogo),
+                ft.TextButton("Salvar", on_click=salvar_reserva_edit)
+            ],
+            actions_alignment=ft.MainAxisAlignment.END
+        )
+        
+        page.dialog = dialogo
+        dialogo.open = True
+        page.update()
+    
+    def cancelar_reserva(reserva):
+        logger_ui.debug("cancelar_reserva chamada id=%s", reserva.id[:8])
+        try:
+            # Define as funções internas primeiro
+            async def confirmar_cancelamento(e):
+                resultado = await gerenciador_assincrono.cancelar_reserva(reserva.id) # Chama o manager
+                logger_ui.debug("Resultado do cancelamento id=%s: %s", reserva.id[:8], resultado)
+                
+                if resultado:
+                    mostrar_snackbar("Reserva cancelada com sucesso!")
+                else:
+                    mostrar_snackbar(f"Não foi possível cancelar a reserva (ID: {reserva.id[:8]}...). Verifique o status ou logs.")
+                    # Atualizar o card mesmo em caso de falha pode ser útil
+                    paginas_reservas.atualizar_item(reserva)
+                
+                # Fechar o diálogo DEPOIS de atualizar a lista e mostrar snackbar
+                # Garantir que 'dialogo' ainda existe no escopo (deve existir)
+                if 'dialogo' in locals() and dialogo is not None:
+                     dialogo.open = False
+                     page.update() # Atualiza a página para fechar o diálogo
+                else:
+                    logger_ui.error("Variável 'dialogo' não encontrada ao tentar fechar")
+                    page.update() # Tenta atualizar mesmo assim
+            
+            def fechar_dialogo(e):
+                 # Garantir que 'dialogo' ainda existe no escopo
+                if 'dialogo' in locals() and dialogo is not None:
+                    dialogo.open = False
+                    page.update()
+                else:
+                    logger_ui.error("Variável 'dialogo' não encontrada ao tentar fechar (em fechar_dialogo)")
+                    page.update()
+
+            
+            # --- Criação do Diálogo ---
+            dialogo = ft.AlertDialog(
+                modal=True, # Garante que é modal
+                title=ft.Text("Confirmar Cancelamento"),
+                content=ft.Column([
+                    ft.Icon(
+                        name=ft.Icons.WARNING_AMBER_ROUNDED,
+                        color=ft.Colors.AMBER,
+                        size=50
+                    ),
+                    ft.Text(
+                        "Tem certeza que deseja cancelar esta reserva?",
+                        text_align=ft.TextAlign.CENTER
+                    ),
+                    ft.Text(
+                        "Esta ação não pode ser desfeita.",
+                        size=12,
+                        color=ft.Colors.GREY,
+                        text_align=ft.TextAlign.CENTER
+                    )
+                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
+                actions=[
+                    ft.TextButton(
+                        "Não",
+                        on_click=fechar_dialogo # Usa a função interna
+                    ),
+                    ft.ElevatedButton(
+                        "Sim, Cancelar",
+                        on_click=confirmar_cancelamento, # Usa a função interna
+                        style=ft.ButtonStyle(
+                            bgcolor=ft.Colors.RED,
+                            color=ft.Colors.WHITE
+                        )
+                    )
+                ],
+                actions_alignment=ft.MainAxisAlignment.END
+            )
+            
+            # --- Tentativa de abrir o diálogo ---
+            page.dialog = dialogo
+            dialogo.open = True
+            page.update()
+            logger_ui.debug("Diálogo de cancelamento aberto id=%s", reserva.id[:8])
+        
+        except Exception as ErroUI:
+            # Captura QUALQUER erro que ocorra dentro desta função
+            logger_ui.exception("Erro na função cancelar_reserva da interface id=%s", reserva.id[:8])
+            mostrar_snackbar(f"Erro interno ao tentar iniciar cancelamento: {ErroUI}")
+    
+    # Funções de navegação
+    def navegar_para(tela):
+        tela_atual.current = tela
+        
+        if tela == "inicial":
+            mostrar_tela_inicial()
+        elif tela == "clientes":
+            mostrar_tela_clientes()
+        elif tela == "novo_cliente":
+            mostrar_formulario_cliente()
+        elif tela == "nova_reserva":
+            mostrar_formulario_reserva()
+        elif tela == "reservas":
+            mostrar_tela_reservas()
+        elif tela == "mapa":
+            mostrar_mapa_reservas()
+    
+    # Funções para mostrar telas
+    def mostrar_tela_inicial():
+        atualizar_lista_quartos()
+        
+        # Botões de ação para a tela inicial
+        botoes_acao = ft.Row([
+            ft.ElevatedButton(
+                text="Fazer Nova Reserva",
+                icon=ft.Icons.ADD_CIRCLE,
+                on_click=lambda e: navegar_para("nova_reserva"),
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.BLUE_700,
+                    color=ft.Colors.WHITE
+                )
+            ),
+            ft.ElevatedButton(
+                text="Gerenciar Clientes",
+                icon=ft.Icons.PEOPLE,
+                on_click=lambda e: navegar_para("clientes"),
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.GREEN_700,
+                    color=ft.Colors.WHITE
+                )
+            ),
+            ft.ElevatedButton(
+                text="Ver Reservas",
+                icon=ft.Icons.LIST_ALT,
+                on_click=lambda e: navegar_para("reservas"),
+                style=ft.ButtonStyle(
+                    bgcolor=ft.Colors.ORANGE_700,
+                    color=ft.Colors.WHITE
+                )
+            )
+        ], alignment=ft.MainAxisAlignment.CENTER, spacing=20)
+        
+        # Estatísticas rápidas (contadores mantidos pelo gerenciador)
+        atualizar_estatisticas()
+        
+        estatisticas = ft.Row([
+            ft.Container(
+                content=ft.Column([
+                    ft.Text("Quartos Disponíveis", size=14, color=ft.Colors.GREEN),
+                    texto_quartos_disponiveis
+                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                padding=20,
+                border_radius=10,
+                bgcolor=ft.Colors.GREEN_50,
+                width=200
+            ),
+            ft.Container(
+                content=ft.Column([
+                    ft.Text("Reservas Ativas", size=14, color=ft.Colors.BLUE),
+                    texto_reservas_ativas
+                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                padding=20,
+                border_radius=10,
+                bgcolor=ft.Colors.BLUE_50,
+                width=200
+            )
+        ], alignment=ft.MainAxisAlignment.CENTER, spacing=20)
+        
+        # Título da página com estilo melhorado
+        titulo = ft.Container(
+            content=ft.Text(
+                "Visão Geral dos Quartos",
+                size=28,
+                weight=ft.FontWeight.BOLD,
+                color=ft.Colors.WHITE
+            ),
+            padding=ft.padding.symmetric(vertical=15),
+            border_radius=ft.border_radius.only(bottom_left=10, bottom_right=10),
+            bgcolor=ft.Colors.BLUE_700,
+            alignment=ft.alignment.center
+        )
+        
+        # Subtítulo com informações
+        subtitulo = ft.Container(
+            content=ft.Text(
+                "Clique em um quarto disponível para ver opções",
+                size=16,
+                italic=True,
+                color=ft.Colors.GREY_700
+            ),
+            margin=ft.margin.only(bottom=10),
+            alignment=ft.alignment.center
+        )
+        
+        conteudo_principal.content = ft.Column([
+            titulo,
+            ft.Container(height=20),  # Espaçamento
+            estatisticas,
+            ft.Container(height=20),  # Espaçamento
+            botoes_acao,
+            ft.Container(height=20),  # Espaçamento
+            subtitulo,
+            lista_quartos
+        ], alignment=ft.MainAxisAlignment.START, expand=True)
+        
+        page.update()
+    
+    def mostrar_tela_clientes():
+        atualizar_lista_clientes()
+        
+        conteudo_principal.content = ft.Column([
+            ft.Row([
+                ft.Text("Gerenciamento de Clientes", size=24, weight=ft.FontWeight.BOLD)
+            ], alignment=ft.MainAxisAlignment.CENTER),
+            ft.Row([
+                ft.ElevatedButton(
+                    text="Adicionar Novo Cliente",
+                    icon=ft.Icons.PERSON_ADD,
+                    on_click=lambda e: navegar_para("novo_cliente")
+                )
+            ], alignment=ft.MainAxisAlignment.CENTER),
+            lista_clientes
+        ], alignment=ft.MainAxisAlignment.START, expand=True)
+        
+        page.update()
+    
+    def mostrar_formulario_cliente():
+        # Limpar campos se não estiver editando
+        if not cliente_selecionado.current:
+            campo_nome.value = ""
+            campo_telefone.value = ""
+            campo_email.value = ""
+        
+        botao_salvar = ft.ElevatedButton(
+            text="Salvar Cliente",
+            icon=ft.Icons.SAVE,
+            on_click=salvar_cliente
+        )
+        
+        botao_cancelar = ft.OutlinedButton(
+            text="Cancelar",
+            on_click=lambda e: navegar_para("clientes")
+        )
+        
+        conteudo_principal.content = ft.Column([
+            ft.Row([
+                ft.Text(
+                    "Novo Cliente" if not cliente_selecionado.current else "Editar Cliente",
+                    size=24,
+                    weight=ft.FontWeight.BOLD
+                )
+            ], alignment=ft.MainAxisAlignment.CENTER),
+            ft.Container(
+                content=ft.Column([
+                    campo_nome,
+                    campo_telefone,
+                    campo_email,
+                    ft.Row([
+                        botao_cancelar,
+                        botao_salvar
+                    ], alignment=ft.MainAxisAlignment.END)
+                ], spacing=20),
+                padding=20,
+                width=400
+            )
+        ], alignment=ft.MainAxisAlignment.CENTER, expand=True)
+        
+        page.update()
+    
+    def mostrar_formulario_reserva():
+        # Atualizar dropdowns
+        atualizar_dropdown_clientes()
+        
+        # Inicializar datas
+        data_check_in.current = datetime.now()
+        data_check_out.current = datetime.now() + timedelta(days=1)
+        
+        # Atualizar textos
+        texto_check_in.value = f"Check-in: {formatar_data(data_check_in.current)}"
+        texto_check_out.value = f"Check-out: {formatar_data(data_check_out.current)}"
+        
+        # Atualizar quartos disponíveis para as datas selecionadas
+        atualizar_dropdown_quartos()
+        
+        botao_salvar = ft.ElevatedButton(
+            text="Fazer Reserva",
+            icon=ft.Icons.BOOKMARK_ADD,
+            on_click=salvar_reserva,
+            style=ft.ButtonStyle(
+                bgcolor=ft.Colors.BLUE_700,
+                color=ft.Colors.WHITE
+            )
+        )
+        
+        botao_cancelar = ft.OutlinedButton(
+            text="Cancelar",
+            on_click=lambda e: navegar_para("reservas")
+        )
+        
+        # Formulário centralizado e com visual melhorado
+        formulario = ft.Container(
+            content=ft.Column([
+                ft.Text(
+                    "Informações da Reserva",
+                    size=18,
+                    weight=ft.FontWeight.BOLD,
+                    color=ft.Colors.BLUE_700
+                ),
+                dropdown_clientes,
+                ft.Container(
+                    content=ft.Row([
+                        ft.Column([
+                            ft.Text("Check-in:", weight=ft.FontWeight.BOLD),
+                            texto_check_in,
+                            ft.ElevatedButton(
+                                "Selecionar Data",
+                                icon=ft.Icons.CALENDAR_MONTH,
+                                on_click=selecionar_data_check_in
+                            )
+                        ]),
+                        ft.Column([
+                            ft.Text("Check-out:", weight=ft.FontWeight.BOLD),
+                            texto_check_out,
+                            ft.ElevatedButton(
+                                "Selecionar Data",
+                                icon=ft.Icons.CALENDAR_MONTH,
+                                on_click=selecionar_data_check_out
+                            )
+                        ])
+                    ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    margin=ft.margin.symmetric(vertical=10)
+                ),
+                ft.Text(
+                    "Quartos disponíveis para o período selecionado:",
+                    weight=ft.FontWeight.BOLD
+                ),
+                dropdown_quartos,
+                ft.Container(
+                    content=ft.Row([
+                        botao_cancelar,
+                        botao_salvar
+                    ], alignment=ft.MainAxisAlignment.END),
+                    margin=ft.margin.only(top=20)
+                )
+            ], spacing=15),
+            padding=30,
+            border_radius=10,
+            border=ft.border.all(1, ft.Colors.BLUE_200),
+            bgcolor=ft.Colors.WHITE,
+            width=550,
+            shadow=ft.BoxShadow(
+                spread_radius=1,
+                blur_radius=15,
+                color=ft.Colors.with_opacity(0.2, ft.Colors.BLUE_GREY)
+            )
+        )
+        
+        conteudo_principal.content = ft.Column([
+            ft.Container(
+                content=ft.Text(
+                    "Nova Reserva",
+                    size=28,
+                    weight=ft.FontWeight.BOLD,
+                    color=ft.Colors.WHITE
+                ),
+                padding=ft.padding.symmetric(vertical=15),
+                border_radius=ft.border_radius.only(bottom_left=10, bottom_right=10),
+                bgcolor=ft.Colors.BLUE_700,
+                alignment=ft.alignment.center,
+                margin=ft.margin.only(bottom=30)
+            ),
+            formulario
+        ], alignment=ft.MainAxisAlignment.START, horizontal_alignment=ft.CrossAxisAlignment.CENTER, expand=True)
+        
+        page.update()
+    
+    def mostrar_tela_reservas():
+        atualizar_lista_reservas()
+        
+        # Título da página com estilo melhorado
+        titulo = ft.Container(
+            content=ft.Text(
+                "Gerenciamento de Reservas",
+                size=28,
+                weight=ft.FontWeight.BOLD,
+                color=ft.Colors.WHITE
+            ),
+            padding=ft.padding.symmetric(vertical=15),
+            border_radius=ft.border_radius.only(bottom_left=10, bottom_right=10),
+            bgcolor=ft.Colors.BLUE_700,
+            alignment=ft.alignment.center,
+            margin=ft.margin.only(bottom=20)
+        )
+        
+        # Botão para nova reserva
+        botao_nova_reserva = ft.ElevatedButton(
+            text="Nova Reserva",
+            icon=ft.Icons.ADD,
+            on_click=lambda e: navegar_para("nova_reserva"),
+            style=ft.ButtonStyle(
+                bgcolor=ft.Colors.GREEN_700,
+                color=ft.Colors.WHITE
+            )
+        )
+        
+        conteudo_principal.content = ft.Column([
+            titulo,
+            ft.Row([botao_nova_reserva], alignment=ft.MainAxisAlignment.CENTER),
+            ft.Container(height=20),  # Espaçamento
+            lista_reservas
+        ], alignment=ft.MainAxisAlignment.START, expand=True)
+        
+        page.update()
+    
+    def mostrar_mapa_reservas():
+        titulo = ft.Container(
+            content=ft.Text(
+                "Mapa de Reservas",
+                size=28,
+                weight=ft.FontWeight.BOLD,
+                color=ft.Colors.WHITE
+            ),
+            padding=ft.padding.symmetric(vertical=15),
+            border_radius=ft.border_radius.only(bottom_left=10, bottom_right=10),
+            bgcolor=ft.Colors.BLUE_700,
+            alignment=ft.alignment.center,
+            margin=ft.margin.only(bottom=20)
+        )
+        
+        # Navegação entre janelas de datas
+        controles = ft.Row([
+            ft.IconButton(
+                icon=ft.Icons.CHEVRON_LEFT,
+                tooltip="Período anterior",
+                on_click=lambda e: mover_mapa(-DIAS_NO_MAPA)
+            ),
+            ft.TextButton("Hoje", on_click=lambda e: mover_mapa(None)),
+            texto_periodo_mapa,
+            ft.IconButton(
+                icon=ft.Icons.CHEVRON_RIGHT,
+                tooltip="Próximo período",
+                on_click=lambda e: mover_mapa(DIAS_NO_MAPA)
+            )
+        ], alignment=ft.MainAxisAlignment.CENTER)
+        
+        conteudo_principal.content = ft.Column([
+            titulo,
+            controles,
+            cabecalho_mapa,
+            lista_mapa
+        ], alignment=ft.MainAxisAlignment.START, expand=True)
+        
+        atualizar_mapa()
+    
+    # Barra de navegação
+    barra_navegacao = ft.AppBar(
+        title=ft.Text("Refúgio dos Sonhos"),
+        center_title=True,
+        bgcolor=ft.Colors.BLUE_700,
+        actions=[
+            ft.IconButton(
+                icon=ft.Icons.HOME,
+                tooltip="Tela Inicial",
+                on_click=lambda e: navegar_para("inicial")
+            ),
+            ft.IconButton(
+                icon=ft.Icons.PERSON,
+                tooltip="Gerenciar Clientes",
+                on_click=lambda e: navegar_para("clientes")
+            ),
+            ft.IconButton(
+                icon=ft.Icons.BOOKMARK_ADD,
+                tooltip="Fazer Reserva",
+                on_click=lambda e: navegar_para("nova_reserva")
+            ),
+            ft.IconButton(
+                icon=ft.Icons.LIST_ALT,
+                tooltip="Ver Reservas",
+                on_click=lambda e: navegar_para("reservas")
+            ),
+            ft.IconButton(
+                icon=ft.Icons.CALENDAR_VIEW_MONTH,
+                tooltip="Mapa de Reservas",
+                on_click=lambda e: navegar_para("mapa")
+            ),
+        ]
+    )
+    
+    # Configurar a página
+    page.appbar = barra_navegacao
+    page.add(conteudo_principal)
+    
+    # Receber os avisos de alteração enquanto a sessão estiver aberta
+    gerenciador.inscrever(receber_alteracao)
+    page.on_close = lambda e: gerenciador.cancelar_inscricao(receber_alteracao)
+    
+    # Iniciar com a tela inicial
+    navegar_para("inicial")
+
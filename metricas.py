@@ -0,0 +1,161 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+# Métricas de operação do sistema, mantidas em memória pelo processo: chamadas e
+# latência de cada operação do gerenciador e volume/duração das gravações. Podem
+# ser exportadas em JSON ou no formato texto do Prometheus.
+
+# Limites (em segundos) das faixas dos histogramas de latência
+LIMITES_LATENCIA = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histograma:
+    """Contagem de observações por faixa (não acumulada), com soma e total"""
+    __slots__ = ("faixas", "soma", "quantidade")
+    
+    def __init__(self):
+        self.faixas = [0] * (len(LIMITES_LATENCIA) + 1)
+        self.soma = 0.0
+        self.quantidade = 0
+    
+    def observar(self, valor: float) -> None:
+        self.faixas[bisect_left(LIMITES_LATENCIA, valor)] += 1
+        self.soma += valor
+        self.quantidade += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        acumulado, faixas = 0, {}
+        for limite, quantidade in zip(LIMITES_LATENCIA + ("+Inf",), self.faixas):
+            acumulado += quantidade
+            faixas[str(limite)] = acumulado
+        return {"quantidade": self.quantidade, "soma": self.soma, "faixas": faixas}
+
+
+class Metricas:
+    """Registro das métricas; pode ser usado por várias threads ao mesmo tempo"""
+    
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._operacoes: Dict[str, Histograma] = {}
+        self._erros: Dict[str, int] = {}
+        # Por destino da gravação ("journal", "snapshot", "sqlite"...)
+        self._gravacoes: Dict[str, Histograma] = {}
+        self._bytes_gravados: Dict[str, int] = {}
+    
+    def registrar_operacao(self, operacao: str, duracao: float, erro: bool = False) -> None:
+        with self._trava:
+            histograma = self._operacoes.get(operacao)
+            if histograma is None:
+                histograma = self._operacoes[operacao] = Histograma()
+            histograma.observar(duracao)
+            if erro:
+                self._erros[operacao] = self._erros.get(operacao, 0) + 1
+    
+    def registrar_gravacao(self, destino: str, duracao: float, bytes_gravados: int = 0) -> None:
+        with self._trava:
+            histograma = self._gravacoes.get(destino)
+            if histograma is None:
+                histograma = self._gravacoes[destino] = Histograma()
+            histograma.observar(duracao)
+            self._bytes_gravados[destino] = self._bytes_gravados.get(destino, 0) + bytes_gravados
+    
+    def zerar(self) -> None:
+        with self._trava:
+            self._operacoes.clear()
+            self._erros.clear()
+            self._gravacoes.clear()
+            self._bytes_gravados.clear()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._trava:
+            return {
+                "operacoes": {
+                    nome: dict(histograma.to_dict(), erros=self._erros.get(nome, 0))
+                    for nome, histograma in sorted(self._operacoes.items())
+                },
+                "gravacoes": {
+                    destino: dict(histograma.to_dict(), bytes=self._bytes_gravados.get(destino, 0))
+                    for destino, histograma in sorted(self._gravacoes.items())
+                }
+            }
+    
+    def para_prometheus(self) -> str:
+        """Métricas no formato texto de exposição do Prometheus"""
+        dados = self.to_dict()
+        linhas: List[str] = []
+        
+        def histograma(nome: str, descricao: str, rotulo: str, series: Dict[str, Dict[str, Any]]) -> None:
+            linhas.append(f"# HELP {nome} {descricao}")
+            linhas.append(f"# TYPE {nome} histogram")
+            for valor_rotulo, serie in series.items():
+                for limite, quantidade in serie["faixas"].items():
+                    linhas.append(f'{nome}_bucket{{{rotulo}="{valor_rotulo}",le="{limite}"}} {quantidade}')
+                linhas.append(f'{nome}_sum{{{rotulo}="{valor_rotulo}"}} {serie["soma"]}')
+                linhas.append(f'{nome}_count{{{rotulo}="{valor_rotulo}"}} {serie["quantidade"]}')
+        
+        def contador(nome: str, descricao: str, rotulo: str, valores: Dict[str, int]) -> None:
+            linhas.append(f"# HELP {nome} {descricao}")
+            linhas.append(f"# TYPE {nome} counter")
+            for valor_rotulo, valor in valores.items():
+                linhas.append(f'{nome}{{{rotulo}="{valor_rotulo}"}} {valor}')
+        
+        histograma("hotel_operacao_segundos", "Latência das operações do gerenciador",
+                   "operacao", dados["operacoes"])
+        contador("hotel_operacao_erros_total", "Operações encerradas com exceção",
+                 "operacao", {nome: serie["erros"] for nome, serie in dados["operacoes"].items()})
+        histograma("hotel_gravacao_segundos", "Duração das gravações no armazenamento",
+                   "destino", dados["gravacoes"])
+        contador("hotel_gravacao_bytes_total", "Bytes gravados no armazenamento",
+                 "destino", {destino: serie["bytes"] for destino, serie in dados["gravacoes"].items()})
+        return "\n".join(linhas) + "\n"
+    
+    def salvar(self, caminho: str) -> None:
+        """Grava as métricas em JSON (arquivos .json) ou no formato do Prometheus"""
+        if caminho.endswith(".json"):
+            conteudo = json.dumps(self.to_dict(), indent=4)
+        else:
+            conteudo = self.para_prometheus()
+        # Substituição atômica: quem lê o arquivo nunca vê uma gravação pela metade
+        arquivo_temporario = caminho + ".tmp"
+        with open(arquivo_temporario, "w") as arquivo:
+            arquivo.write(conteudo)
+        os.replace(arquivo_temporario, caminho)
+    
+    def exportar_periodicamente(self, caminho: str, intervalo: float = 30.0) -> None:
+        """Regrava o arquivo de métricas a cada `intervalo` segundos e ao encerrar o processo"""
+        def exportar() -> None:
+            while True:
+                time.sleep(intervalo)
+                self.salvar(caminho)
+        
+        threading.Thread(target=exportar, name="exportacao-metricas", daemon=True).start()
+        atexit.register(self.salvar, caminho)
+
+
+# Registro único do processo
+METRICAS = Metricas()
+
+
+def medir(operacao: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorador que registra a duração (e as exceções) de cada chamada em METRICAS"""
+    def decorador(funcao: Callable) -> Callable:
+        nome = operacao or funcao.__name__.lstrip("_")
+        
+        @wraps(funcao)
+        def medida(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                resultado = funcao(*args, **kwargs)
+            except BaseException:
+                METRICAS.registrar_operacao(nome, time.perf_counter() - inicio, erro=True)
+                raise
+            METRICAS.registrar_operacao(nome, time.perf_counter() - inicio)
+            return resultado
+        return medida
+    return decorador
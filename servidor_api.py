@@ -0,0 +1,490 @@
+"""Servidor HTTP com API JSON sobre o GerenciadorDeReservas, sem a interface Flet
+
+Uso: python servidor_api.py [--host 127.0.0.1] [--porta 8080] [--dados dados_hotel.json]
+
+Rotas (corpos e respostas em JSON):
+    GET    /painel
+    GET    /clientes?deslocamento=0&quantidade=100      POST /clientes
+    GET    /clientes/{id}    PUT /clientes/{id}    DELETE /clientes/{id}
+    GET    /clientes/{id}/reservas
+    GET    /quartos?deslocamento=0&quantidade=100       POST /quartos
+    GET    /quartos/{numero}    PUT /quartos/{numero}    DELETE /quartos/{numero}
+    GET    /quartos/disponiveis?check_in=DD-MM-YYYY&check_out=DD-MM-YYYY
+    GET    /busca?check_in=DD-MM-YYYY&noites=2[&flexibilidade&tipo&preco_minimo&preco_maximo
+                  &capacidade_minima&limite]
+    GET    /reservas?deslocamento=0&quantidade=100      POST /reservas
+    GET    /reservas/{id}    PUT /reservas/{id}
+    POST   /reservas/{id}/cancelamento
+    GET    /metricas                                    (formato texto do Prometheus)
+    POST   /lote    [{"metodo": "GET", "caminho": "/busca?...", "corpo": ...}, ...]
+
+As conexões são mantidas abertas (keep-alive) e várias são atendidas ao mesmo tempo; cada
+requisição (ou lote inteiro) é executada em uma thread do executor, com as travas do gerenciador.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+from concurrent.futures import Executor
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from assincrono import GerenciadorAssincrono
+from datas import converter_data_para_ordinal
+from dominio import CalendarioDeOcupacao, Cliente, GerenciadorDeReservas, Quarto, Reserva, obter_gerenciador_compartilhado
+from metricas import METRICAS
+
+logger = logging.getLogger("hotel.api")
+
+# Limites de cada requisição e tempo máximo (segundos) de uma conexão ociosa
+TAMANHO_MAXIMO_CABECALHO = 64 * 1024
+TAMANHO_MAXIMO_CORPO = 1024 * 1024
+TEMPO_OCIOSO = 15.0
+QUANTIDADE_PADRAO = 100
+QUANTIDADE_MAXIMA = 1000
+
+Resposta = Tuple[int, Any]
+
+
+class ErroHTTP(Exception):
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+# Tabela de rotas: método, padrão do caminho e função que atende
+_ROTAS: List[Tuple[str, Pattern, Callable[..., Resposta]]] = []
+
+
+def rota(metodo: str, caminho: str) -> Callable[[Callable[..., Resposta]], Callable[..., Resposta]]:
+    """Registra a função para o método e o caminho (grupos nomeados viram argumentos)"""
+    def registrar(funcao: Callable[..., Resposta]) -> Callable[..., Resposta]:
+        _ROTAS.append((metodo, re.compile(f"^{caminho}$"), funcao))
+        return funcao
+    return registrar
+
+
+def _inteiro(consulta: Dict[str, str], nome: str, padrao: Optional[int] = None,
+             minimo: Optional[int] = None, maximo: Optional[int] = None) -> Optional[int]:
+    valor = consulta.get(nome)
+    if valor is None or valor == "":
+        return padrao
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ErroHTTP(400, f"Parâmetro inválido: {nome}")
+    if (minimo is not None and numero < minimo) or (maximo is not None and numero > maximo):
+        limites = f"de {minimo} a {maximo}" if maximo is not None else f"a partir de {minimo}"
+        raise ErroHTTP(400, f"Parâmetro fora do intervalo ({limites}): {nome}")
+    return numero
+
+
+def _decimal(consulta: Dict[str, str], nome: str) -> Optional[float]:
+    valor = consulta.get(nome)
+    if valor is None or valor == "":
+        return None
+    try:
+        return float(valor)
+    except ValueError:
+        raise ErroHTTP(400, f"Parâmetro inválido: {nome}")
+
+
+def _obrigatorio(consulta: Dict[str, str], nome: str) -> str:
+    valor = consulta.get(nome)
+    if not valor:
+        raise ErroHTTP(400, f"Parâmetro obrigatório ausente: {nome}")
+    return valor
+
+
+def _pagina(consulta: Dict[str, str]) -> Tuple[int, int]:
+    deslocamento = max(_inteiro(consulta, "deslocamento", 0), 0)
+    quantidade = min(max(_inteiro(consulta, "quantidade", QUANTIDADE_PADRAO), 0), QUANTIDADE_MAXIMA)
+    return deslocamento, quantidade
+
+
+def _booleano(dados: Dict[str, Any], nome: str, padrao: bool) -> bool:
+    # Apenas true/false do JSON: bool("false") seria verdadeiro
+    valor = dados.get(nome, padrao)
+    if not isinstance(valor, bool):
+        raise ErroHTTP(400, f"Campo inválido (esperado true ou false): {nome}")
+    return valor
+
+
+def _dia(dados: Dict[str, Any], nome: str) -> int:
+    dia = converter_data_para_ordinal(dados[nome])
+    if dia is None:
+        raise ErroHTTP(400, f"Data inválida (esperado DD-MM-YYYY): {nome}")
+    return dia
+
+
+def _periodo(dados: Dict[str, Any]) -> None:
+    if _dia(dados, "check_out") <= _dia(dados, "check_in"):
+        raise ErroHTTP(400, "O check-out deve ser posterior ao check-in")
+
+
+# Os mesmos campos são validados da mesma forma na criação (POST) e na alteração (PUT)
+def _dados_cliente(dados: Dict[str, Any]) -> Tuple[str, str, str]:
+    nome, telefone, email = dados["nome"], dados["telefone"], dados["email"]
+    if not all(isinstance(valor, str) for valor in (nome, telefone, email)):
+        raise ErroHTTP(400, "Nome, telefone e email devem ser textos")
+    if not nome.strip():
+        raise ErroHTTP(400, "Nome vazio")
+    return nome, telefone, email
+
+
+def _dados_quarto(dados: Dict[str, Any]) -> Tuple[str, float, bool]:
+    tipo, preco = dados["tipo"], float(dados["preco"])
+    if not isinstance(tipo, str) or not tipo.strip():
+        raise ErroHTTP(400, "Tipo de quarto vazio")
+    if not preco >= 0:
+        raise ErroHTTP(400, "O preço não pode ser negativo")
+    return tipo, preco, _booleano(dados, "disponivel", True)
+
+
+def _objeto(corpo: Any) -> Dict[str, Any]:
+    if not isinstance(corpo, dict):
+        raise ErroHTTP(400, "O corpo deve ser um objeto JSON")
+    return corpo
+
+
+def _encontrado(entidade: Any, mensagem: str) -> Any:
+    if entidade is None:
+        raise ErroHTTP(404, mensagem)
+    return entidade
+
+
+# Painel e métricas
+@rota("GET", "/painel")
+def painel(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    return 200, gerenciador.painel()
+
+
+@rota("GET", "/metricas")
+def metricas(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    return 200, METRICAS.para_prometheus()
+
+
+# Clientes
+@rota("GET", "/clientes")
+def listar_clientes(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    return 200, [c.to_dict() for c in gerenciador.pagina_de_clientes(*_pagina(consulta))]
+
+
+@rota("POST", "/clientes")
+def criar_cliente(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    cliente = Cliente(*_dados_cliente(_objeto(corpo)))
+    gerenciador.adicionar_cliente(cliente)
+    return 201, cliente.to_dict()
+
+
+@rota("GET", "/clientes/(?P<cliente_id>[^/]+)")
+def obter_cliente(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any, cliente_id: str) -> Resposta:
+    return 200, _encontrado(gerenciador.obter_cliente_por_id(cliente_id), "Cliente não encontrado").to_dict()
+
+
+@rota("PUT", "/clientes/(?P<cliente_id>[^/]+)")
+def atualizar_cliente(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any,
+                      cliente_id: str) -> Resposta:
+    if not gerenciador.atualizar_cliente(cliente_id, *_dados_cliente(_objeto(corpo))):
+        raise ErroHTTP(404, "Cliente não encontrado")
+    return 200, gerenciador.obter_cliente_por_id(cliente_id).to_dict()
+
+
+@rota("DELETE", "/clientes/(?P<cliente_id>[^/]+)")
+def remover_cliente(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any,
+                    cliente_id: str) -> Resposta:
+    if not gerenciador.remover_cliente(cliente_id):
+        raise ErroHTTP(404, "Cliente não encontrado")
+    return 200, {"removido": cliente_id}
+
+
+@rota("GET", "/clientes/(?P<cliente_id>[^/]+)/reservas")
+def reservas_do_cliente(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any,
+                        cliente_id: str) -> Resposta:
+    _encontrado(gerenciador.obter_cliente_por_id(cliente_id), "Cliente não encontrado")
+    return 200, [r.to_dict() for r in gerenciador.listar_reservas_por_cliente(cliente_id)]
+
+
+# Quartos
+@rota("GET", "/quartos")
+def listar_quartos(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    return 200, [q.to_dict() for q in gerenciador.pagina_de_quartos(*_pagina(consulta))]
+
+
+@rota("POST", "/quartos")
+def criar_quarto(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    dados = _objeto(corpo)
+    quarto = Quarto(int(dados["numero"]), *_dados_quarto(dados))
+    # A verificação e a inclusão ficam na mesma transação (trava de escrita)
+    with gerenciador.transacao():
+        if gerenciador.obter_quarto_por_numero(quarto.numero):
+            raise ErroHTTP(409, f"Quarto já existe: {quarto.numero}")
+        gerenciador.adicionar_quarto(quarto)
+    return 201, quarto.to_dict()
+
+
+@rota("GET", "/quartos/disponiveis")
+def quartos_disponiveis(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    quartos = gerenciador.listar_quartos_disponiveis(consulta.get("check_in"), consulta.get("check_out"))
+    return 200, [q.to_dict() for q in quartos]
+
+
+@rota("GET", "/quartos/(?P<numero>[0-9]+)")
+def obter_quarto(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any, numero: str) -> Resposta:
+    return 200, _encontrado(gerenciador.obter_quarto_por_numero(int(numero)), "Quarto não encontrado").to_dict()
+
+
+@rota("PUT", "/quartos/(?P<numero>[0-9]+)")
+def atualizar_quarto(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any, numero: str) -> Resposta:
+    if not gerenciador.atualizar_quarto(int(numero), *_dados_quarto(_objeto(corpo))):
+        raise ErroHTTP(404, "Quarto não encontrado")
+    return 200, gerenciador.obter_quarto_por_numero(int(numero)).to_dict()
+
+
+@rota("DELETE", "/quartos/(?P<numero>[0-9]+)")
+def remover_quarto(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any, numero: str) -> Resposta:
+    if not gerenciador.remover_quarto(int(numero)):
+        raise ErroHTTP(404, "Quarto não encontrado")
+    return 200, {"removido": int(numero)}
+
+
+@rota("GET", "/busca")
+def buscar_quartos(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    check_in = _obrigatorio(consulta, "check_in")
+    _dia(consulta, "check_in")
+    # Estadias e flexibilidade vão no máximo até o horizonte do calendário de ocupação
+    horizonte = CalendarioDeOcupacao.HORIZONTE
+    opcoes = gerenciador.buscar_quartos(
+        check_in,
+        _inteiro(consulta, "noites", 1, minimo=1, maximo=horizonte),
+        flexibilidade=_inteiro(consulta, "flexibilidade", 0, minimo=0, maximo=horizonte),
+        tipo=consulta.get("tipo") or None,
+        preco_minimo=_decimal(consulta, "preco_minimo"),
+        preco_maximo=_decimal(consulta, "preco_maximo"),
+        capacidade_minima=_inteiro(consulta, "capacidade_minima"),
+        limite=_inteiro(consulta, "limite", minimo=0)
+    )
+    return 200, [o.to_dict() for o in opcoes]
+
+
+# Reservas
+@rota("GET", "/reservas")
+def listar_reservas(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    return 200, [r.to_dict() for r in gerenciador.pagina_de_reservas(*_pagina(consulta))]
+
+
+@rota("POST", "/reservas")
+def criar_reserva(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    dados = _objeto(corpo)
+    cliente_id, quarto_numero = dados["cliente_id"], int(dados["quarto_numero"])
+    _periodo(dados)
+    with gerenciador.transacao():
+        _encontrado(gerenciador.obter_cliente_por_id(cliente_id), "Cliente não encontrado")
+        _encontrado(gerenciador.obter_quarto_por_numero(quarto_numero), "Quarto não encontrado")
+        reserva = gerenciador.criar_reserva(cliente_id, quarto_numero, dados["check_in"], dados["check_out"])
+    if reserva is None:
+        raise ErroHTTP(409, "Quarto indisponível no período")
+    return 201, reserva.to_dict()
+
+
+@rota("GET", "/reservas/(?P<reserva_id>[^/]+)")
+def obter_reserva(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any, reserva_id: str) -> Resposta:
+    return 200, _encontrado(gerenciador.obter_reserva_por_id(reserva_id), "Reserva não encontrada").to_dict()
+
+
+@rota("PUT", "/reservas/(?P<reserva_id>[^/]+)")
+def atualizar_reserva(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any,
+                      reserva_id: str) -> Resposta:
+    dados = _objeto(corpo)
+    if dados.get("status", "Pendente") not in Reserva.STATUS:
+        raise ErroHTTP(400, f"Status inválido: {dados['status']}")
+    # Campos ausentes mantêm o valor atual, lido na mesma transação (trava de escrita) da alteração;
+    # a verificação de sobreposição fica com o gerenciador, como na tela de edição
+    with gerenciador.transacao():
+        reserva = _encontrado(gerenciador.obter_reserva_por_id(reserva_id), "Reserva não encontrada")
+        alteracao = {"check_in": reserva.check_in, "check_out": reserva.check_out, "status": reserva.status}
+        alteracao.update((campo, dados[campo]) for campo in alteracao if campo in dados)
+        _periodo(alteracao)
+        if not gerenciador.atualizar_reserva(reserva_id, alteracao["check_in"], alteracao["check_out"],
+                                             alteracao["status"]):
+            raise ErroHTTP(409, "Quarto indisponível no período")
+    return 200, reserva.to_dict()
+
+
+@rota("POST", "/reservas/(?P<reserva_id>[^/]+)/cancelamento")
+def cancelar_reserva(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any,
+                     reserva_id: str) -> Resposta:
+    reserva = _encontrado(gerenciador.obter_reserva_por_id(reserva_id), "Reserva não encontrada")
+    if not gerenciador.cancelar_reserva(reserva_id):
+        raise ErroHTTP(409, f"A reserva já está {reserva.status}")
+    return 200, reserva.to_dict()
+
+
+@rota("POST", "/lote")
+def lote(gerenciador: GerenciadorDeReservas, consulta: Dict[str, str], corpo: Any) -> Resposta:
+    """Executa várias requisições em sequência, numa única ida ao executor"""
+    if not isinstance(corpo, list):
+        raise ErroHTTP(400, "O corpo deve ser uma lista de requisições")
+    respostas = []
+    for item in corpo:
+        if not isinstance(item, dict) or "caminho" not in item:
+            status, dados = 400, {"erro": "Requisição inválida no lote"}
+        elif urlsplit(item["caminho"]).path == "/lote":
+            status, dados = 400, {"erro": "Lotes não podem ser aninhados"}
+        else:
+            status, dados = despachar(gerenciador, item.get("metodo", "GET").upper(), item["caminho"], item.get("corpo"))
+        respostas.append({"status": status, "corpo": dados})
+    return 200, respostas
+
+
+def despachar(gerenciador: GerenciadorDeReservas, metodo: str, alvo: str, corpo: Any) -> Resposta:
+    """Encontra a rota do alvo (caminho e consulta) e executa; erros viram {"erro": ...}"""
+    partes = urlsplit(alvo)
+    caminho = unquote(partes.path).rstrip("/") or "/"
+    consulta = dict(parse_qsl(partes.query))
+    metodos_do_caminho = []
+    for metodo_rota, padrao, funcao in _ROTAS:
+        encontrado = padrao.match(caminho)
+        if encontrado is None:
+            continue
+        if metodo_rota != metodo:
+            metodos_do_caminho.append(metodo_rota)
+            continue
+        try:
+            return funcao(gerenciador, consulta, corpo, **encontrado.groupdict())
+        except ErroHTTP as e:
+            return e.status, {"erro": e.mensagem}
+        except KeyError as e:
+            return 400, {"erro": f"Campo obrigatório ausente: {e}"}
+        except (TypeError, ValueError) as e:
+            return 400, {"erro": f"Valor inválido: {e}"}
+        except Exception:
+            logger.exception("Erro ao atender %s %s", metodo, caminho)
+            return 500, {"erro": "Erro interno"}
+    if metodos_do_caminho:
+        return 405, {"erro": f"Método não permitido (use {', '.join(metodos_do_caminho)})"}
+    return 404, {"erro": f"Rota não encontrada: {caminho}"}
+
+
+class ServidorAPI:
+    """Servidor HTTP/1.1 asyncio: conexões persistentes, várias ao mesmo tempo"""
+    
+    def __init__(self, gerenciador: GerenciadorDeReservas, host: str = "127.0.0.1", porta: int = 8080,
+                 executor: Optional[Executor] = None):
+        self.gerenciador = gerenciador
+        self.host = host
+        self.porta = porta
+        self._assincrono = GerenciadorAssincrono(gerenciador, executor)
+        self._servidor: Optional[asyncio.AbstractServer] = None
+    
+    async def iniciar(self) -> None:
+        self._servidor = await asyncio.start_server(self._atender_conexao, self.host, self.porta,
+                                                    limit=TAMANHO_MAXIMO_CABECALHO)
+        # Com porta 0 o sistema escolhe uma porta livre
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+        logger.info("API ouvindo em http://%s:%s", self.host, self.porta)
+    
+    async def servir_para_sempre(self) -> None:
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+    
+    async def encerrar(self) -> None:
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+    
+    async def _atender_conexao(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        try:
+            manter_aberta = True
+            while manter_aberta:
+                try:
+                    cabecalho = await asyncio.wait_for(leitor.readuntil(b"\r\n\r\n"), TEMPO_OCIOSO)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._responder(escritor, 431, {"erro": "Cabeçalho muito grande"}, False)
+                    break
+                
+                linhas = cabecalho.decode("latin-1").split("\r\n")
+                try:
+                    metodo, alvo, versao = linhas[0].split(" ")
+                except ValueError:
+                    await self._responder(escritor, 400, {"erro": "Linha de requisição inválida"}, False)
+                    break
+                cabecalhos = {}
+                for linha in linhas[1:]:
+                    nome, _, valor = linha.partition(":")
+                    if nome:
+                        cabecalhos[nome.strip().lower()] = valor.strip()
+                conexao = cabecalhos.get("connection", "").lower()
+                manter_aberta = conexao == "keep-alive" if versao == "HTTP/1.0" else conexao != "close"
+                
+                if "chunked" in cabecalhos.get("transfer-encoding", "").lower():
+                    await self._responder(escritor, 411, {"erro": "Informe Content-Length"}, False)
+                    break
+                try:
+                    tamanho = int(cabecalhos.get("content-length", 0))
+                except ValueError:
+                    tamanho = -1
+                if tamanho < 0 or tamanho > TAMANHO_MAXIMO_CORPO:
+                    await self._responder(escritor, 413, {"erro": "Corpo inválido ou muito grande"}, False)
+                    break
+                dados = await leitor.readexactly(tamanho) if tamanho else b""
+                
+                if dados:
+                    try:
+                        corpo = json.loads(dados)
+                    except ValueError:
+                        await self._responder(escritor, 400, {"erro": "JSON inválido"}, manter_aberta)
+                        continue
+                else:
+                    corpo = None
+                status, resposta = await self._assincrono.executar(
+                    despachar, self.gerenciador, metodo.upper(), alvo, corpo)
+                await self._responder(escritor, status, resposta, manter_aberta)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+    
+    async def _responder(self, escritor: asyncio.StreamWriter, status: int, resposta: Any, manter_aberta: bool) -> None:
+        if isinstance(resposta, str):
+            corpo, tipo = resposta.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            corpo, tipo = json.dumps(resposta, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+        cabecalho = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: {tipo}\r\n"
+            f"Content-Length: {len(corpo)}\r\n"
+            f"Connection: {'keep-alive' if manter_aberta else 'close'}\r\n\r\n"
+        )
+        escritor.write(cabecalho.encode("latin-1") + corpo)
+        await escritor.drain()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--dados", default="dados_hotel.json", help="arquivo de dados (JSON, ou .db para SQLite)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=os.environ.get("HOTEL_LOG", "INFO").upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if os.environ.get("HOTEL_METRICAS"):
+        METRICAS.exportar_periodicamente(os.environ["HOTEL_METRICAS"])
+    gerenciador = obter_gerenciador_compartilhado(arquivo_dados=args.dados)
+    try:
+        asyncio.run(ServidorAPI(gerenciador, args.host, args.porta).servir_para_sempre())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
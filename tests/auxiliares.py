@@ -0,0 +1,60 @@
+"""Funções auxiliares compartilhadas pelos testes"""
+import random
+from datetime import date
+
+from dominio import Cliente, GerenciadorDeReservas, Quarto, Reserva
+
+QUARTOS = [101, 102, 201, 202, 301]
+PRIMEIRO_DIA = date(2031, 1, 1).toordinal()
+
+
+def data(dia: int) -> str:
+    return date.fromordinal(dia).strftime("%d-%m-%Y")
+
+
+def estado(gerenciador: GerenciadorDeReservas):
+    """Tudo o que é visível de fora: entidades, estadias por quarto e contadores"""
+    quartos = gerenciador.listar_quartos()
+    return (
+        [c.to_dict() for c in gerenciador.listar_clientes()],
+        [q.to_dict() for q in quartos],
+        [r.to_dict() for r in gerenciador.listar_reservas()],
+        {q.numero: gerenciador.estadias_do_quarto(q.numero, 0, 10 ** 7) for q in quartos},
+        gerenciador.painel(),
+    )
+
+
+def operacoes_aleatorias(gerenciador: GerenciadorDeReservas, aleatorio: random.Random, quantidade: int) -> None:
+    clientes = [c.id for c in gerenciador.listar_clientes()]
+    for i in range(quantidade):
+        sorteio = aleatorio.random()
+        reservas = gerenciador.listar_reservas()
+        if sorteio < 0.15 or not clientes:
+            cliente = Cliente(f"Cliente {i}", "1199999", f"c{i}@hotel")
+            gerenciador.adicionar_cliente(cliente)
+            clientes.append(cliente.id)
+        elif sorteio < 0.5:
+            dia = PRIMEIRO_DIA + aleatorio.randint(0, 60)
+            gerenciador.criar_reserva(aleatorio.choice(clientes), aleatorio.choice(QUARTOS),
+                                      data(dia), data(dia + aleatorio.randint(1, 5)))
+        elif sorteio < 0.6 and reservas:
+            reserva = aleatorio.choice(reservas)
+            gerenciador.atualizar_reserva(reserva.id, reserva.check_in, reserva.check_out,
+                                          aleatorio.choice(Reserva.STATUS))
+        elif sorteio < 0.7 and reservas:
+            gerenciador.cancelar_reserva(aleatorio.choice(reservas).id)
+        elif sorteio < 0.78:
+            cliente_id = aleatorio.choice(clientes)
+            gerenciador.remover_cliente(cliente_id)
+            clientes.remove(cliente_id)
+        elif sorteio < 0.86:
+            gerenciador.atualizar_cliente(aleatorio.choice(clientes), "Outro nome", "1188888", "outro@hotel")
+        elif sorteio < 0.93:
+            numero = aleatorio.randint(400, 405)
+            if gerenciador.obter_quarto_por_numero(numero):
+                gerenciador.remover_quarto(numero)
+            else:
+                gerenciador.adicionar_quarto(Quarto(numero, "Double", 250.0, aleatorio.random() < 0.8))
+        else:
+            numero = aleatorio.choice(QUARTOS)
+            gerenciador.atualizar_quarto(numero, "Suite", float(aleatorio.randint(100, 500)), aleatorio.random() < 0.8)
@@ -0,0 +1,12 @@
+import os
+import sys
+
+# Os módulos do sistema ficam na raiz do repositório (não há pacote instalável)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture
+def arquivo_dados(tmp_path):
+    return str(tmp_path / "dados_hotel.json")
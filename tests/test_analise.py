@@ -0,0 +1,120 @@
+"""Ocupação, ADR e RevPAR calculados com NumPy comparados com a contagem noite a noite"""
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from analise import ReservasColunares, calcular_metricas
+from auxiliares import PRIMEIRO_DIA, data
+from dominio import Cliente, GerenciadorDeReservas, Quarto
+
+TIPOS = ["Single", "Double", "Suite"]
+
+
+def quartos_e_estadias(aleatorio):
+    quartos = [Quarto(100 + i, aleatorio.choice(TIPOS), float(aleatorio.randint(80, 400))) for i in range(12)]
+    estadias = []
+    for _ in range(300):
+        inicio = PRIMEIRO_DIA + aleatorio.randint(-40, 100)
+        fim = inicio + aleatorio.randint(-1, 20)
+        # Também entram estadias sem data, de quartos excluídos e com datas invertidas
+        estadias.append((aleatorio.choice([q.numero for q in quartos] + [999]),
+                         None if aleatorio.random() < 0.02 else inicio, fim,
+                         aleatorio.choice(["Confirmada", "Pendente", "Concluída", "Cancelada"])))
+    return quartos, estadias
+
+
+def contagem_noite_a_noite(quartos, estadias, inicio, fim, tipo=None):
+    """Quartos disponíveis, vendidos e receita de cada noite entre inicio e fim"""
+    precos = {q.numero: q.preco for q in quartos if tipo in (None, q.tipo)}
+    noites = []
+    for dia in range(inicio, fim):
+        vendidos = [n for n, e, s, status in estadias
+                    if n in precos and e is not None and status != "Cancelada" and e <= dia < s]
+        noites.append((len(precos), len(vendidos), sum(precos[n] for n in vendidos)))
+    return noites
+
+
+def indicadores(noites):
+    disponiveis = sum(n[0] for n in noites)
+    vendidos = sum(n[1] for n in noites)
+    receita = sum(n[2] for n in noites)
+    return {
+        "quartos_disponiveis": disponiveis,
+        "quartos_vendidos": vendidos,
+        "receita": receita,
+        "ocupacao": vendidos / disponiveis if disponiveis else 0.0,
+        "adr": receita / vendidos if vendidos else 0.0,
+        "revpar": receita / disponiveis if disponiveis else 0.0,
+    }
+
+
+def conferir(calculado, esperados):
+    for chave in esperados[0]:
+        np.testing.assert_allclose(calculado[chave], [e[chave] for e in esperados], err_msg=chave)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_metricas_por_dia_iguais_a_contagem(semente):
+    aleatorio = random.Random(semente)
+    quartos, estadias = quartos_e_estadias(aleatorio)
+    inicio = PRIMEIRO_DIA + aleatorio.randint(-10, 10)
+    fim = inicio + aleatorio.randint(1, 60)
+    
+    metricas = calcular_metricas(ReservasColunares(quartos, estadias), inicio, fim)
+    
+    assert metricas["periodos"] == [data(dia) for dia in range(inicio, fim)]
+    conferir(metricas["total"], [indicadores([n]) for n in contagem_noite_a_noite(quartos, estadias, inicio, fim)])
+    assert sorted(metricas["por_tipo"]) == sorted({q.tipo for q in quartos})
+    for tipo, calculado in metricas["por_tipo"].items():
+        noites = contagem_noite_a_noite(quartos, estadias, inicio, fim, tipo)
+        conferir(calculado, [indicadores([n]) for n in noites])
+
+
+def test_metricas_por_mes_somam_os_dias():
+    aleatorio = random.Random(9)
+    quartos, estadias = quartos_e_estadias(aleatorio)
+    inicio, fim = date(2031, 1, 20).toordinal(), date(2031, 4, 3).toordinal()
+    
+    metricas = calcular_metricas(ReservasColunares(quartos, estadias), data(inicio), data(fim), agrupar="mes")
+    
+    assert metricas["periodos"] == ["01-2031", "02-2031", "03-2031", "04-2031"]
+    limites = [inicio, date(2031, 2, 1).toordinal(), date(2031, 3, 1).toordinal(), date(2031, 4, 1).toordinal(), fim]
+    esperados = [indicadores(contagem_noite_a_noite(quartos, estadias, a, b)) for a, b in zip(limites, limites[1:])]
+    conferir(metricas["total"], esperados)
+
+
+def test_periodo_e_agrupamento_invalidos():
+    colunas = ReservasColunares([Quarto(101, "Single", 100.0)], [])
+    with pytest.raises(ValueError):
+        calcular_metricas(colunas, "10-01-2031", "10-01-2031")
+    with pytest.raises(ValueError):
+        calcular_metricas(colunas, "10-01-2031", "12-01-2031", agrupar="semana")
+    with pytest.raises(ValueError):
+        calcular_metricas(colunas, "10/01/2031", "12-01-2031")
+    # Sem vendas, ADR é zero em vez de uma divisão por zero
+    metricas = calcular_metricas(colunas, "10-01-2031", "12-01-2031")
+    assert metricas["total"]["adr"].tolist() == [0.0, 0.0]
+    assert metricas["total"]["ocupacao"].tolist() == [0.0, 0.0]
+
+
+def test_copia_do_gerenciador_inclui_reservas_encerradas(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    primeira = gerenciador.criar_reserva(cliente.id, 101, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 2))
+    segunda = gerenciador.criar_reserva(cliente.id, 102, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 1))
+    gerenciador.atualizar_reserva(primeira.id, primeira.check_in, primeira.check_out, "Concluída")
+    gerenciador.cancelar_reserva(segunda.id)
+    gerenciador._salvar_dados()
+    
+    # Reaberto, a reserva concluída continua como tupla (não é materializada pela cópia)
+    reaberto = GerenciadorDeReservas(arquivo_dados)
+    colunas = ReservasColunares.do_gerenciador(reaberto)
+    assert isinstance(reaberto._reservas[primeira.id], tuple)
+    
+    metricas = calcular_metricas(colunas, PRIMEIRO_DIA, PRIMEIRO_DIA + 3)
+    preco = reaberto.obter_quarto_por_numero(101).preco
+    assert metricas["total"]["quartos_vendidos"].tolist() == [1, 1, 0]
+    assert metricas["total"]["receita"].tolist() == [preco, preco, 0.0]
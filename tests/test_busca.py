@@ -0,0 +1,90 @@
+"""Busca de quartos por filtros e datas flexíveis comparada com a verificação dia a dia"""
+import random
+import time
+from datetime import date
+
+import pytest
+
+from auxiliares import data
+from dominio import CalendarioDeOcupacao, Cliente, GerenciadorDeReservas, Quarto
+
+TIPOS = ["Single", "Double", "Suite"]
+
+
+def gerenciador_com_reservas(arquivo_dados, aleatorio, primeiro_dia):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    for numero in range(400, 412):
+        gerenciador.adicionar_quarto(Quarto(numero, aleatorio.choice(TIPOS), float(aleatorio.randint(1, 5) * 100),
+                                            aleatorio.random() < 0.9))
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    quartos = [q.numero for q in gerenciador.listar_quartos()]
+    for _ in range(250):
+        dia = primeiro_dia + aleatorio.randint(-10, 80)
+        gerenciador.criar_reserva(cliente.id, aleatorio.choice(quartos), data(dia), data(dia + aleatorio.randint(1, 7)))
+    return gerenciador
+
+
+def busca_dia_a_dia(gerenciador, dia, noites, flexibilidade, tipo=None, preco_maximo=None):
+    """Para cada quarto, a data livre mais próxima (sem check-in antes de hoje)"""
+    hoje = date.today().toordinal()
+    opcoes = []
+    for quarto in gerenciador.listar_quartos():
+        if not quarto.disponivel or (tipo and quarto.tipo != tipo) or (preco_maximo and quarto.preco > preco_maximo):
+            continue
+        dias = [d for d in range(max(dia - flexibilidade, hoje), dia + flexibilidade + 1)
+                if not gerenciador.estadias_do_quarto(quarto.numero, d, d + noites)]
+        if dias:
+            inicio = min(dias, key=lambda d: (abs(d - dia), d))
+            opcoes.append((quarto.preco * noites, abs(inicio - dia), inicio - dia, quarto.numero, data(inicio)))
+    return sorted(opcoes)
+
+
+@pytest.mark.parametrize("distancia_de_hoje", [0, 5000])
+@pytest.mark.parametrize("semente", range(3))
+def test_busca_igual_a_verificacao_dia_a_dia(arquivo_dados, semente, distancia_de_hoje):
+    # Perto de hoje a busca usa o calendário; anos à frente, o índice de estadias
+    aleatorio = random.Random(semente)
+    primeiro_dia = date.today().toordinal() + distancia_de_hoje
+    gerenciador = gerenciador_com_reservas(arquivo_dados, aleatorio, primeiro_dia)
+    for _ in range(40):
+        dia = primeiro_dia + aleatorio.randint(-5, 70)
+        noites = aleatorio.randint(1, 6)
+        flexibilidade = aleatorio.choice([0, 0, 1, 3, 10])
+        tipo = aleatorio.choice([None, "Suite"])
+        preco_maximo = aleatorio.choice([None, 300.0])
+        
+        opcoes = gerenciador.buscar_quartos(data(dia), noites, flexibilidade, tipo=tipo, preco_maximo=preco_maximo)
+        
+        assert [(o.total, abs(o.deslocamento), o.deslocamento, o.quarto.numero, o.check_in) for o in opcoes] == \
+            busca_dia_a_dia(gerenciador, dia, noites, flexibilidade, tipo, preco_maximo)
+
+
+def test_limite_e_argumentos_invalidos(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    amanha = data(date.today().toordinal() + 1)
+    todas = gerenciador.buscar_quartos(amanha, 2)
+    assert len(todas) == len([q for q in gerenciador.listar_quartos() if q.disponivel])
+    assert [o.to_dict() for o in gerenciador.buscar_quartos(amanha, 2, limite=2)] == [o.to_dict() for o in todas[:2]]
+    assert gerenciador.buscar_quartos(amanha, 0) == []
+    assert gerenciador.buscar_quartos(amanha, 2, flexibilidade=-1) == []
+    assert gerenciador.buscar_quartos("31-02-2031", 2) == []
+
+
+def test_flexibilidade_limitada_ao_horizonte(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    hoje = date.today().toordinal()
+    # O quarto 101 fica ocupado por todo o horizonte, a partir de hoje
+    assert gerenciador.criar_reserva(cliente.id, 101, data(hoje), data(hoje + CalendarioDeOcupacao.HORIZONTE))
+    
+    inicio = time.perf_counter()
+    opcoes = gerenciador.buscar_quartos(data(hoje), 1, flexibilidade=2_000_000)
+    # Também fora do calendário a busca não percorre os dias da flexibilidade pedida
+    assert len(gerenciador.buscar_quartos(data(hoje + 5000), 1, flexibilidade=2_000_000)) == len(opcoes)
+    assert time.perf_counter() - inicio < 0.5
+    # Sem a data pedida, a opção do quarto 101 é a primeira depois da reserva
+    opcao = next(o for o in opcoes if o.quarto.numero == 101)
+    assert opcao.deslocamento == CalendarioDeOcupacao.HORIZONTE
+    assert all(o.deslocamento == 0 for o in opcoes if o.quarto.numero != 101)
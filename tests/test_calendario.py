@@ -0,0 +1,102 @@
+"""Calendário de ocupação em bits comparado com um conjunto de noites ocupadas por quarto"""
+import random
+from datetime import date
+
+import pytest
+
+from auxiliares import data
+from dominio import CalendarioDeOcupacao, Cliente, GerenciadorDeReservas
+
+QUARTOS = [101, 102, 201, 202, 301]
+DIA_INICIAL = 1000
+HORIZONTE = 120
+
+
+def livre(noites, quarto, inicio, fim):
+    return not any(noite in noites[quarto] for noite in range(inicio, fim))
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_consultas_iguais_as_noites_marcadas(semente):
+    aleatorio = random.Random(semente)
+    calendario = CalendarioDeOcupacao(DIA_INICIAL, HORIZONTE)
+    noites = {quarto: set() for quarto in QUARTOS}
+    estadias = []
+    for _ in range(300):
+        if estadias and aleatorio.random() < 0.35:
+            quarto, inicio, fim = estadias.pop(aleatorio.randrange(len(estadias)))
+            calendario.desmarcar(quarto, inicio, fim)
+            noites[quarto] -= set(range(inicio, fim))
+        else:
+            # Estadias que começam antes do calendário ou terminam depois dele também entram
+            quarto = aleatorio.choice(QUARTOS)
+            inicio = DIA_INICIAL + aleatorio.randint(-10, HORIZONTE + 5)
+            fim = inicio + aleatorio.randint(1, 12)
+            if not livre(noites, quarto, inicio, fim):
+                continue
+            calendario.marcar(quarto, inicio, fim)
+            noites[quarto] |= {n for n in range(inicio, fim) if DIA_INICIAL <= n < DIA_INICIAL + HORIZONTE}
+            estadias.append((quarto, inicio, fim))
+        
+        quarto = aleatorio.choice(QUARTOS + [999])
+        noites.setdefault(quarto, set())
+        inicio = DIA_INICIAL + aleatorio.randint(0, HORIZONTE - 1)
+        fim = min(inicio + aleatorio.randint(1, 15), DIA_INICIAL + HORIZONTE)
+        assert calendario.livre(quarto, inicio, fim) == livre(noites, quarto, inicio, fim)
+        assert calendario.quartos_ocupados(inicio, fim) == {q for q in QUARTOS if not livre(noites, q, inicio, fim)}
+        
+        quantidade = aleatorio.randint(1, 10)
+        primeiro = DIA_INICIAL + aleatorio.randint(0, HORIZONTE - quantidade)
+        ultimo = min(primeiro + aleatorio.randint(0, 30), DIA_INICIAL + HORIZONTE - quantidade)
+        esperado = [d for d in range(primeiro, ultimo + 1) if livre(noites, quarto, d, d + quantidade)]
+        assert calendario.inicios_livres(quarto, primeiro, ultimo, quantidade) == esperado
+
+
+def test_limites_do_horizonte():
+    calendario = CalendarioDeOcupacao(DIA_INICIAL, HORIZONTE)
+    assert calendario.cobre(DIA_INICIAL, DIA_INICIAL + HORIZONTE)
+    assert not calendario.cobre(DIA_INICIAL - 1, DIA_INICIAL + 1)
+    assert not calendario.cobre(DIA_INICIAL, DIA_INICIAL + HORIZONTE + 1)
+    
+    # A parte fora do horizonte é ignorada; a de dentro fica marcada
+    calendario.marcar(101, DIA_INICIAL - 5, DIA_INICIAL + 2)
+    calendario.marcar(102, DIA_INICIAL + HORIZONTE - 1, DIA_INICIAL + HORIZONTE + 10)
+    assert calendario.inicios_livres(101, DIA_INICIAL, DIA_INICIAL + 5, 1) == list(range(DIA_INICIAL + 2, DIA_INICIAL + 6))
+    assert calendario.quartos_ocupados(DIA_INICIAL + HORIZONTE - 1, DIA_INICIAL + HORIZONTE) == {102}
+    assert calendario.inicios_livres(102, DIA_INICIAL + HORIZONTE - 3, DIA_INICIAL + HORIZONTE - 2, 1) == [
+        DIA_INICIAL + HORIZONTE - 3, DIA_INICIAL + HORIZONTE - 2]
+    
+    # Uma estadia com a mesma noite de check-out e check-in seguinte não conflita
+    calendario.desmarcar(101, DIA_INICIAL - 5, DIA_INICIAL + 2)
+    calendario.marcar(101, DIA_INICIAL + 10, DIA_INICIAL + 12)
+    assert calendario.livre(101, DIA_INICIAL + 12, DIA_INICIAL + 14)
+    assert calendario.livre(101, DIA_INICIAL + 8, DIA_INICIAL + 10)
+    assert not calendario.livre(101, DIA_INICIAL + 11, DIA_INICIAL + 13)
+
+
+def test_gerenciador_mantem_o_calendario_igual_ao_indice(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    aleatorio = random.Random(11)
+    hoje = date.today().toordinal()
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    quartos = [q.numero for q in gerenciador.listar_quartos()]
+    for _ in range(300):
+        reservas = gerenciador.listar_reservas()
+        if reservas and aleatorio.random() < 0.3:
+            reserva = aleatorio.choice(reservas)
+            if aleatorio.random() < 0.5:
+                gerenciador.cancelar_reserva(reserva.id)
+            else:
+                dia = hoje + aleatorio.randint(-5, 60)
+                gerenciador.atualizar_reserva(reserva.id, data(dia), data(dia + aleatorio.randint(1, 6)), reserva.status)
+        else:
+            dia = hoje + aleatorio.randint(-5, 60)
+            gerenciador.criar_reserva(cliente.id, aleatorio.choice(quartos), data(dia), data(dia + aleatorio.randint(1, 6)))
+        
+        # Consultas respondidas pelo calendário e pela varredura das estadias de cada quarto
+        inicio = hoje + aleatorio.randint(0, 60)
+        fim = inicio + aleatorio.randint(1, 6)
+        esperado = [q.numero for q in gerenciador.listar_quartos()
+                    if not gerenciador.estadias_do_quarto(q.numero, inicio, fim)]
+        assert [q.numero for q in gerenciador.listar_quartos_disponiveis(data(inicio), data(fim))] == esperado
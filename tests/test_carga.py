@@ -0,0 +1,124 @@
+"""Carga dos dados: leitura incremental do JSON, datas e reservas encerradas sob demanda"""
+import io
+import json
+import random
+
+import pytest
+
+from armazenamento import LeitorJSONIncremental
+from auxiliares import PRIMEIRO_DIA, data, estado, operacoes_aleatorias
+from datas import converter_data_para_ordinal
+from dominio import Cliente, GerenciadorDeReservas, Reserva
+
+
+def valor_aleatorio(aleatorio, profundidade=0):
+    sorteio = aleatorio.random()
+    if sorteio < 0.2:
+        return aleatorio.choice([None, True, False, 0, -17, 3.25, 1e21, 123456789012345678901234567890])
+    if sorteio < 0.5 or profundidade > 2:
+        return "".join(aleatorio.choice('ab "\\/\n\tçã€😀{}[],:') for _ in range(aleatorio.randint(0, 12)))
+    if sorteio < 0.75:
+        return [valor_aleatorio(aleatorio, profundidade + 1) for _ in range(aleatorio.randint(0, 4))]
+    return {f"k{i}": valor_aleatorio(aleatorio, profundidade + 1) for i in range(aleatorio.randint(0, 4))}
+
+
+@pytest.mark.parametrize("semente", range(10))
+def test_leitor_incremental_igual_ao_json_load(monkeypatch, semente):
+    aleatorio = random.Random(semente)
+    # Blocos minúsculos: quase todo valor fica dividido entre dois ou mais blocos
+    monkeypatch.setattr(LeitorJSONIncremental, "TAMANHO_BLOCO", aleatorio.randint(1, 7))
+    documento = {
+        "clientes": [valor_aleatorio(aleatorio) for _ in range(aleatorio.randint(0, 20))],
+        "versao": valor_aleatorio(aleatorio),
+        "quartos": [],
+        "reservas": [valor_aleatorio(aleatorio) for _ in range(aleatorio.randint(0, 20))],
+    }
+    texto = json.dumps(documento, indent=aleatorio.choice([None, 0, 4]), ensure_ascii=aleatorio.random() < 0.5)
+    
+    itens = list(LeitorJSONIncremental(io.StringIO(texto)))
+    
+    esperado = [(secao, item) for secao, lista in documento.items() if isinstance(lista, list) for item in lista]
+    assert itens == esperado
+
+
+@pytest.mark.parametrize("texto", ['', '{"clientes": [1, 2', '{"clientes": [1 2]}', '[1, 2]', '{"clientes": [1], }'])
+def test_leitor_incremental_recusa_json_invalido(monkeypatch, texto):
+    monkeypatch.setattr(LeitorJSONIncremental, "TAMANHO_BLOCO", 3)
+    with pytest.raises(ValueError):
+        list(LeitorJSONIncremental(io.StringIO(texto)))
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("05-03-2031", (2031, 3, 5)),
+    ("5-3-2031", (2031, 3, 5)),
+    ("29-02-2032", (2032, 2, 29)),
+    ("29-02-2031", None),
+    ("05-03-31", None),
+    ("05-03-02031", None),
+    ("05/03/2031", None),
+    (" 5-03-2031", None),
+    ("+5-03-2031", None),
+    ("05-03-２０３１", None),
+    ("", None),
+    (None, None),
+    (20310305, None),
+    (["05", "03", "2031"], None),
+])
+def test_converter_data_para_ordinal(texto, esperado):
+    from datetime import date
+    assert converter_data_para_ordinal(texto) == (date(*esperado).toordinal() if esperado else None)
+
+
+def test_reservas_encerradas_carregadas_sob_demanda(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    reservas = [gerenciador.criar_reserva(cliente.id, 101, data(PRIMEIRO_DIA + 3 * i), data(PRIMEIRO_DIA + 3 * i + 2))
+                for i in range(10)]
+    for reserva in reservas[:6]:
+        gerenciador.atualizar_reserva(reserva.id, reserva.check_in, reserva.check_out,
+                                      "Cancelada" if reserva is reservas[0] else "Concluída")
+    gerenciador._salvar_dados()
+    
+    reaberto = GerenciadorDeReservas(arquivo_dados)
+    # Só as reservas ativas viram objetos na carga
+    assert sum(isinstance(r, tuple) for r in reaberto._reservas.values()) == 6
+    assert reaberto.obter_reserva_por_id(reservas[1].id).to_dict() == gerenciador.obter_reserva_por_id(reservas[1].id).to_dict()
+    assert isinstance(reaberto._reservas[reservas[1].id], Reserva)
+    assert estado(reaberto) == estado(gerenciador)
+    assert not any(isinstance(r, tuple) for r in reaberto._reservas.values())
+
+
+def test_snapshot_invalido_nao_e_sobrescrito(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    operacoes_aleatorias(gerenciador, random.Random(4), 50)
+    gerenciador._salvar_dados()
+    with open(arquivo_dados) as arquivo:
+        conteudo = arquivo.read()
+    with open(arquivo_dados, "w") as arquivo:
+        arquivo.write(conteudo[:len(conteudo) // 2])
+    
+    with pytest.raises(ValueError):
+        GerenciadorDeReservas(arquivo_dados)
+    with open(arquivo_dados) as arquivo:
+        assert arquivo.read() == conteudo[:len(conteudo) // 2]
+
+
+def test_reservas_compartilham_o_uuid_do_cliente(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    # Uma cópia do UUID (como a que chega de um formulário) não fica guardada na reserva
+    copia = cliente.id.encode().decode()
+    assert copia is not cliente.id
+    for i in range(3):
+        reserva = gerenciador.criar_reserva(copia, 101, data(PRIMEIRO_DIA + 2 * i), data(PRIMEIRO_DIA + 2 * i + 1))
+        assert reserva.cliente_id is cliente.id
+    gerenciador._salvar_dados()
+    
+    reaberto = GerenciadorDeReservas(arquivo_dados)
+    uuid = reaberto.obter_cliente_por_id(cliente.id).id
+    assert all(r.cliente_id is uuid for r in reaberto.listar_reservas_por_cliente(cliente.id))
+    # Sem o cliente, as reservas também saem do índice por cliente
+    reaberto.remover_cliente(cliente.id)
+    assert reaberto._reservas_por_cliente == {}
@@ -0,0 +1,125 @@
+"""Importação em lote: validação de cada linha e sobreposições resolvidas na ordem do arquivo"""
+import json
+import random
+
+from auxiliares import PRIMEIRO_DIA, QUARTOS, data
+from dominio import Cliente, GerenciadorDeReservas
+
+
+def escrever_jsonl(caminho, registros):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for registro in registros:
+            arquivo.write((registro if isinstance(registro, str) else json.dumps(registro)) + "\n")
+    return caminho
+
+
+def reserva(cliente_id, quarto, inicio, noites, status="Confirmada"):
+    return {"cliente_id": cliente_id, "quarto_numero": quarto, "check_in": data(PRIMEIRO_DIA + inicio),
+            "check_out": data(PRIMEIRO_DIA + inicio + noites), "status": status}
+
+
+def test_primeira_linha_do_arquivo_tem_preferencia(arquivo_dados, tmp_path):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    linhas = [
+        reserva(cliente.id, 101, 0, 2),
+        reserva(cliente.id, 101, 3, 2),
+        reserva(cliente.id, 101, 1, 1),    # sobrepõe a linha 1
+        reserva(cliente.id, 101, 6, 2),
+        reserva(cliente.id, 101, 0, 9, "Cancelada"),
+        reserva(cliente.id, 102, 0, 5),
+        reserva(cliente.id, 102, 5, 1),
+        reserva(cliente.id, 101, 0, 30),   # estadia longa depois das outras: é ela que fica de fora
+    ]
+    relatorio = gerenciador.importar_arquivo(escrever_jsonl(str(tmp_path / "reservas.jsonl"), linhas), "reservas")
+    
+    assert relatorio.importados == 6
+    assert relatorio.rejeitados == [(3, "Sobreposição com outra reserva do arquivo"),
+                                    (8, "Sobreposição com outra reserva do arquivo")]
+    assert sorted(inicio - PRIMEIRO_DIA for inicio, _, _ in gerenciador.estadias_do_quarto(101, 0, 10 ** 7)) == [0, 3, 6]
+
+
+def test_motivos_de_rejeicao(arquivo_dados, tmp_path):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    gerenciador.criar_reserva(cliente.id, 201, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 5))
+    existente = gerenciador.listar_reservas()[0]
+    linhas = [
+        "não é JSON",
+        {"cliente_id": cliente.id, "quarto_numero": 101, "check_in": data(PRIMEIRO_DIA)},
+        dict(reserva(cliente.id, 101, 0, 1), quarto_numero="cento e um"),
+        dict(reserva(cliente.id, 101, 0, 1), check_in=["01", "01", "2031"]),
+        dict(reserva(cliente.id, 101, 0, 1), id=existente.id),
+        reserva("ninguem", 101, 0, 1),
+        reserva(cliente.id, 999, 0, 1),
+        reserva(cliente.id, 101, 4, 0),
+        reserva(cliente.id, 201, 4, 2),
+        dict(reserva(cliente.id, 101, 0, 1), id=["lista"]),
+        reserva(cliente.id, 101, 0, 1),
+    ]
+    relatorio = gerenciador.importar_arquivo(escrever_jsonl(str(tmp_path / "reservas.jsonl"), linhas), "reservas")
+    
+    assert relatorio.importados == 1
+    assert relatorio.rejeitados == [
+        (1, "Registro inválido"),
+        (2, "Campo obrigatório ausente: 'check_out'"),
+        (3, "Número do quarto inválido"),
+        (4, "Data inválida (use DD-MM-YYYY)"),
+        (5, f"Reserva já existe: {existente.id}"),
+        (6, "Cliente não encontrado: ninguem"),
+        (7, "Quarto não encontrado: 999"),
+        (8, "Check-out deve ser posterior ao check-in"),
+        (9, "Quarto indisponível no período"),
+        (10, "Id da reserva inválido"),
+    ]
+
+
+def test_igual_a_cadastrar_linha_por_linha(arquivo_dados, tmp_path):
+    aleatorio = random.Random(5)
+    importado = GerenciadorDeReservas(arquivo_dados)
+    um_a_um = GerenciadorDeReservas(str(tmp_path / "um_a_um.json"))
+    clientes = [Cliente(f"Cliente {i}", "1", f"c{i}@hotel") for i in range(5)]
+    for cliente in clientes:
+        importado.adicionar_cliente(cliente)
+        um_a_um.adicionar_cliente(Cliente(cliente.nome, cliente.telefone, cliente.email, cliente.id))
+    linhas = [reserva(aleatorio.choice(clientes).id, aleatorio.choice(QUARTOS), aleatorio.randint(0, 60),
+                      aleatorio.randint(1, 8), aleatorio.choice(["Confirmada", "Pendente", "Cancelada"]))
+              for _ in range(400)]
+    
+    relatorio = importado.importar_arquivo(escrever_jsonl(str(tmp_path / "reservas.jsonl"), linhas), "reservas")
+    
+    # Referência: criar_reserva recusa o que sobrepõe o que já foi aceito antes
+    # (reservas canceladas não ocupam o quarto e sempre entram)
+    aceitas = 0
+    for linha in linhas:
+        if linha["status"] == "Cancelada" or um_a_um.criar_reserva(
+                linha["cliente_id"], linha["quarto_numero"], linha["check_in"], linha["check_out"]):
+            aceitas += 1
+    assert relatorio.importados == aceitas
+    for numero in QUARTOS:
+        estadias = [(i, f) for i, f, _ in importado.estadias_do_quarto(numero, 0, 10 ** 7)]
+        referencia = [(i, f) for i, f, _ in um_a_um.estadias_do_quarto(numero, 0, 10 ** 7)]
+        assert sorted(estadias) == sorted(referencia)
+
+
+def test_importacao_grava_uma_vez(arquivo_dados, tmp_path):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    caminho = str(tmp_path / "clientes.csv")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("nome,telefone,email\n")
+        for i in range(50):
+            arquivo.write(f"Cliente {i},1199,c{i}@hotel\n")
+        arquivo.write(",1199,vazio@hotel\n")
+    avisos = []
+    gerenciador.inscrever(avisos.append)
+    
+    relatorio = gerenciador.importar_arquivo(caminho, "clientes")
+    
+    assert relatorio.importados == 50
+    assert relatorio.rejeitados == [(52, "Nome vazio")]
+    assert len(avisos) == 50
+    with open(arquivo_dados + ".journal") as arquivo:
+        assert len(arquivo.readlines()) == 50
+    assert len(GerenciadorDeReservas(arquivo_dados).listar_clientes()) == 50
@@ -0,0 +1,63 @@
+"""Índice de estadias por quarto (IntervalosDoQuarto) comparado com uma lista simples"""
+import random
+
+import pytest
+
+from dominio import IntervalosDoQuarto
+
+
+def sobrepoe(estadias, inicio, fim):
+    return any(a < fim and inicio < b for a, b, _ in estadias)
+
+
+def no_periodo(estadias, inicio, fim):
+    return sorted(e for e in estadias if e[0] < fim and inicio < e[1])
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_consultas_iguais_a_varredura(semente):
+    aleatorio = random.Random(semente)
+    intervalos = IntervalosDoQuarto()
+    estadias = []
+    for i in range(400):
+        if estadias and aleatorio.random() < 0.3:
+            inicio, fim, reserva_id = estadias.pop(aleatorio.randrange(len(estadias)))
+            assert intervalos.remover(inicio, reserva_id)
+        else:
+            # Estadias sobrepostas também entram (edições antigas podem tê-las gravado)
+            inicio = aleatorio.randint(0, 200)
+            estadia = (inicio, inicio + aleatorio.randint(1, 30), f"r{i}")
+            estadias.append(estadia)
+            intervalos.adicionar(*estadia)
+        assert len(intervalos) == len(estadias)
+        inicio = aleatorio.randint(-10, 240)
+        fim = inicio + aleatorio.randint(1, 20)
+        assert intervalos.sobrepoe(inicio, fim) == sobrepoe(estadias, inicio, fim)
+        assert sorted(intervalos.estadias_no_periodo(inicio, fim)) == no_periodo(estadias, inicio, fim)
+
+
+def test_carregar_em_lote_equivale_a_adicionar():
+    aleatorio = random.Random(7)
+    estadias = []
+    for i in range(300):
+        inicio = aleatorio.randint(0, 500)
+        estadias.append((inicio, inicio + aleatorio.randint(1, 15), f"r{i}"))
+    em_lote, um_a_um = IntervalosDoQuarto(), IntervalosDoQuarto()
+    em_lote.carregar(list(estadias))
+    for estadia in estadias:
+        um_a_um.adicionar(*estadia)
+    for inicio in range(-5, 520, 3):
+        # Estadias com o mesmo check-in podem sair em ordem diferente
+        assert sorted(em_lote.estadias_no_periodo(inicio, inicio + 4)) == sorted(um_a_um.estadias_no_periodo(inicio, inicio + 4))
+        assert em_lote.sobrepoe(inicio, inicio + 4) == um_a_um.sobrepoe(inicio, inicio + 4)
+
+
+def test_check_out_no_dia_do_check_in_seguinte_nao_sobrepoe():
+    intervalos = IntervalosDoQuarto()
+    intervalos.adicionar(10, 15, "a")
+    assert not intervalos.sobrepoe(15, 18)
+    assert not intervalos.sobrepoe(5, 10)
+    assert intervalos.sobrepoe(14, 16)
+    assert not intervalos.remover(10, "outra")
+    assert intervalos.remover(10, "a")
+    assert not intervalos.sobrepoe(10, 15)
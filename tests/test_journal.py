@@ -0,0 +1,48 @@
+"""Journal de alterações: reaplicação ao reabrir, compactação e registros incompletos"""
+import os
+import random
+
+from armazenamento import ArmazenamentoJSON
+from auxiliares import estado, operacoes_aleatorias
+from dominio import Cliente, GerenciadorDeReservas
+
+
+def test_journal_reaplicado_ao_reabrir(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    tamanho_snapshot = os.path.getsize(arquivo_dados)
+    operacoes_aleatorias(gerenciador, random.Random(1), 200)
+    
+    # As alterações foram para o journal, sem regravar o snapshot
+    assert os.path.getsize(arquivo_dados + ".journal") > 0
+    assert os.path.getsize(arquivo_dados) == tamanho_snapshot
+    assert estado(GerenciadorDeReservas(arquivo_dados)) == estado(gerenciador)
+
+
+def test_compactacao_substitui_o_journal_pelo_snapshot(arquivo_dados, monkeypatch):
+    monkeypatch.setattr(ArmazenamentoJSON, "TAMANHO_MINIMO_COMPACTACAO", 0)
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    with open(arquivo_dados) as arquivo:
+        snapshot_inicial = arquivo.read()
+    aleatorio = random.Random(2)
+    for _ in range(20):
+        operacoes_aleatorias(gerenciador, aleatorio, 20)
+        # O journal nunca passa do tamanho do snapshot: ao passar, vira um snapshot novo
+        if os.path.exists(arquivo_dados + ".journal"):
+            assert os.path.getsize(arquivo_dados + ".journal") <= os.path.getsize(arquivo_dados)
+        assert estado(GerenciadorDeReservas(arquivo_dados)) == estado(gerenciador)
+    with open(arquivo_dados) as arquivo:
+        assert arquivo.read() != snapshot_inicial
+
+
+def test_registro_incompleto_no_fim_do_journal_e_descartado(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    operacoes_aleatorias(gerenciador, random.Random(3), 100)
+    with open(arquivo_dados + ".journal", "a") as arquivo:
+        arquivo.write('{"op":"salvar","tipo":"cli')
+    
+    # O registro incompleto é ignorado e o journal é compactado, para aceitar novos registros
+    reaberto = GerenciadorDeReservas(arquivo_dados)
+    assert estado(reaberto) == estado(gerenciador)
+    assert not os.path.exists(arquivo_dados + ".journal")
+    reaberto.adicionar_cliente(Cliente("Depois", "1", "depois@hotel"))
+    assert estado(GerenciadorDeReservas(arquivo_dados)) == estado(reaberto)
@@ -0,0 +1,49 @@
+"""Gravação em segundo plano: tudo gravado ao fechar e nenhuma alteração depois disso"""
+import random
+
+import pytest
+
+from auxiliares import PRIMEIRO_DIA, data, estado, operacoes_aleatorias
+from dominio import Cliente, GerenciadorDeReservas, Quarto
+
+
+def test_fechar_grava_tudo_que_estava_na_fila(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados, gravacao_em_segundo_plano=True)
+    operacoes_aleatorias(gerenciador, random.Random(1), 300)
+    gerenciador.fechar()
+    assert estado(GerenciadorDeReservas(arquivo_dados)) == estado(gerenciador)
+
+
+@pytest.mark.parametrize("gravacao_em_segundo_plano", [False, True])
+def test_alteracoes_depois_de_fechar_sao_recusadas(arquivo_dados, gravacao_em_segundo_plano):
+    gerenciador = GerenciadorDeReservas(arquivo_dados, gravacao_em_segundo_plano=gravacao_em_segundo_plano)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    reserva = gerenciador.criar_reserva(cliente.id, 101, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 2))
+    gerenciador.fechar()
+    antes = estado(gerenciador)
+    avisos = []
+    gerenciador.inscrever(avisos.append)
+    
+    alteracoes = [
+        lambda: gerenciador.adicionar_cliente(Cliente("Depois", "1", "depois@hotel")),
+        lambda: gerenciador.atualizar_cliente(cliente.id, "Outro", "2", "outro@hotel"),
+        lambda: gerenciador.remover_cliente(cliente.id),
+        lambda: gerenciador.adicionar_quarto(Quarto(900, "Single", 100.0)),
+        lambda: gerenciador.atualizar_quarto(101, "Suite", 500.0, False),
+        lambda: gerenciador.remover_quarto(101),
+        lambda: gerenciador.criar_reserva(cliente.id, 102, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 2)),
+        lambda: gerenciador.atualizar_reserva(reserva.id, reserva.check_in, reserva.check_out, "Concluída"),
+        lambda: gerenciador.cancelar_reserva(reserva.id),
+    ]
+    for alterar in alteracoes:
+        with pytest.raises(RuntimeError):
+            alterar()
+    with pytest.raises(RuntimeError):
+        with gerenciador.transacao():
+            pass
+    
+    # Nada mudou na memória, ninguém foi avisado e o arquivo continua igual à memória
+    assert estado(gerenciador) == antes
+    assert avisos == []
+    assert estado(GerenciadorDeReservas(arquivo_dados)) == antes
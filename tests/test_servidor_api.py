@@ -0,0 +1,101 @@
+"""Rotas da API: a mesma entrada inválida recebe o mesmo status em todas as rotas"""
+from datetime import date
+
+import pytest
+
+from auxiliares import PRIMEIRO_DIA, data
+from dominio import CalendarioDeOcupacao, Cliente, GerenciadorDeReservas
+from servidor_api import despachar
+
+
+@pytest.fixture
+def gerenciador(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    gerenciador.adicionar_cliente(Cliente("Ana", "1", "ana@hotel", "ana"))
+    return gerenciador
+
+
+def nova_reserva(quarto, inicio, noites):
+    return {"cliente_id": "ana", "quarto_numero": quarto, "check_in": data(PRIMEIRO_DIA + inicio),
+            "check_out": data(PRIMEIRO_DIA + inicio + noites)}
+
+
+@pytest.mark.parametrize("metodo, alvo", [("POST", "/clientes"), ("PUT", "/clientes/ana")])
+@pytest.mark.parametrize("nome", ["", "   ", None, 7])
+def test_nome_invalido_do_cliente(gerenciador, metodo, alvo, nome):
+    status, _ = despachar(gerenciador, metodo, alvo, {"nome": nome, "telefone": "1", "email": "a@hotel"})
+    assert status == 400
+    assert gerenciador.obter_cliente_por_id("ana").nome == "Ana"
+    assert len(gerenciador.listar_clientes()) == 1
+
+
+@pytest.mark.parametrize("metodo, alvo", [("POST", "/quartos"), ("PUT", "/quartos/101")])
+@pytest.mark.parametrize("campos", [{"preco": -1}, {"preco": "caro"}, {"tipo": ""}, {"disponivel": "false"}])
+def test_quarto_invalido(gerenciador, metodo, alvo, campos):
+    preco = gerenciador.obter_quarto_por_numero(101).preco
+    status, _ = despachar(gerenciador, metodo, alvo, dict({"numero": 501, "tipo": "Single", "preco": 90.0}, **campos))
+    assert status == 400
+    assert gerenciador.obter_quarto_por_numero(101).preco == preco
+    assert gerenciador.obter_quarto_por_numero(501) is None
+
+
+@pytest.mark.parametrize("campos", [{"check_in": "31-02-2031"}, {"check_out": "2031-01-05"}, {"check_in": 20310101},
+                                    {"check_out": data(PRIMEIRO_DIA)}])
+def test_datas_invalidas_da_reserva(gerenciador, campos):
+    existente = despachar(gerenciador, "POST", "/reservas", nova_reserva(101, 0, 3))[1]
+    
+    assert despachar(gerenciador, "POST", "/reservas", dict(nova_reserva(102, 0, 3), **campos))[0] == 400
+    assert despachar(gerenciador, "PUT", f"/reservas/{existente['id']}", campos)[0] == 400
+    assert [r.to_dict() for r in gerenciador.listar_reservas()] == [existente]
+
+
+def test_sobreposicao_da_reserva(gerenciador):
+    primeira = despachar(gerenciador, "POST", "/reservas", nova_reserva(101, 0, 3))[1]
+    segunda = despachar(gerenciador, "POST", "/reservas", nova_reserva(101, 5, 2))[1]
+    
+    assert despachar(gerenciador, "POST", "/reservas", nova_reserva(101, 2, 2))[0] == 409
+    alteracao = {"check_in": data(PRIMEIRO_DIA + 2), "check_out": data(PRIMEIRO_DIA + 6)}
+    assert despachar(gerenciador, "PUT", f"/reservas/{primeira['id']}", alteracao)[0] == 409
+    assert gerenciador.obter_reserva_por_id(primeira["id"]).check_out == primeira["check_out"]
+    
+    # A reserva pode ocupar as próprias noites; cancelada, libera as noites para outra
+    assert despachar(gerenciador, "PUT", f"/reservas/{primeira['id']}",
+                     {"check_out": data(PRIMEIRO_DIA + 5)})[0] == 200
+    assert despachar(gerenciador, "POST", f"/reservas/{segunda['id']}/cancelamento", None)[0] == 200
+    assert despachar(gerenciador, "POST", "/reservas", nova_reserva(101, 5, 1))[0] == 201
+    assert despachar(gerenciador, "PUT", f"/reservas/{segunda['id']}", {"status": "Confirmada"})[0] == 409
+    assert despachar(gerenciador, "PUT", "/reservas/ninguem", {"status": "Confirmada"})[0] == 404
+
+
+def test_gerenciador_recusa_sobreposicao_na_alteracao(gerenciador):
+    # O mesmo caminho usado pela tela de edição, sem passar pela API
+    primeira = gerenciador.criar_reserva("ana", 101, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 3))
+    gerenciador.criar_reserva("ana", 101, data(PRIMEIRO_DIA + 3), data(PRIMEIRO_DIA + 5))
+    
+    assert not gerenciador.atualizar_reserva(primeira.id, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 4), "Confirmada")
+    assert not gerenciador.atualizar_reserva(primeira.id, data(PRIMEIRO_DIA + 2), data(PRIMEIRO_DIA + 1), "Confirmada")
+    assert not gerenciador.atualizar_reserva(primeira.id, "31-02-2031", data(PRIMEIRO_DIA + 1), "Confirmada")
+    assert not gerenciador.atualizar_reserva(primeira.id, primeira.check_in, primeira.check_out, "Perdida")
+    assert gerenciador.obter_reserva_por_id(primeira.id).check_out == data(PRIMEIRO_DIA + 3)
+    assert gerenciador.atualizar_reserva(primeira.id, data(PRIMEIRO_DIA + 1), data(PRIMEIRO_DIA + 3), "Pendente")
+
+
+@pytest.mark.parametrize("consulta, status", [
+    ("noites=0", 400),
+    (f"noites={CalendarioDeOcupacao.HORIZONTE + 1}", 400),
+    ("flexibilidade=-1", 400),
+    (f"flexibilidade={CalendarioDeOcupacao.HORIZONTE + 1}", 400),
+    ("limite=-1", 400),
+    ("noites=dois", 400),
+    (f"noites={CalendarioDeOcupacao.HORIZONTE}&flexibilidade={CalendarioDeOcupacao.HORIZONTE}&limite=0", 200),
+])
+def test_limites_da_busca(gerenciador, consulta, status):
+    amanha = data(date.today().toordinal() + 1)
+    assert despachar(gerenciador, "GET", f"/busca?check_in={amanha}&{consulta}", None)[0] == status
+
+
+def test_busca_com_data_invalida(gerenciador):
+    assert despachar(gerenciador, "GET", "/busca?check_in=31-02-2031", None)[0] == 400
+    assert despachar(gerenciador, "GET", "/busca?noites=2", None)[0] == 400
+    status, opcoes = despachar(gerenciador, "GET", f"/busca?check_in={data(PRIMEIRO_DIA)}&noites=2&limite=3", None)
+    assert status == 200 and len(opcoes) == 3
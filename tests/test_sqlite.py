@@ -0,0 +1,80 @@
+"""Armazenamento em banco SQLite: reabertura, falhas de gravação e bancos de versões anteriores"""
+import random
+import sqlite3
+
+import pytest
+
+from armazenamento import ArmazenamentoSQLite
+from auxiliares import PRIMEIRO_DIA, data, estado, operacoes_aleatorias
+from dominio import Cliente, GerenciadorDeReservas
+
+
+@pytest.fixture
+def arquivo_banco(tmp_path):
+    return str(tmp_path / "dados_hotel.db")
+
+
+def test_dados_iguais_ao_reabrir(arquivo_banco):
+    gerenciador = GerenciadorDeReservas(arquivo_banco)
+    assert isinstance(gerenciador._armazenamento, ArmazenamentoSQLite)
+    operacoes_aleatorias(gerenciador, random.Random(1), 300)
+    with gerenciador.transacao():
+        operacoes_aleatorias(gerenciador, random.Random(2), 50)
+    gerenciador.fechar()
+    assert estado(GerenciadorDeReservas(arquivo_banco)) == estado(gerenciador)
+
+
+def test_gravacao_em_segundo_plano(arquivo_banco):
+    gerenciador = GerenciadorDeReservas(arquivo_banco, gravacao_em_segundo_plano=True)
+    operacoes_aleatorias(gerenciador, random.Random(3), 200)
+    gerenciador.fechar()
+    assert estado(GerenciadorDeReservas(arquivo_banco)) == estado(gerenciador)
+
+
+def test_falha_na_gravacao_e_recuperada_pelo_snapshot(arquivo_banco, monkeypatch):
+    gerenciador = GerenciadorDeReservas(arquivo_banco)
+    executar = ArmazenamentoSQLite._executar
+    falhas = []
+    
+    def falhar_uma_vez(self, operacao, tipo, dados):
+        if not falhas:
+            falhas.append(tipo)
+            raise sqlite3.OperationalError("disk I/O error")
+        executar(self, operacao, tipo, dados)
+    
+    monkeypatch.setattr(ArmazenamentoSQLite, "_executar", falhar_uma_vez)
+    perdido = Cliente("Perdido", "1", "perdido@hotel")
+    gerenciador.adicionar_cliente(perdido)
+    
+    # O registro que falhou não se perde: o snapshot seguinte regrava tudo
+    assert falhas == ["cliente"]
+    assert not gerenciador._armazenamento.precisa_compactar
+    reaberto = GerenciadorDeReservas(arquivo_banco)
+    assert reaberto.obter_cliente_por_id(perdido.id) is not None
+    assert estado(reaberto) == estado(gerenciador)
+
+
+def test_banco_com_esquema_anterior(arquivo_banco):
+    conexao = sqlite3.connect(arquivo_banco)
+    conexao.executescript("""
+        CREATE TABLE reservas (
+            id TEXT PRIMARY KEY, cliente_id TEXT NOT NULL, quarto_numero INTEGER NOT NULL,
+            check_in TEXT NOT NULL, check_out TEXT NOT NULL,
+            dia_check_in INTEGER, dia_check_out INTEGER, status TEXT NOT NULL
+        );
+        CREATE INDEX idx_reservas_quarto_datas ON reservas (quarto_numero, dia_check_in, dia_check_out);
+        CREATE INDEX idx_reservas_status ON reservas (status);
+    """)
+    conexao.close()
+    
+    gerenciador = GerenciadorDeReservas(arquivo_banco)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    reserva = gerenciador.criar_reserva(cliente.id, 101, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 3))
+    gerenciador.fechar()
+    
+    assert GerenciadorDeReservas(arquivo_banco).obter_reserva_por_id(reserva.id).to_dict() == reserva.to_dict()
+    conexao = sqlite3.connect(arquivo_banco)
+    indices = {nome for nome, in conexao.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    conexao.close()
+    assert not indices & {"idx_reservas_quarto_datas", "idx_reservas_status"}
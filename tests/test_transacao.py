@@ -0,0 +1,63 @@
+"""Transações: desfazer restaura o estado, aninhamento e gravação única ao confirmar"""
+import os
+import random
+
+import pytest
+
+from auxiliares import PRIMEIRO_DIA, data, estado, operacoes_aleatorias
+from dominio import Cliente, GerenciadorDeReservas, Quarto
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_transacao_desfeita_restaura_o_estado(arquivo_dados, semente):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    aleatorio = random.Random(semente)
+    operacoes_aleatorias(gerenciador, aleatorio, 80)
+    antes = estado(gerenciador)
+    tamanho_journal = os.path.getsize(arquivo_dados + ".journal")
+    avisos = []
+    gerenciador.inscrever(avisos.append)
+    
+    with pytest.raises(RuntimeError):
+        with gerenciador.transacao():
+            operacoes_aleatorias(gerenciador, aleatorio, 60)
+            raise RuntimeError("desfazer")
+    
+    assert estado(gerenciador) == antes
+    assert avisos == []
+    assert os.path.getsize(arquivo_dados + ".journal") == tamanho_journal
+    assert estado(GerenciadorDeReservas(arquivo_dados)) == antes
+    # Os índices também voltaram: o mesmo período pode ser reservado de novo
+    cliente = Cliente("Novo", "1", "novo@hotel")
+    gerenciador.adicionar_cliente(cliente)
+    livres = gerenciador.listar_quartos_disponiveis(data(PRIMEIRO_DIA + 100), data(PRIMEIRO_DIA + 102))
+    assert gerenciador.criar_reserva(cliente.id, livres[0].numero, data(PRIMEIRO_DIA + 100), data(PRIMEIRO_DIA + 102))
+
+
+def test_transacao_aninhada_faz_parte_da_externa(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    antes = estado(gerenciador)
+    with pytest.raises(ValueError):
+        with gerenciador.transacao():
+            gerenciador.adicionar_cliente(Cliente("Externo", "1", "externo@hotel"))
+            with gerenciador.transacao():
+                gerenciador.adicionar_quarto(Quarto(900, "Single", 100.0))
+            raise ValueError("desfazer")
+    assert estado(gerenciador) == antes
+
+
+def test_transacao_confirmada_grava_e_avisa_uma_vez(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados)
+    avisos = []
+    gerenciador.inscrever(avisos.append)
+    cliente = Cliente("Ana", "1", "ana@hotel")
+    with gerenciador.transacao():
+        gerenciador.adicionar_cliente(cliente)
+        reserva = gerenciador.criar_reserva(cliente.id, 101, data(PRIMEIRO_DIA), data(PRIMEIRO_DIA + 2))
+        # Os avisos só saem quando a transação termina
+        assert avisos == []
+    
+    assert [(a.entidade, a.tipo) for a in avisos] == [("cliente", "criado"), ("reserva", "criado")]
+    with open(arquivo_dados + ".journal") as arquivo:
+        assert len(arquivo.readlines()) == 2
+    assert GerenciadorDeReservas(arquivo_dados).obter_reserva_por_id(reserva.id).to_dict() == reserva.to_dict()
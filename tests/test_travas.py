@@ -0,0 +1,116 @@
+"""Trava de leitura/escrita e o gerenciador compartilhado por várias threads"""
+import random
+import threading
+
+import pytest
+
+from auxiliares import PRIMEIRO_DIA, QUARTOS, data, estado
+from dominio import Cliente, GerenciadorDeReservas
+from travas import TravaLeituraEscrita
+
+
+def test_leitores_simultaneos():
+    trava = TravaLeituraEscrita()
+    barreira = threading.Barrier(3, timeout=5)
+    
+    def ler():
+        with trava.leitura():
+            barreira.wait()
+    
+    threads = [threading.Thread(target=ler) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not barreira.broken
+
+
+def test_escritor_exclusivo_e_com_preferencia():
+    trava = TravaLeituraEscrita()
+    ordem = []
+    leitura_iniciada = threading.Event()
+    liberar_leitura = threading.Event()
+    
+    def primeiro_leitor():
+        with trava.leitura():
+            leitura_iniciada.set()
+            liberar_leitura.wait(5)
+            ordem.append("leitor 1")
+    
+    def escritor():
+        with trava.escrita():
+            ordem.append("escritor")
+    
+    def segundo_leitor():
+        with trava.leitura():
+            ordem.append("leitor 2")
+    
+    threads = [threading.Thread(target=primeiro_leitor)]
+    threads[0].start()
+    leitura_iniciada.wait(5)
+    threads.append(threading.Thread(target=escritor))
+    threads[1].start()
+    while not trava._escritores_esperando:
+        threading.Event().wait(0.001)
+    # Com um escritor na fila, um leitor novo espera a vez dele
+    threads.append(threading.Thread(target=segundo_leitor))
+    threads[2].start()
+    threading.Event().wait(0.05)
+    assert ordem == []
+    liberar_leitura.set()
+    for thread in threads:
+        thread.join(5)
+    assert ordem == ["leitor 1", "escritor", "leitor 2"]
+
+
+def test_trava_reentrante_sem_promocao():
+    trava = TravaLeituraEscrita()
+    with trava.escrita():
+        with trava.leitura():
+            with trava.escrita():
+                pass
+    with trava.leitura():
+        with trava.leitura():
+            pass
+        with pytest.raises(RuntimeError):
+            with trava.escrita():
+                pass
+    # A tentativa recusada não deixa a trava presa
+    with trava.escrita():
+        pass
+
+
+def test_reservas_concorrentes_nao_se_sobrepoem(arquivo_dados):
+    gerenciador = GerenciadorDeReservas(arquivo_dados, gravacao_em_segundo_plano=True)
+    clientes = [Cliente(f"Cliente {i}", "1", f"c{i}@hotel") for i in range(4)]
+    for cliente in clientes:
+        gerenciador.adicionar_cliente(cliente)
+    erros = []
+    
+    def reservar(semente):
+        aleatorio = random.Random(semente)
+        try:
+            for _ in range(200):
+                dia = PRIMEIRO_DIA + aleatorio.randint(0, 30)
+                reserva = gerenciador.criar_reserva(aleatorio.choice(clientes).id, aleatorio.choice(QUARTOS),
+                                                    data(dia), data(dia + aleatorio.randint(1, 4)))
+                if reserva and aleatorio.random() < 0.2:
+                    gerenciador.cancelar_reserva(reserva.id)
+                gerenciador.painel()
+                gerenciador.listar_quartos_disponiveis(data(dia), data(dia + 2))
+        except Exception as e:
+            erros.append(e)
+    
+    threads = [threading.Thread(target=reservar, args=(semente,)) for semente in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    gerenciador.fechar()
+    
+    assert erros == []
+    for numero in QUARTOS:
+        estadias = sorted(gerenciador.estadias_do_quarto(numero, 0, 10 ** 7))
+        for (_, fim, _), (inicio, _, _) in zip(estadias, estadias[1:]):
+            assert inicio >= fim
+    assert estado(GerenciadorDeReservas(arquivo_dados)) == estado(gerenciador)
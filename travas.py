@@ -0,0 +1,95 @@
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, Optional
+
+# Controle de acesso concorrente ao GerenciadorDeReservas compartilhado entre sessões:
+# consultas podem rodar em paralelo, alterações rodam sozinhas.
+
+
+class TravaLeituraEscrita:
+    """Vários leitores ou um único escritor, com preferência para quem vai escrever
+    
+    A trava é reentrante na mesma thread: quem escreve pode ler e escrever de novo,
+    e quem lê pode ler de novo. Passar de leitura para escrita não é permitido.
+    """
+    
+    def __init__(self):
+        self._condicao = threading.Condition()
+        self._leitores = 0
+        self._escritores_esperando = 0
+        self._escritor: Optional[int] = None
+        self._profundidade_escrita = 0
+        self._local = threading.local()
+    
+    @contextmanager
+    def leitura(self) -> Iterator[None]:
+        leituras = getattr(self._local, "leituras", 0)
+        if leituras or self._escritor == threading.get_ident():
+            self._local.leituras = leituras + 1
+            try:
+                yield
+            finally:
+                self._local.leituras = leituras
+            return
+        
+        with self._condicao:
+            # Leitores novos esperam os escritores na fila, para que estes não fiquem sem vez
+            while self._escritor is not None or self._escritores_esperando:
+                self._condicao.wait()
+            self._leitores += 1
+        self._local.leituras = 1
+        try:
+            yield
+        finally:
+            self._local.leituras = 0
+            with self._condicao:
+                self._leitores -= 1
+                if not self._leitores:
+                    self._condicao.notify_all()
+    
+    @contextmanager
+    def escrita(self) -> Iterator[None]:
+        thread = threading.get_ident()
+        if self._escritor == thread:
+            self._profundidade_escrita += 1
+            try:
+                yield
+            finally:
+                self._profundidade_escrita -= 1
+            return
+        if getattr(self._local, "leituras", 0):
+            raise RuntimeError("Não é possível obter a trava de escrita durante uma leitura")
+        
+        with self._condicao:
+            self._escritores_esperando += 1
+            while self._escritor is not None or self._leitores:
+                self._condicao.wait()
+            self._escritores_esperando -= 1
+            self._escritor = thread
+            self._profundidade_escrita = 1
+        try:
+            yield
+        finally:
+            with self._condicao:
+                self._profundidade_escrita = 0
+                self._escritor = None
+                self._condicao.notify_all()
+
+
+def leitura(metodo: Callable) -> Callable:
+    """Executa o método com a trava de leitura do objeto (atributo _trava)"""
+    @wraps(metodo)
+    def com_trava(self, *args, **kwargs):
+        with self._trava.leitura():
+            return metodo(self, *args, **kwargs)
+    return com_trava
+
+
+def escrita(metodo: Callable) -> Callable:
+    """Executa o método com a trava de escrita do objeto (atributo _trava)"""
+    @wraps(metodo)
+    def com_trava(self, *args, **kwargs):
+        with self._trava.escrita():
+            return metodo(self, *args, **kwargs)
+    return com_trava